@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Script to rebuild child tables with ON DELETE CASCADE foreign keys.
+
+SQLite cannot change a foreign key in place, so each table is renamed, created
+again from the current model (with its indexes) and refilled from the old
+copy in one transaction.
+"""
+
+import sys
+import os
+from sqlalchemy import text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+from app.models.analysis_skill import AnalysisSkill
+from app.models.chat_history import InterviewMessage
+
+CASCADE_TABLES = [InterviewMessage.__table__, AnalysisSkill.__table__]
+
+def has_cascade(connection, table_name):
+    rows = connection.execute(text(f"PRAGMA foreign_key_list({table_name})")).all()
+    return any(row.on_delete == "CASCADE" for row in rows)
+
+def rebuild_table(connection, table):
+    old_name = f"{table.name}_old"
+    columns = ", ".join(c.name for c in table.columns)
+
+    # Index names are global in SQLite, so the old ones must go first
+    indexes = connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table AND sql IS NOT NULL"
+    ), {"table": table.name}).scalars().all()
+    for index in indexes:
+        connection.execute(text(f"DROP INDEX {index}"))
+
+    connection.execute(text(f"ALTER TABLE {table.name} RENAME TO {old_name}"))
+    table.create(connection)
+    connection.execute(text(f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {old_name}"))
+    connection.execute(text(f"DROP TABLE {old_name}"))
+
+def add_cascade_foreign_keys():
+    try:
+        with engine.connect() as connection:
+            # Checked again below; off while tables are swapped
+            connection.execute(text("PRAGMA foreign_keys=OFF"))
+            connection.commit()
+
+            tables = {row[0] for row in connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table'")
+            )}
+            for table in CASCADE_TABLES:
+                if table.name not in tables:
+                    print(f"✗ Table '{table.name}' does not exist, skipping")
+                    continue
+                if has_cascade(connection, table.name):
+                    print(f"✓ '{table.name}' already cascades")
+                    continue
+                print(f"\nRebuilding '{table.name}'...")
+                rebuild_table(connection, table)
+                connection.commit()
+                print(f"✓ '{table.name}' rebuilt with ON DELETE CASCADE")
+
+            # Rows written while enforcement was off may point at missing
+            # parents; report them rather than guessing what to do
+            problems = connection.execute(text("PRAGMA foreign_key_check")).all()
+            for row in problems:
+                print(f"  ! {row[0]} rowid {row[1]} references missing {row[2]}")
+            connection.execute(text("PRAGMA foreign_keys=ON"))
+        return True
+    except Exception as e:
+        print(f"✗ Error rebuilding tables: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding ON DELETE CASCADE Foreign Keys")
+    print("=" * 60)
+
+    if add_cascade_foreign_keys():
+        print("\n✓ Migration successful!")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
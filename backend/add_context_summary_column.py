@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Script to add the rolling context summary column to interview_sessions."""
+
+import sys
+import os
+from sqlalchemy import inspect, text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+
+def add_context_summary_column():
+    """Add context_summary to interview_sessions if it is missing."""
+
+    inspector = inspect(engine)
+
+    # Check if table exists
+    if 'interview_sessions' not in inspector.get_table_names():
+        print("✗ Table 'interview_sessions' does not exist")
+        return False
+
+    # Get existing columns
+    columns = [col['name'] for col in inspector.get_columns('interview_sessions')]
+    print(f"Existing columns: {columns}")
+
+    if 'context_summary' in columns:
+        print("✓ 'context_summary' column already exists")
+        return True
+
+    try:
+        with engine.connect() as connection:
+            print("\nAdding 'context_summary' column to interview_sessions...")
+            connection.execute(text(
+                "ALTER TABLE interview_sessions ADD COLUMN context_summary TEXT"
+            ))
+            connection.commit()
+        return True
+    except Exception as e:
+        print(f"✗ Error adding column: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding Context Summary Column to Interview Sessions")
+    print("=" * 60)
+
+    success = add_context_summary_column()
+
+    if success:
+        # Verify
+        inspector = inspect(engine)
+        columns = [col['name'] for col in inspector.get_columns('interview_sessions')]
+        if 'context_summary' in columns:
+            print("\n✓ Migration successful! Follow-ups can now use a rolling summary.")
+        else:
+            print("\n✗ Migration failed! Column not found.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Script to add documents.digest and build the digest of every stored text.
+
+Interview prompts use the digest instead of the full JD or resume. Rows
+without one fall back to the full text, so this can run after deploying.
+Pass --rebuild to recompute every digest, e.g. after changing
+SKILLIO_DIGEST_TOKEN_BUDGET.
+"""
+
+import sys
+import os
+from sqlalchemy import inspect, select, text, update
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+from app.models.document import Document
+from app.utils.ai.conversation_context import count_tokens
+from app.utils.document_digest import DIGEST_TOKEN_BUDGET, build_digest
+
+BATCH_SIZE = 500
+
+def add_document_digest_column(rebuild=False):
+    """Add the column if missing, then digest the documents that need it."""
+
+    inspector = inspect(engine)
+
+    # Check if table exists
+    if 'documents' not in inspector.get_table_names():
+        print("✗ Table 'documents' does not exist")
+        return False
+
+    columns = [col['name'] for col in inspector.get_columns('documents')]
+
+    try:
+        with engine.connect() as connection:
+            if 'digest' in columns:
+                print("✓ 'digest' column already exists")
+            else:
+                print("\nAdding 'digest' column to documents...")
+                connection.execute(text("ALTER TABLE documents ADD COLUMN digest TEXT"))
+            connection.commit()
+
+            digested = text_tokens = digest_tokens = 0
+            last_id = 0
+            while True:
+                query = select(Document.id, Document.content).where(Document.id > last_id)
+                if not rebuild:
+                    query = query.where(Document.digest.is_(None))
+                rows = connection.execute(query.order_by(Document.id).limit(BATCH_SIZE)).all()
+                if not rows:
+                    break
+                for document_id, content in rows:
+                    digest = build_digest(content)
+                    connection.execute(update(Document).where(Document.id == document_id).values(digest=digest))
+                    text_tokens += count_tokens(content)
+                    digest_tokens += count_tokens(digest)
+                    digested += 1
+                connection.commit()
+                last_id = rows[-1][0]
+
+            print(f"✓ Digested {digested} documents (budget {DIGEST_TOKEN_BUDGET} tokens)")
+            if digested:
+                print(f"✓ Prompt text: {text_tokens:,} -> {digest_tokens:,} tokens "
+                      f"({1 - digest_tokens / max(text_tokens, 1):.1%} fewer)")
+        return True
+    except Exception as e:
+        print(f"✗ Error building digests: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding Digests to Documents")
+    print("=" * 60)
+
+    if add_document_digest_column(rebuild="--rebuild" in sys.argv[1:]):
+        print("\n✓ Migration successful! Interview prompts now use document digests.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Script to add the per-session seq column to interview_messages."""
+
+import sys
+import os
+from sqlalchemy import inspect, text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+
+def add_message_seq_column():
+    """Add seq to interview_messages, backfill it and create the (session_id, seq) index."""
+
+    inspector = inspect(engine)
+
+    # Check if table exists
+    if 'interview_messages' not in inspector.get_table_names():
+        print("✗ Table 'interview_messages' does not exist")
+        return False
+
+    # Get existing columns
+    columns = [col['name'] for col in inspector.get_columns('interview_messages')]
+    print(f"Existing columns: {columns}")
+
+    try:
+        with engine.connect() as connection:
+            if 'seq' not in columns:
+                print("\nAdding 'seq' column to interview_messages...")
+                connection.execute(text(
+                    "ALTER TABLE interview_messages ADD COLUMN seq INTEGER"
+                ))
+            else:
+                print("✓ 'seq' column already exists, backfilling missing values")
+
+            # Number existing messages in their historical order. Ties on the
+            # one-second created_at are broken by id, which follows insert order.
+            result = connection.execute(text("""
+                UPDATE interview_messages
+                SET seq = (
+                    SELECT numbered.rn FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY session_id ORDER BY created_at, id
+                        ) AS rn
+                        FROM interview_messages
+                    ) AS numbered
+                    WHERE numbered.id = interview_messages.id
+                )
+                WHERE seq IS NULL
+            """))
+            print(f"✓ Backfilled seq for {result.rowcount} messages")
+
+            connection.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_interview_messages_session_seq "
+                "ON interview_messages (session_id, seq)"
+            ))
+            connection.commit()
+        print("✓ Index 'ix_interview_messages_session_seq' is in place")
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating interview_messages: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding Seq Column to Interview Messages")
+    print("=" * 60)
+
+    success = add_message_seq_column()
+
+    if success:
+        # Verify
+        inspector = inspect(engine)
+        columns = [col['name'] for col in inspector.get_columns('interview_messages')]
+        indexes = [idx['name'] for idx in inspector.get_indexes('interview_messages')]
+        print(f"\nUpdated columns: {columns}")
+        if 'seq' in columns and 'ix_interview_messages_session_seq' in indexes:
+            print("\n✓ Migration successful! Messages are now ordered by seq.")
+        else:
+            print("\n✗ Migration failed! Column or index not found.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
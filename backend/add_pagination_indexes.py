@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Script to add the user_id indexes used by the paginated list endpoints,
+and the resumes.file_path index the upload GC looks files up by."""
+
+import sys
+import os
+from sqlalchemy import inspect, text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+
+# SQLite secondary indexes carry the rowid, so (user_id) alone serves
+# "WHERE user_id = ? AND id < ? ORDER BY id DESC" without a sort step.
+INDEXES = {
+    "ix_resumes_user_id": ("resumes", "user_id"),
+    "ix_job_descriptions_user_id": ("job_descriptions", "user_id"),
+    "ix_analysis_history_user_id": ("analysis_history", "user_id"),
+    # One lookup per batch of files in app.utils.upload_gc
+    "ix_resumes_file_path": ("resumes", "file_path"),
+}
+
+def add_pagination_indexes():
+    """Create any missing user_id indexes."""
+
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+
+    try:
+        with engine.connect() as connection:
+            for index_name, (table, column) in INDEXES.items():
+                if table not in tables:
+                    print(f"✗ Table '{table}' does not exist, skipping")
+                    continue
+                existing = [idx['name'] for idx in inspector.get_indexes(table)]
+                if index_name in existing:
+                    print(f"✓ '{index_name}' already exists")
+                    continue
+                connection.execute(text(
+                    f"CREATE INDEX {index_name} ON {table} ({column})"
+                ))
+                print(f"✓ Created '{index_name}'")
+            connection.commit()
+        return True
+    except Exception as e:
+        print(f"✗ Error creating indexes: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding Pagination Indexes")
+    print("=" * 60)
+
+    if add_pagination_indexes():
+        print("\n✓ Migration successful!")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
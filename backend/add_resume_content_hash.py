@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Script to add resumes.content_sha256 and fill it from the stored files.
+
+Rows whose file is gone keep a NULL hash; they are simply never matched as
+duplicates by the bulk import.
+"""
+
+import sys
+import os
+from sqlalchemy import inspect, text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+from app.models.resume import Resume
+from app.utils.resume_import import file_sha256
+
+BATCH_SIZE = 500
+
+def add_resume_content_hash():
+    """Add the column and index if missing, then hash every file on disk."""
+
+    inspector = inspect(engine)
+
+    # Check if table exists
+    if 'resumes' not in inspector.get_table_names():
+        print("✗ Table 'resumes' does not exist")
+        return False
+
+    columns = [col['name'] for col in inspector.get_columns('resumes')]
+
+    try:
+        with engine.connect() as connection:
+            if 'content_sha256' in columns:
+                print("✓ 'content_sha256' column already exists")
+            else:
+                print("\nAdding 'content_sha256' column to resumes...")
+                connection.execute(text("ALTER TABLE resumes ADD COLUMN content_sha256 VARCHAR(64)"))
+            for index in Resume.__table__.indexes:
+                index.create(connection, checkfirst=True)
+            connection.commit()
+
+            hashed = missing = 0
+            last_id = 0
+            while True:
+                rows = connection.execute(text(
+                    "SELECT id, file_path FROM resumes "
+                    "WHERE content_sha256 IS NULL AND id > :last_id ORDER BY id LIMIT :limit"
+                ), {"last_id": last_id, "limit": BATCH_SIZE}).all()
+                if not rows:
+                    break
+                for resume_id, file_path in rows:
+                    if not os.path.exists(file_path):
+                        missing += 1
+                        continue
+                    connection.execute(
+                        text("UPDATE resumes SET content_sha256 = :digest WHERE id = :id"),
+                        {"digest": file_sha256(file_path), "id": resume_id}
+                    )
+                    hashed += 1
+                connection.commit()
+                last_id = rows[-1][0]
+
+            print(f"✓ Hashed {hashed} resume files")
+            if missing:
+                print(f"! {missing} resume rows point at missing files")
+        return True
+    except Exception as e:
+        print(f"✗ Error adding content hashes: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding Content Hashes to Resumes")
+    print("=" * 60)
+
+    if add_resume_content_hash():
+        print("\n✓ Migration successful! Bulk imports now skip duplicate files.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Script to add the cold-storage archive columns to interview_sessions."""
+
+import sys
+import os
+from sqlalchemy import inspect, text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+
+ARCHIVE_COLUMNS = {
+    "archived_at": "DATETIME",
+    "archive_segment": "VARCHAR(255)",
+    "archive_offset": "INTEGER",
+    "archived_message_count": "INTEGER",
+}
+
+def add_session_archive_columns():
+    """Add any missing archive column to interview_sessions."""
+
+    inspector = inspect(engine)
+
+    # Check if table exists
+    if 'interview_sessions' not in inspector.get_table_names():
+        print("✗ Table 'interview_sessions' does not exist")
+        return False
+
+    # Get existing columns
+    columns = [col['name'] for col in inspector.get_columns('interview_sessions')]
+    print(f"Existing columns: {columns}")
+
+    try:
+        with engine.connect() as connection:
+            for column, column_type in ARCHIVE_COLUMNS.items():
+                if column in columns:
+                    print(f"✓ '{column}' column already exists")
+                    continue
+                print(f"\nAdding '{column}' column to interview_sessions...")
+                connection.execute(text(
+                    f"ALTER TABLE interview_sessions ADD COLUMN {column} {column_type}"
+                ))
+            connection.commit()
+        return True
+    except Exception as e:
+        print(f"✗ Error adding columns: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Adding Archive Columns to Interview Sessions")
+    print("=" * 60)
+
+    success = add_session_archive_columns()
+
+    if success:
+        # Verify
+        inspector = inspect(engine)
+        columns = [col['name'] for col in inspector.get_columns('interview_sessions')]
+        print(f"\nUpdated columns: {columns}")
+        if all(c in columns for c in ARCHIVE_COLUMNS):
+            print("\n✓ Migration successful! Sessions can now be archived.")
+        else:
+            print("\n✗ Migration failed! Columns not found.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
@@ -1,8 +1,10 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # SQLite URL
 DATABASE_URL = "sqlite:///./skillio.db"
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./skillio.db"
 
 # Engine / session
 engine = create_engine(
@@ -16,11 +18,45 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine / session for read paths served from `async def` routes, so
+# they wait on the event loop instead of holding a threadpool slot. The pool
+# is sized above the default 5 + 10 so it is not the new bottleneck.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=20,
+    max_overflow=20
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers run alongside the writer; checkpoints are left to the
+    # maintenance scheduler. auto_vacuum only takes effect on a new file.
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # Needed for the ON DELETE CASCADE foreign keys; off by default in SQLite
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 # Base declarative so models can import it
 Base = declarative_base()
 
 # Import models after `Base` is defined so they register correctly
-from app.models import user, resume, analysis, interview, chat_history, job_description  # noqa: E402
+from app.models import user, resume, analysis, analysis_skill, interview, document, chat_history, job_description, user_stats, scheduler_lease, idempotency_key  # noqa: E402
 
 # Create tables
 Base.metadata.create_all(bind=engine)
@@ -1,9 +1,16 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.database import Base, engine
 from app.routes import auth, resume_api, analysis_api
-from app.routes import interview_api
+from app.routes import interview_api, export_api
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from fastapi.responses import PlainTextResponse
+from app.utils import metrics
+from app.utils.maintenance import MAINTENANCE_ENABLED, maintenance_loop
+from app.utils.resume_import import shutdown_pool
 
 
 
@@ -18,10 +25,20 @@ from app.routes import interview_api
 
 app = FastAPI(title="Skillio")
 
+_background_tasks = []
+
 # Create tables on startup
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
     Base.metadata.create_all(bind=engine)
+    if MAINTENANCE_ENABLED:
+        _background_tasks.append(asyncio.create_task(maintenance_loop()))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    for task in _background_tasks:
+        task.cancel()
+    shutdown_pool()
 
 # -----------------------------
 # CORS (Frontend access)
@@ -38,6 +55,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Retry-After comes with 409s for an Idempotency-Key still in progress
+    expose_headers=[NEXT_CURSOR_HEADER, "Retry-After"],
 )
 
 # -----------------------------
@@ -47,6 +66,10 @@ app.add_middleware(
 def root():
     return "Skillio backend running"
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # -----------------------------
 # ROUTERS
 # -----------------------------
@@ -54,6 +77,7 @@ app.include_router(auth.router, prefix="/auth", tags=["Auth"])
 app.include_router(resume_api.router, prefix="/resume", tags=["Resume"])
 app.include_router(analysis_api.router, prefix="/analysis", tags=["Analysis"])
 app.include_router(interview_api.router)
+app.include_router(export_api.router)
 
 import importlib
 try:
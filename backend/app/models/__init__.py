@@ -1,5 +1,10 @@
 from .user import User
 from .resume import Resume
 from .analysis import AnalysisHistory
+from .analysis_skill import Skill, AnalysisSkill
+from .document import Document
 from .chat_history import InterviewSession, InterviewMessage
 from .job_description import JobDescription
+from .user_stats import UserStats
+from .scheduler_lease import SchedulerLease
+from .idempotency_key import IdempotencyKey
@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -7,7 +8,7 @@ class AnalysisHistory(Base):
     __tablename__ = "analysis_history"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
     confidence_score = Column(Float)
     fit_level = Column(String)
@@ -17,6 +18,9 @@ class AnalysisHistory(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Normalized copy of matched_skills / missing_skills for grouped queries
+    skills = relationship("AnalysisSkill", cascade="all, delete-orphan", passive_deletes=True)
+
     def __repr__(self):
         return f"<AnalysisHistory user_id={self.user_id} score={self.confidence_score}>"
     
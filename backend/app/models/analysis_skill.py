@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.database import Base
+
+
+class Skill(Base):
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), unique=True, nullable=False)
+
+    def __repr__(self):
+        return f"<Skill(id={self.id}, name={self.name})>"
+
+
+class AnalysisSkill(Base):
+    """One skill of one analysis, either matched or missing."""
+
+    __tablename__ = "analysis_skill"
+
+    analysis_id = Column(Integer, ForeignKey("analysis_history.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+    status = Column(String(10), nullable=False)  # "matched" or "missing"
+
+    __table_args__ = (
+        # Serves "most often missing" style aggregates without touching analyses
+        Index("ix_analysis_skill_status_skill", "status", "skill_id"),
+    )
+
+    def __repr__(self):
+        return f"<AnalysisSkill(analysis_id={self.analysis_id}, skill_id={self.skill_id}, status={self.status})>"
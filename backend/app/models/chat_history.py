@@ -1,9 +1,11 @@
 """
 InterviewSession and InterviewMessage models for chat history.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, select
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.utils.compression import CompressedText
 
 
 class InterviewSession(Base):
@@ -16,14 +18,50 @@ class InterviewSession(Base):
     
     mode = Column(String(50), default="programming")  # "programming" or "hr"
     difficulty = Column(String(20), default="beginner")  # "beginner", "intermediate", "advanced"
-    job_description = Column(Text, nullable=False)
-    resume_text = Column(Text, default="")
+
+    # Texts live once in the documents table; see app.models.document
+    jd_document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    resume_document_id = Column(Integer, ForeignKey("documents.id"), nullable=True, index=True)
     
     title = Column(String(255), default="New Interview")
+
+    # Rolling summary of the turns before the latest exchange, fed to
+    # follow-up prompts; see app.utils.ai.conversation_context
+    context_summary = Column(Text, nullable=True)
+
+    # Set while the transcript lives in a cold-storage segment instead of
+    # interview_messages; see app.utils.archiver
+    archived_at = Column(DateTime(timezone=True), nullable=True)
+    archive_segment = Column(String(255), nullable=True)
+    archive_offset = Column(Integer, nullable=True)
+    archived_message_count = Column(Integer, nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    jd_document = relationship("Document", foreign_keys=[jd_document_id])
+    resume_document = relationship("Document", foreign_keys=[resume_document_id])
+
+    @property
+    def job_description(self) -> str:
+        return self.jd_document.content
+
+    @property
+    def resume_text(self) -> str:
+        return self.resume_document.content if self.resume_document else ""
+
+    # Compact forms for prompts, falling back to the full text on rows that
+    # have no digest yet
+    @property
+    def jd_digest(self) -> str:
+        return self.jd_document.digest or self.jd_document.content
+
+    @property
+    def resume_digest(self) -> str:
+        if not self.resume_document:
+            return ""
+        return self.resume_document.digest or self.resume_document.content
+
     def __repr__(self):
         return f"<InterviewSession(id={self.id}, user_id={self.user_id}, type={self.interview_type})>"
 
@@ -34,12 +72,34 @@ class InterviewMessage(Base):
     __tablename__ = "interview_messages"
 
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True)
+    session_id = Column(Integer, ForeignKey("interview_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
     
+    # Per-session position, 1-based. created_at only has one-second resolution
+    # in SQLite, so ordering and range reads always go through seq.
+    seq = Column(Integer, nullable=False)
+
     role = Column(String(10), nullable=False)  # "user" or "ai"
-    content = Column(Text, nullable=False)
+    content = Column(CompressedText, nullable=False)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
+    __table_args__ = (
+        Index("ix_interview_messages_session_seq", "session_id", "seq", unique=True),
+    )
+
     def __repr__(self):
-        return f"<InterviewMessage(id={self.id}, session_id={self.session_id}, role={self.role})>"
+        return f"<InterviewMessage(id={self.id}, session_id={self.session_id}, seq={self.seq}, role={self.role})>"
+
+
+def next_message_seq(session_id: int):
+    """SQL expression yielding the next seq for a session.
+
+    Assign it to ``InterviewMessage.seq`` so the value is computed inside the
+    INSERT statement itself; the unique (session_id, seq) index rejects any
+    concurrent writer that raced for the same slot.
+    """
+    return (
+        select(func.coalesce(func.max(InterviewMessage.seq), 0) + 1)
+        .where(InterviewMessage.session_id == session_id)
+        .scalar_subquery()
+    )
@@ -0,0 +1,94 @@
+"""
+Content-addressed text blobs shared by interview sessions.
+
+Sessions started against the same JD or resume point at one row instead of
+each carrying its own copy. Rows are immutable and keyed by the SHA-256 of
+their text, so identical content always resolves to the same id.
+
+Rows nobody references any more are deleted with the last session that
+used them (``delete_orphan_documents``), plus a daily sweep for any left
+behind by other write paths.
+
+Each row also carries a compact digest of its text, built once on insert,
+which interview prompts use in place of the full text; see
+app.utils.document_digest.
+"""
+import hashlib
+
+from typing import Iterable
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, delete, select, update
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql import func
+from app.database import Base
+from app.models.chat_history import InterviewSession
+from app.utils.compression import CompressedText
+from app.utils.document_digest import build_digest
+
+
+class Document(Base):
+    __tablename__ = "documents"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), nullable=False, unique=True)
+    # Only loaded when the full text is needed; prompts read the digest
+    content = deferred(Column(CompressedText, nullable=False))
+    # NULL on rows stored before digests existed; see add_document_digest_column.py
+    digest = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Document(id={self.id}, sha256={self.sha256[:12]})>"
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_or_create_document(db, text: str | None) -> int | None:
+    """Return the id of the blob holding ``text``, storing it on first use.
+
+    The digest is only built when the row is new. ``None`` maps to ``None``
+    so optional documents need no row at all. Works with a Session or a
+    Connection; the caller commits.
+    """
+    if text is None:
+        return None
+    sha256 = content_hash(text)
+    document_id = db.scalar(select(Document.id).where(Document.sha256 == sha256))
+    if document_id is not None:
+        # A no-op write takes the write lock, so an orphan sweep cannot delete
+        # the row before the caller's session references it and commits
+        claimed = db.execute(
+            update(Document).where(Document.id == document_id).values(sha256=Document.sha256)
+        ).rowcount
+        if claimed:
+            return document_id
+    db.execute(
+        sqlite_insert(Document)
+        .values(sha256=sha256, content=text, digest=build_digest(text))
+        .on_conflict_do_nothing(index_elements=["sha256"])
+    )
+    return db.scalar(select(Document.id).where(Document.sha256 == sha256))
+
+
+def delete_orphan_documents(db, ids: Iterable[int | None] | None = None) -> int:
+    """Delete documents no session references, only among ``ids`` if given.
+
+    Works with a Session or a Connection; the caller commits. Returns the
+    number of rows deleted.
+    """
+    statement = delete(Document).where(
+        Document.id.not_in(select(InterviewSession.jd_document_id)),
+        Document.id.not_in(
+            select(InterviewSession.resume_document_id)
+            .where(InterviewSession.resume_document_id.is_not(None))
+        ),
+    )
+    if ids is not None:
+        ids = {document_id for document_id in ids if document_id is not None}
+        if not ids:
+            return 0
+        statement = statement.where(Document.id.in_(ids))
+    return db.execute(statement).rowcount
@@ -1,16 +1,18 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.database import Base
+from app.utils.compression import CompressedText
 
 
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(String, nullable=True)  # Job title
     filename = Column(String, nullable=False)  # Original filename if uploaded
-    content = Column(Text, nullable=False)  # Full JD text
+    content = deferred(Column(CompressedText, nullable=False))  # Full JD text
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
@@ -1,16 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.database import Base
+from app.utils.compression import CompressedText
 
 
 class Resume(Base):
     __tablename__ = "resumes"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     filename = Column(String, nullable=False)
-    file_path = Column(String, nullable=False)
-    extracted_text = Column(Text, nullable=False)
+    file_path = Column(String, nullable=False, index=True)
+    # sha256 of the uploaded bytes, used to skip re-imports of the same file
+    content_sha256 = Column(String(64), nullable=True, index=True)
+    extracted_text = deferred(Column(CompressedText, nullable=False))
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
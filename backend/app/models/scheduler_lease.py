@@ -0,0 +1,27 @@
+"""
+Named leases used to elect one worker for background jobs, and when each
+job last ran, so a new leader carries on the schedule.
+"""
+from sqlalchemy import Column, String, Float
+from app.database import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(255), nullable=False)
+    expires_at = Column(Float, nullable=False)  # Unix time
+
+    def __repr__(self):
+        return f"<SchedulerLease(name={self.name}, holder={self.holder})>"
+
+
+class MaintenanceRun(Base):
+    __tablename__ = "maintenance_runs"
+
+    name = Column(String(50), primary_key=True)
+    last_run = Column(Float, nullable=False)  # Unix time
+
+    def __repr__(self):
+        return f"<MaintenanceRun(name={self.name}, last_run={self.last_run})>"
@@ -0,0 +1,84 @@
+"""
+Per-user counters behind the dashboard, kept in step with the source tables.
+
+Mapper events bump the counters on the same connection as the INSERT or
+DELETE they mirror, so they commit or roll back together. Set-based deletes
+(``query.delete()``) skip mapper events and must call ``bump_user_stats``
+themselves. A user's first bump seeds the row from a full recount, and
+``app.utils.stats_reconciler`` repairs anything that drifts later.
+"""
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, event, select, update
+from sqlalchemy.sql import func
+from app.database import Base
+from app.models.analysis import AnalysisHistory
+from app.models.chat_history import InterviewSession, InterviewMessage
+from app.models.job_description import JobDescription
+from app.models.resume import Resume
+
+
+class UserStats(Base):
+    __tablename__ = "user_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+
+    analyses = Column(Integer, nullable=False, default=0)
+    interview_sessions = Column(Integer, nullable=False, default=0)
+    interview_messages = Column(Integer, nullable=False, default=0)
+    resumes = Column(Integer, nullable=False, default=0)
+    job_descriptions = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<UserStats(user_id={self.user_id})>"
+
+
+COUNTER_COLUMNS = ("analyses", "interview_sessions", "interview_messages", "resumes", "job_descriptions")
+
+
+def bump_user_stats(connection, user_id, **deltas) -> None:
+    """Add ``deltas`` to a user's counters, seeding the row on first use.
+
+    Call after the write the deltas describe. A user without a row yet may
+    have rows from before the table existed, so the first bump recounts the
+    user from the source tables (which already include that write) instead
+    of starting from zero.
+    """
+    deltas = {k: v for k, v in deltas.items() if v}
+    if user_id is None or not deltas:
+        return
+    result = connection.execute(
+        update(UserStats)
+        .where(UserStats.user_id == user_id)
+        .values(**{k: getattr(UserStats, k) + v for k, v in deltas.items()}, updated_at=func.now())
+    )
+    if result.rowcount == 0:
+        from app.utils.stats_reconciler import reconcile_user_stats
+        reconcile_user_stats(connection, [user_id])
+
+
+def _track(model, column: str, user_id_of):
+    @event.listens_for(model, "after_insert")
+    def _on_insert(mapper, connection, target):
+        bump_user_stats(connection, user_id_of(connection, target), **{column: 1})
+
+    @event.listens_for(model, "after_delete")
+    def _on_delete(mapper, connection, target):
+        bump_user_stats(connection, user_id_of(connection, target), **{column: -1})
+
+
+def _owner(connection, target):
+    return target.user_id
+
+
+def _session_owner(connection, message):
+    return connection.scalar(
+        select(InterviewSession.user_id).where(InterviewSession.id == message.session_id)
+    )
+
+
+_track(AnalysisHistory, "analyses", _owner)
+_track(InterviewSession, "interview_sessions", _owner)
+_track(InterviewMessage, "interview_messages", _session_owner)
+_track(Resume, "resumes", _owner)
+_track(JobDescription, "job_descriptions", _owner)
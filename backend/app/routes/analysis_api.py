@@ -1,16 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, Security, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 from pydantic import BaseModel
 
-from app.database import SessionLocal
-from app.models.user import User
+from app.database import SessionLocal, get_async_db
 from app.models.resume import Resume
 from app.models.analysis import AnalysisHistory
 from app.models.job_description import JobDescription
-from app.utils.security import get_current_user
+from app.models.user_stats import bump_user_stats
+from app.utils.security import CurrentUser
+from app.utils.bulk_delete import BulkDeleteRequest, bulk_filters
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    clamp_limit,
+    keyset_page,
+    split_page,
+)
 from app.utils.skill_analyzer import analyze_skill_gap
+from app.utils.near_dup import NearDuplicateCache, signature
+from app.utils.ai.response_cache import record_lookup
 from app.utils.analysis_explainer import generate_explanation
 from app.utils.ats_analyzer import analyze_ats
+from app.utils.analysis_skills import (
+    MATCHED,
+    MISSING,
+    format_skill_frequency,
+    record_analysis_skills,
+    skill_frequency_query,
+)
 from app.utils.resume_improver import improve_resume
 
 
@@ -21,13 +40,18 @@ class SkillGapRequest(BaseModel):
 
 # Optional AI import
 try:
-    from app.utils.ai.jd_intelligence import analyze_job_description
+    from app.utils.ai.jd_intelligence import AI_UNAVAILABLE, analyze_job_description
     AI_ENABLED = True
 except Exception:
     AI_ENABLED = False
 
 router = APIRouter(tags=["Analysis"])
 
+# AI JD enrichment for near-identical JDs, shared across users. Only the JD
+# goes in the key: the rule-based analysis of the resume is cheap and always
+# runs, so a one-skill resume edit is never answered from the cache
+jd_enrichment_cache = NearDuplicateCache()
+
 
 # -----------------------------
 # Database Dependency
@@ -46,14 +70,9 @@ def get_db():
 @router.post("/skill-gap")
 def run_skill_gap_analysis(
     request: SkillGapRequest,
-    email: str = Security(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db)
 ):
-    # Fetch user
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Get job description from ID or direct text
     if request.job_description_id:
         jd = db.query(JobDescription).filter(
@@ -90,10 +109,25 @@ def run_skill_gap_analysis(
     # Optional AI JD enrichment
     jd_context = job_description
     if AI_ENABLED:
-        try:
-            jd_context = analyze_job_description(job_description)
-        except Exception as e:
-            print(f">>> JD AI FAILED: {e}")
+        fields = {"jd": job_description}
+        fields_sig = signature(fields)
+        cached = jd_enrichment_cache.find("jd_enrichment", fields, fields_sig)
+        if cached is None:
+            record_lookup("jd_enrichment", "miss")
+            try:
+                enriched = analyze_job_description(job_description)
+                # A failed call comes back as an error message, not an
+                # exception; analyse the raw JD and cache nothing
+                if isinstance(enriched, str) and enriched.startswith(AI_UNAVAILABLE):
+                    print(f">>> JD AI FAILED: {enriched}")
+                else:
+                    jd_context = enriched
+                    jd_enrichment_cache.add("jd_enrichment", fields, jd_context, fields_sig)
+            except Exception as e:
+                print(f">>> JD AI FAILED: {e}")
+        else:
+            record_lookup("jd_enrichment", "hit" if cached[1] == 1.0 else "near_hit")
+            jd_context = cached[0]
 
     # Run rule-based skill analysis
     skill_result = analyze_skill_gap(
@@ -115,6 +149,13 @@ def run_skill_gap_analysis(
         )
 
         db.add(analysis_record)
+        db.flush()
+        record_analysis_skills(
+            db,
+            analysis_record.id,
+            matched=skill_result["skills"].get("matched_skills", []),
+            missing=skill_result["skills"].get("missing_skills", [])
+        )
         db.commit()
         print(f">>> ANALYSIS SAVED FOR USER {user.id} <<<")
 
@@ -136,18 +177,19 @@ def run_skill_gap_analysis(
 # Get Resumes List
 # -----------------------------
 @router.get("/resumes")
-def get_resumes_list(
-    email: str = Security(get_current_user),
-    db: Session = Depends(get_db)
+async def get_resumes_list(
+    user: CurrentUser,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get list of user's resumes for selection in analysis"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    resumes = db.query(Resume).filter(
+    """Get a page of the user's resumes for selection in analysis"""
+    limit = clamp_limit(limit)
+    stmt = select(Resume).where(
         Resume.user_id == user.id
-    ).order_by(Resume.uploaded_at.desc()).all()
+    ).options(load_only(Resume.id, Resume.filename, Resume.uploaded_at))
+    rows = (await db.scalars(keyset_page(stmt, Resume.id, cursor, limit))).all()
+    resumes, next_cursor = split_page(rows, limit)
     
     return {
         "resumes": [
@@ -157,7 +199,8 @@ def get_resumes_list(
                 "uploaded_at": r.uploaded_at.isoformat() if r.uploaded_at else None
             }
             for r in resumes
-        ]
+        ],
+        "next_cursor": next_cursor
     }
 
 
@@ -165,18 +208,19 @@ def get_resumes_list(
 # Get Job Descriptions List
 # -----------------------------
 @router.get("/job-descriptions")
-def get_job_descriptions_list(
-    email: str = Security(get_current_user),
-    db: Session = Depends(get_db)
+async def get_job_descriptions_list(
+    user: CurrentUser,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get list of user's job descriptions for selection in analysis"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    jds = db.query(JobDescription).filter(
+    """Get a page of the user's job descriptions for selection in analysis"""
+    limit = clamp_limit(limit)
+    stmt = select(JobDescription).where(
         JobDescription.user_id == user.id
-    ).order_by(JobDescription.uploaded_at.desc()).all()
+    ).options(load_only(JobDescription.id, JobDescription.title, JobDescription.uploaded_at))
+    rows = (await db.scalars(keyset_page(stmt, JobDescription.id, cursor, limit))).all()
+    jds, next_cursor = split_page(rows, limit)
     
     return {
         "job_descriptions": [
@@ -186,7 +230,8 @@ def get_job_descriptions_list(
                 "uploaded_at": jd.uploaded_at.isoformat() if jd.uploaded_at else None
             }
             for jd in jds
-        ]
+        ],
+        "next_cursor": next_cursor
     }
 
 
@@ -194,20 +239,20 @@ def get_job_descriptions_list(
 # Get Analysis History
 # -----------------------------
 @router.get("/history")
-def get_analysis_history(
-    email: str = Security(get_current_user),
-    db: Session = Depends(get_db)
+async def get_analysis_history(
+    response: Response,
+    user: CurrentUser,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    records = (
-        db.query(AnalysisHistory)
-        .filter(AnalysisHistory.user_id == user.id)
-        .order_by(AnalysisHistory.created_at.desc())
-        .all()
-    )
+    """Get a page of analysis history; the next cursor is sent in X-Next-Cursor."""
+    limit = clamp_limit(limit)
+    stmt = select(AnalysisHistory).where(AnalysisHistory.user_id == user.id)
+    rows = (await db.scalars(keyset_page(stmt, AnalysisHistory.id, cursor, limit))).all()
+    records, next_cursor = split_page(rows, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
     return [
         {
@@ -222,13 +267,35 @@ def get_analysis_history(
     ]
 
 
+# -----------------------------
+# Skill Aggregates
+# -----------------------------
+@router.get("/skills/top")
+async def get_top_skills(
+    user: CurrentUser,
+    status: str = Query(MISSING, pattern=f"^({MATCHED}|{MISSING})$"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """The current user's most frequent matched or missing skills, grouped in SQL."""
+    stmt, total_stmt = skill_frequency_query(status, user_id=user.id, limit=limit)
+    total = await db.scalar(total_stmt) or 0
+    rows = (await db.execute(stmt)).all()
+
+    return {
+        "status": status,
+        "analyses": total,
+        "skills": format_skill_frequency(rows, total)
+    }
+
+
 # -----------------------------
 # Delete Analysis Record
 # -----------------------------
 @router.delete("/history/{analysis_id}")
 def delete_analysis(
     analysis_id: int,
-    email: str = Security(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Delete an analysis record.
@@ -236,10 +303,6 @@ def delete_analysis(
     Verifies analysis belongs to logged-in user before deleting.
     """
     try:
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
         # Verify analysis belongs to user
         analysis = db.query(AnalysisHistory).filter(
             AnalysisHistory.id == analysis_id,
@@ -262,13 +325,40 @@ def delete_analysis(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/history/bulk-delete")
+def bulk_delete_analyses(
+    request: BulkDeleteRequest,
+    user: CurrentUser,
+    db: Session = Depends(get_db)
+):
+    """Delete many analysis records in one statement.
+
+    Their analysis_skill rows go with them through ON DELETE CASCADE.
+    """
+    filters = bulk_filters(request, AnalysisHistory.id, AnalysisHistory.created_at)
+    try:
+        deleted = db.execute(
+            delete(AnalysisHistory)
+            .where(AnalysisHistory.user_id == user.id, *filters)
+            .returning(AnalysisHistory.id)
+        ).scalars().all()
+        bump_user_stats(db.connection(), user.id, analyses=-len(deleted))
+        db.commit()
+        
+        return {"deleted": len(deleted), "ids": deleted}
+    
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # -----------------------------
 # ATS Score Simulation
 # -----------------------------
 @router.post("/ats-score")
 def calculate_ats_score(
+    user: CurrentUser,
     job_description: str = Query(...),
-    email: str = Security(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -279,11 +369,6 @@ def calculate_ats_score(
         if not job_description:
             raise HTTPException(status_code=400, detail="Job description is required")
         
-        # Fetch user
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
         # Get latest resume
         resume = db.query(Resume).filter(
             Resume.user_id == user.id
@@ -353,8 +438,8 @@ def _format_ats_result_text(result: dict) -> str:
 # -----------------------------
 @router.post("/resume-improvement")
 def analyze_resume_improvement(
+    user: CurrentUser,
     job_description: str = Query(...),
-    email: str = Security(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -365,11 +450,6 @@ def analyze_resume_improvement(
         if not job_description:
             raise HTTPException(status_code=400, detail="Job description is required")
         
-        # Fetch user
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
         # Get latest resume
         resume = db.query(Resume).filter(
             Resume.user_id == user.id
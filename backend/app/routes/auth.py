@@ -1,18 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, Security
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
-from app.database import SessionLocal, engine, Base
+from app.database import SessionLocal, engine, Base, get_async_db
 from app.models.user import User
-from app.models.analysis import AnalysisHistory
-from app.models.interview import InterviewHistory
-from app.models.resume import Resume
+from app.models.user_stats import UserStats
+from app.utils.stats_reconciler import reconcile_user_stats
 from app.utils.security import (
     hash_password,
     verify_password,
     create_access_token,
-    get_current_user,
+    CurrentUser,
 )
 
 # ------------------------
@@ -70,7 +73,7 @@ def login(
     if not user or not verify_password(form_data.password, user.password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    access_token = create_access_token({"sub": user.email})
+    access_token = create_access_token({"sub": user.email, "uid": user.id})
 
     return {
         "access_token": access_token,
@@ -78,15 +81,7 @@ def login(
     }
 
 @router.get("/me", tags=["Auth"])
-def get_me(
-    email: str = Security(get_current_user),
-    db: Session = Depends(get_db),
-):
-    user = db.query(User).filter(User.email == email).first()
-
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
+def get_me(user: CurrentUser):
     return {
         "id": user.id,
         "name": user.name,
@@ -94,33 +89,37 @@ def get_me(
     }
 
 @router.get("/dashboard/stats", tags=["Auth"])
-def get_dashboard_stats(
-    email: str = Security(get_current_user),
-    db: Session = Depends(get_db),
+async def get_dashboard_stats(
+    user: CurrentUser,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get dashboard statistics for the current user"""
-    user = db.query(User).filter(User.email == email).first()
-
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Count skills analyzed
-    skills_analyzed = db.query(AnalysisHistory).filter(
-        AnalysisHistory.user_id == user.id
-    ).count()
-
-    # Count interviews taken
-    interviews_taken = db.query(InterviewHistory).filter(
-        InterviewHistory.user_id == user.id
-    ).count()
+    """Get dashboard statistics for the current user.
+
+    Reads the single materialized user_stats row. A user without one yet
+    (e.g. created before the table existed) is counted once and stored.
+    """
+    stats = await db.get(UserStats, user.id)
+    if stats is None:
+        await db.run_sync(lambda sync_db: reconcile_user_stats(sync_db, [user.id]))
+        await db.commit()
+        stats = await db.get(UserStats, user.id)
+
+    body = {
+        "skills_analyzed": stats.analyses,
+        "interviews_taken": stats.interview_sessions,
+        "resumes_scanned": stats.resumes,
+        "job_descriptions": stats.job_descriptions,
+        "interview_messages": stats.interview_messages,
+    }
 
-    # Count resumes scanned
-    resumes_scanned = db.query(Resume).filter(
-        Resume.user_id == user.id
-    ).count()
+    etag = '"' + hashlib.sha1(repr(sorted(body.items())).encode()).hexdigest()[:16] + '"'
+    # Revalidated on every load, so counters reflect the user's own writes at
+    # once; an unchanged body costs a 304
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
 
-    return {
-        "skills_analyzed": skills_analyzed,
-        "interviews_taken": interviews_taken,
-        "resumes_scanned": resumes_scanned,
-    }
+    response.headers.update(headers)
+    return body
@@ -0,0 +1,66 @@
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.utils.export import EXPORT_KINDS, decode_export_cursor, stream_export
+from app.utils.security import CurrentUser
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+# -----------------------------
+# Export User Data
+# -----------------------------
+@router.get("")
+def export_user_data(
+    user: CurrentUser,
+    request: Request,
+    fmt: str = Query("ndjson", alias="format"),
+    kinds: str | None = Query(None, description="Comma-separated subset of the export kinds"),
+    cursor: str | None = Query(None, description="Cursor of the last record received, to resume"),
+):
+    """
+    Stream the user's analyses, resumes, job descriptions, sessions and
+    transcript messages.
+
+    NDJSON lines are ``{"type", "cursor", "data"}``; CSV exports one kind at a
+    time with a trailing ``cursor`` column. The body is gzipped when the
+    client sends ``Accept-Encoding: gzip``.
+    """
+    if fmt not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'csv'")
+
+    selected = EXPORT_KINDS
+    if kinds:
+        requested = {k.strip() for k in kinds.split(",") if k.strip()}
+        unknown = requested - set(EXPORT_KINDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown export kinds: {', '.join(sorted(unknown))}")
+        selected = [k for k in EXPORT_KINDS if k in requested]
+    if fmt == "csv" and len(selected) != 1:
+        raise HTTPException(status_code=400, detail="CSV export needs exactly one kind")
+
+    # Validated here: once streaming has started an error can no longer
+    # become a 400
+    start = decode_export_cursor(cursor)
+    if start is not None and start[0] not in selected:
+        raise HTTPException(status_code=400, detail="Cursor does not belong to the requested kinds")
+
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    filename = f"skillio-export.{fmt}" if fmt == "ndjson" else f"skillio-{selected[0]}.csv"
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        stream_export(user.id, selected, start, fmt, compress),
+        media_type=MEDIA_TYPES[fmt],
+        headers=headers,
+    )
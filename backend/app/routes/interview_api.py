@@ -1,23 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
-from sqlalchemy.orm import Session
+import os
+from functools import partial
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Response, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 from pydantic import BaseModel
 from datetime import datetime
 
-from app.database import SessionLocal
-from app.models.user import User
-from app.models.chat_history import InterviewSession, InterviewMessage
-from app.utils.security import get_current_user
-from app.utils.ai.interview_engine import generate_question
-from app.utils.ai.hr_interview_engine import generate_hr_question
+from app.database import SessionLocal, get_async_db
+from app.models.chat_history import InterviewSession, InterviewMessage, next_message_seq
+from app.models.document import delete_orphan_documents, get_or_create_document
+from app.models.user_stats import bump_user_stats
+from app.utils.archiver import mark_segment_dirty, rehydrate_session, rehydrate_session_async
+from app.utils.bulk_delete import BulkDeleteRequest, bulk_filters
+from app.utils.document_digest import build_digest
+from app.utils import metrics
+from app.utils.idempotency import claim_key, release_key, request_hash, store_response
+from app.utils.mock_interview_generator import generate_fallback_question
+from app.utils.security import CurrentUser
+from app.utils.sse import SSE_HEADERS, relay, sse_event
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    clamp_limit,
+    keyset_page,
+    split_page,
+)
+from app.utils.ai.interview_engine import generate_question, stream_question
+from app.utils.ai.hr_interview_engine import generate_hr_question, stream_hr_question
+from app.utils.ai.conversation_context import update_summary
+from app.utils.ai.llm_provider import is_unavailable, llm_deadline, require_llm
 
 router = APIRouter(prefix="/interview", tags=["AI Interview"])
 
+# Longest an interview reply waits on the LLM before a template question is
+# served instead
+INTERVIEW_LLM_BUDGET_SECONDS = float(os.getenv("SKILLIO_INTERVIEW_LLM_BUDGET_SECONDS", "8"))
+
+llm_fallbacks = metrics.counter(
+    "skillio_interview_fallbacks_total", "Interview replies served from local templates because the LLM was unavailable"
+)
+
 
 # ==================
 # Pydantic Models
 # ==================
 class MessageResponse(BaseModel):
     id: int
+    seq: int
     role: str
     content: str
     created_at: datetime
@@ -63,12 +98,26 @@ def get_db():
         db.close()
 
 
-def get_user_id(email: str, db: Session) -> int:
-    """Get user_id from email."""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return user.id
+def add_message(db: Session, session_id: int, role: str, content: str) -> InterviewMessage:
+    """Stage a message at the next seq position of its session."""
+    message = InterviewMessage(
+        session_id=session_id,
+        seq=next_message_seq(session_id),
+        role=role,
+        content=content
+    )
+    db.add(message)
+    return message
+
+
+def serialize_message(msg: InterviewMessage) -> dict:
+    return {
+        "id": msg.id,
+        "seq": msg.seq,
+        "role": msg.role,
+        "content": msg.content,
+        "created_at": msg.created_at
+    }
 
 
 def get_interview_response(
@@ -90,23 +139,199 @@ def get_interview_response(
     
     if session.mode.lower() == "hr":
         response = generate_hr_question(
-            job_description=session.job_description,
+            job_description=session.jd_digest,
             level=session.difficulty,
             previous_question=last_ai_question,
             user_answer=user_message,
-            resume_text=session.resume_text
+            resume_text=session.resume_digest,
+            summary=session.context_summary or ""
         )
     else:
         response = generate_question(
-            job_description=session.job_description,
+            job_description=session.jd_digest,
             level=session.difficulty,
             previous_question=last_ai_question,
-            user_answer=user_message
+            user_answer=user_message,
+            summary=session.context_summary or ""
         )
     
     return response
 
 
+def generate_within_budget(generate: Callable[[], str], fallback: Callable[[], str], endpoint: str) -> tuple:
+    """``(text, is_fallback)``: ``generate()`` within the interview LLM budget.
+
+    If the provider is down, slow or the circuit breaker is open, a local
+    template question from ``fallback()`` is returned instead. Other errors
+    (e.g. no API key configured) are raised as before.
+    """
+    try:
+        with llm_deadline(INTERVIEW_LLM_BUDGET_SECONDS):
+            return generate(), False
+    except Exception as e:
+        if not is_unavailable(e):
+            raise
+        print(f">>> LLM UNAVAILABLE, SERVING FALLBACK QUESTION: {e}")
+        llm_fallbacks.inc(endpoint=endpoint)
+        return fallback(), True
+
+
+def session_fallback_question(db: Session, session: InterviewSession) -> str:
+    """A template question for ``session`` that it has not been asked yet."""
+    asked = db.scalars(select(InterviewMessage.content).where(
+        InterviewMessage.session_id == session.id,
+        InterviewMessage.role == "ai"
+    )).all()
+    return generate_fallback_question(
+        session.resume_text,
+        session.job_description,
+        mode=session.mode,
+        level=session.difficulty,
+        asked=asked
+    )
+
+
+def interview_stream_factory(mode: str, **kwargs) -> Callable:
+    """Deferred streaming counterpart of the generate_* calls, for ``relay``.
+
+    It runs in another thread after the request's DB session is gone, so
+    every argument must be a plain value, never an ORM object.
+    """
+    if mode.lower() == "hr":
+        return partial(stream_hr_question, **kwargs)
+    kwargs.pop("resume_text", None)
+    return partial(stream_question, **kwargs)
+
+
+def add_started_session(db: Session, user_id: int, request: ChatStartRequest, question: str) -> int:
+    """Stage a new session, its documents and its opening question; returns the session id.
+
+    Called once the question exists, so nothing is written (and no write
+    lock held) while the LLM runs. The caller commits.
+    """
+    session = InterviewSession(
+        user_id=user_id,
+        mode=request.mode,
+        difficulty=request.difficulty,
+        jd_document_id=get_or_create_document(db, request.job_description),
+        resume_document_id=get_or_create_document(db, request.resume_text or None),
+        title=request.title
+    )
+    db.add(session)
+    db.flush()
+    add_message(db, session.id, "ai", question)
+    return session.id
+
+
+def save_started_session(user_id: int, request: ChatStartRequest, question: str) -> dict:
+    """Create a session with its opening question in one transaction."""
+    db = SessionLocal()
+    try:
+        session_id = add_started_session(db, user_id, request, question)
+        db.commit()
+        return {
+            "session_id": session_id,
+            "opening_question": question,
+            "mode": request.mode,
+            "difficulty": request.difficulty
+        }
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def save_exchange(session_id: int, previous_question: str, user_text: str, ai_text: str) -> dict:
+    """Store a user message and the AI reply to it in one transaction."""
+    db = SessionLocal()
+    try:
+        if previous_question:
+            session = db.get(InterviewSession, session_id)
+            session.context_summary = update_summary(session.context_summary, previous_question, user_text)
+        user_msg = add_message(db, session_id, "user", user_text)
+        # Flushed first so the reply's seq subquery sees it
+        db.flush()
+        ai_msg = add_message(db, session_id, "ai", ai_text)
+        db.commit()
+        db.refresh(ai_msg)
+        return {
+            "user_seq": user_msg.seq,
+            "seq": ai_msg.seq,
+            "role": ai_msg.role,
+            "content": ai_msg.content,
+            "created_at": ai_msg.created_at
+        }
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def stream_reply(make_iterator: Callable, save: Callable[[str], dict]) -> AsyncIterator[str]:
+    """SSE body: a ``token`` event per piece, then ``done`` once ``save`` stored the text.
+
+    Failures end the stream with an ``error`` event. If the client goes away
+    first, the upstream completion is closed and nothing is saved.
+    """
+    parts = []
+    try:
+        async for delta in relay(make_iterator):
+            parts.append(delta)
+            yield sse_event({"delta": delta}, "token")
+        text = "".join(parts).strip()
+        if not text:
+            raise RuntimeError("AI returned an empty response")
+        result = await run_in_threadpool(save, text)
+    except Exception as e:
+        yield sse_event({"detail": str(e)}, "error")
+        return
+    yield sse_event(result, "done")
+
+
+def delete_sessions(db: Session, user_id: int, filters: list) -> list:
+    """Delete a user's sessions matching ``filters`` in one statement.
+
+    Messages go with them through ON DELETE CASCADE, and JD/resume documents
+    no other session uses are deleted too. Set-based deletes skip mapper
+    events, so the counters are adjusted here; the caller commits. Returns
+    the deleted ``(id, archive_segment, archived_message_count, ...)`` rows.
+    """
+    targets = select(InterviewSession.id).where(InterviewSession.user_id == user_id, *filters)
+    messages = db.scalar(
+        select(func.count()).select_from(InterviewMessage)
+        .where(InterviewMessage.session_id.in_(targets))
+    )
+    deleted = db.execute(
+        delete(InterviewSession)
+        .where(InterviewSession.user_id == user_id, *filters)
+        .returning(
+            InterviewSession.id,
+            InterviewSession.archive_segment,
+            InterviewSession.archived_message_count,
+            InterviewSession.jd_document_id,
+            InterviewSession.resume_document_id
+        )
+    ).all()
+    delete_orphan_documents(
+        db, [row.jd_document_id for row in deleted] + [row.resume_document_id for row in deleted]
+    )
+    messages += sum(row.archived_message_count or 0 for row in deleted)
+    bump_user_stats(
+        db.connection(), user_id,
+        interview_sessions=-len(deleted),
+        interview_messages=-messages
+    )
+    return deleted
+
+
+def mark_archives_dirty(rows) -> None:
+    # An archived transcript is dropped when its segment is next compacted
+    for segment in {row.archive_segment for row in rows if row.archive_segment}:
+        mark_segment_dirty(segment)
+
+
 # =====================
 # NEW CHAT ROUTES
 # =====================
@@ -114,101 +339,129 @@ def get_interview_response(
 @router.post("/session/start", response_model=dict)
 def start_chat_session(
     request: ChatStartRequest,
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user: CurrentUser,
+    db: Session = Depends(get_db),
+    idempotency_key: str | None = Header(None)
 ):
     """Start a new chat interview session.
     
     Creates new session and generates opening question.
-    Returns session ID and opening question.
+    Returns session ID and opening question; ``fallback`` is true when the
+    LLM could not answer in time and a template question was used. A retry
+    with the same ``Idempotency-Key`` header returns the first response.
     """
+    if idempotency_key:
+        stored = claim_key(db, user.id, "session/start", idempotency_key, request_hash(request))
+        if stored is not None:
+            return stored
+    
     try:
-        user_id = get_user_id(email, db)
+        user_id = user.id
         
-        # Create session
-        session = InterviewSession(
-            user_id=user_id,
-            mode=request.mode,
-            difficulty=request.difficulty,
-            job_description=request.job_description,
-            resume_text=request.resume_text,
-            title=request.title
-        )
-        db.add(session)
-        db.commit()
-        db.refresh(session)
-        
-        # Generate opening question
+        # Generate opening question first; the session is only stored with
+        # it, so a failed generation leaves no empty session behind
         if request.mode.lower() == "hr":
-            question = generate_hr_question(
-                job_description=request.job_description,
+            generate = partial(
+                generate_hr_question,
+                job_description=build_digest(request.job_description),
                 level=request.difficulty,
-                resume_text=request.resume_text
+                resume_text=build_digest(request.resume_text)
             )
         else:
-            question = generate_question(
-                job_description=request.job_description,
+            generate = partial(
+                generate_question,
+                job_description=build_digest(request.job_description),
                 level=request.difficulty
             )
-        
-        # Save opening question to DB
-        ai_message = InterviewMessage(
-            session_id=session.id,
-            role="ai",
-            content=question
+        question, fallback = generate_within_budget(
+            generate,
+            partial(
+                generate_fallback_question,
+                request.resume_text,
+                request.job_description,
+                mode=request.mode,
+                level=request.difficulty
+            ),
+            "session/start"
         )
-        db.add(ai_message)
-        db.commit()
         
-        return {
-            "session_id": session.id,
+        # Session, opening question and idempotent response in one transaction
+        session_id = add_started_session(db, user_id, request, question)
+        result = {
+            "session_id": session_id,
             "opening_question": question,
             "mode": request.mode,
-            "difficulty": request.difficulty
+            "difficulty": request.difficulty,
+            "fallback": fallback
         }
+        if idempotency_key:
+            store_response(db, user_id, "session/start", idempotency_key, result)
+        db.commit()
+        
+        return result
     
     except Exception as e:
         db.rollback()
+        if idempotency_key:
+            release_key(db, user.id, "session/start", idempotency_key)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/session/start/stream", dependencies=[Depends(require_llm)])
+async def start_chat_session_stream(
+    request: ChatStartRequest,
+    user: CurrentUser
+):
+    """Streaming variant of ``/session/start`` (server-sent events).
+
+    The opening question arrives as ``token`` events; the final ``done``
+    event carries the same body ``/session/start`` returns. The session is
+    only created once the question is complete, so a client that
+    disconnects early leaves nothing behind.
+    """
+    # The documents are only stored with the session, so digest here
+    make_iterator = interview_stream_factory(
+        request.mode,
+        job_description=build_digest(request.job_description),
+        level=request.difficulty,
+        resume_text=build_digest(request.resume_text)
+    )
+    return StreamingResponse(
+        stream_reply(make_iterator, partial(save_started_session, user.id, request)),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
 @router.get("/session/latest", response_model=dict)
-def get_latest_session(
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_latest_session(
+    user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get the most recent interview session for current user."""
     try:
-        user_id = get_user_id(email, db)
+        user_id = user.id
         
-        session = db.query(InterviewSession).filter(
+        session = await db.scalar(select(InterviewSession).where(
             InterviewSession.user_id == user_id
-        ).order_by(InterviewSession.created_at.desc()).first()
+        ).order_by(InterviewSession.id.desc()).limit(1))
         
         if not session:
             raise HTTPException(status_code=404, detail="No session found")
         
-        messages = db.query(InterviewMessage).filter(
+        await rehydrate_session_async(db, session)
+        
+        messages = (await db.scalars(select(InterviewMessage).where(
             InterviewMessage.session_id == session.id
-        ).order_by(InterviewMessage.created_at.asc()).all()
+        ).order_by(InterviewMessage.seq.asc()))).all()
         
-        message_list = [
-            {
-                "id": msg.id,
-                "role": msg.role,
-                "content": msg.content,
-                "created_at": msg.created_at
-            }
-            for msg in messages
-        ]
+        message_list = [serialize_message(msg) for msg in messages]
         
         return {
             "session_id": session.id,
             "mode": session.mode,
             "difficulty": session.difficulty,
             "title": session.title,
-            "job_description": session.job_description,
-            "resume_text": session.resume_text,
             "created_at": session.created_at,
             "updated_at": session.updated_at,
             "messages": message_list
@@ -221,79 +474,121 @@ def get_latest_session(
 
 
 @router.get("/sessions", response_model=list)
-def get_user_sessions(
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_user_sessions(
+    response: Response,
+    user: CurrentUser,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    mode: str | None = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all interview sessions for current user."""
+    """Get a page of interview sessions for current user, optionally of one mode.
+
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    """
     try:
-        user_id = get_user_id(email, db)
+        user_id = user.id
         
-        sessions = db.query(InterviewSession).filter(
+        limit = clamp_limit(limit)
+        stmt = select(InterviewSession).where(
             InterviewSession.user_id == user_id
-        ).order_by(InterviewSession.created_at.desc()).all()
+        ).options(load_only(
+            InterviewSession.id,
+            InterviewSession.mode,
+            InterviewSession.title,
+            InterviewSession.created_at,
+            InterviewSession.updated_at,
+            InterviewSession.archived_at,
+            InterviewSession.archived_message_count
+        ))
+        if mode:
+            stmt = stmt.where(InterviewSession.mode == mode)
+        rows = (await db.scalars(keyset_page(stmt, InterviewSession.id, cursor, limit))).all()
+        sessions, next_cursor = split_page(rows, limit)
+        
+        # One grouped count for the whole page instead of one query per session
+        counts = dict((await db.execute(
+            select(InterviewMessage.session_id, func.count(InterviewMessage.id))
+            .where(InterviewMessage.session_id.in_([s.id for s in sessions]))
+            .group_by(InterviewMessage.session_id)
+        )).all()) if sessions else {}
+        
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         
-        result = []
-        for session in sessions:
-            message_count = db.query(InterviewMessage).filter(
-                InterviewMessage.session_id == session.id
-            ).count()
-            
-            result.append({
+        return [
+            {
                 "id": session.id,
                 "mode": session.mode,
                 "title": session.title,
                 "created_at": session.created_at,
                 "updated_at": session.updated_at,
-                "message_count": message_count
-            })
-        
-        return result
+                "message_count": counts.get(session.id, session.archived_message_count or 0),
+                "archived": session.archived_at is not None
+            }
+            for session in sessions
+        ]
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/session/{session_id}", response_model=dict)
-def get_session_messages(
+async def get_session_messages(
     session_id: int,
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user: CurrentUser,
+    after_seq: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all messages in a specific session."""
+    """Get messages in a specific session.
+
+    ``after_seq`` returns only messages newer than that position, so a client
+    that already holds the transcript up to N can poll for the tail. With
+    ``limit`` the transcript is paged forward; pass ``last_seq`` back as
+    ``after_seq`` while ``has_more`` is true. Reads walk the (session_id, seq)
+    index and never sort the whole transcript.
+    """
     try:
-        user_id = get_user_id(email, db)
+        user_id = user.id
         
         # Verify session belongs to user
-        session = db.query(InterviewSession).filter(
+        session = await db.scalar(select(InterviewSession).where(
             InterviewSession.id == session_id,
             InterviewSession.user_id == user_id
-        ).first()
+        ))
         
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        messages = db.query(InterviewMessage).filter(
-            InterviewMessage.session_id == session_id
-        ).order_by(InterviewMessage.created_at.asc()).all()
+        await rehydrate_session_async(db, session)
         
-        message_list = [
-            {
-                "id": msg.id,
-                "role": msg.role,
-                "content": msg.content,
-                "created_at": msg.created_at
-            }
-            for msg in messages
-        ]
+        stmt = select(InterviewMessage).where(
+            InterviewMessage.session_id == session_id,
+            InterviewMessage.seq > after_seq
+        ).order_by(InterviewMessage.seq.asc())
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        messages = (await db.scalars(stmt)).all()
+        has_more = limit is not None and len(messages) > limit
+        if has_more:
+            messages = messages[:limit]
+        
+        message_list = [serialize_message(msg) for msg in messages]
         
         return {
             "session_id": session.id,
             "mode": session.mode,
             "title": session.title,
-            "messages": message_list
+            "messages": message_list,
+            "last_seq": messages[-1].seq if messages else after_seq,
+            "has_more": has_more
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -301,12 +596,24 @@ def get_session_messages(
 @router.post("/message")
 def send_message(
     request: MessageSendRequest,
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user: CurrentUser,
+    db: Session = Depends(get_db),
+    idempotency_key: str | None = Header(None)
 ):
-    """Send a user message and get AI response."""
+    """Send a user message and get AI response.
+    
+    ``fallback`` is true when the LLM could not answer in time and a
+    template question was used. A retry with the same ``Idempotency-Key``
+    header returns the first response instead of saving the message and
+    reply again.
+    """
+    if idempotency_key:
+        stored = claim_key(db, user.id, "message", idempotency_key, request_hash(request))
+        if stored is not None:
+            return stored
+    
     try:
-        user_id = get_user_id(email, db)
+        user_id = user.id
         
         # Verify session belongs to user
         session = db.query(InterviewSession).filter(
@@ -317,98 +624,166 @@ def send_message(
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        # Save user message
-        user_msg = InterviewMessage(
-            session_id=request.session_id,
-            role="user",
-            content=request.message
-        )
-        db.add(user_msg)
-        db.commit()
+        rehydrate_session(db, session)
         
-        # Get all messages so far
-        all_messages = db.query(InterviewMessage).filter(
-            InterviewMessage.session_id == request.session_id
-        ).order_by(InterviewMessage.created_at.asc()).all()
+        # The question this message answers
+        last_ai_msg = db.query(InterviewMessage).filter(
+            InterviewMessage.session_id == request.session_id,
+            InterviewMessage.role == "ai"
+        ).order_by(InterviewMessage.seq.desc()).first()
         
-        # Generate AI response
-        ai_response = get_interview_response(
-            session,
-            all_messages,
-            db
+        # Generate AI response. The user message is only stored with the
+        # reply (and the idempotency response), so a failed call leaves
+        # nothing behind for the retry to duplicate
+        user_msg = InterviewMessage(role="user", content=request.message)
+        ai_response, fallback = generate_within_budget(
+            partial(
+                get_interview_response,
+                session,
+                [m for m in (last_ai_msg, user_msg) if m is not None],
+                db
+            ),
+            partial(session_fallback_question, db, session),
+            "message"
         )
         
-        # Save AI response
-        ai_msg = InterviewMessage(
-            session_id=request.session_id,
-            role="ai",
-            content=ai_response
-        )
-        db.add(ai_msg)
-        db.commit()
-        db.refresh(ai_msg)
+        # Fold the answered question into the session's rolling summary
+        if last_ai_msg is not None:
+            session.context_summary = update_summary(session.context_summary, last_ai_msg.content, request.message)
         
-        return {
+        # Save user message and AI response
+        add_message(db, request.session_id, "user", request.message)
+        # Flushed first so the reply's seq subquery sees it
+        db.flush()
+        ai_msg = add_message(db, request.session_id, "ai", ai_response)
+        db.flush()
+        db.refresh(ai_msg)
+        result = {
+            "seq": ai_msg.seq,
             "role": ai_msg.role,
             "content": ai_msg.content,
-            "created_at": ai_msg.created_at
+            "created_at": ai_msg.created_at,
+            "fallback": fallback
         }
+        if idempotency_key:
+            store_response(db, user_id, "message", idempotency_key, result)
+        db.commit()
+        
+        return result
     
     except Exception as e:
         db.rollback()
+        if idempotency_key:
+            release_key(db, user.id, "message", idempotency_key)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/message/stream", dependencies=[Depends(require_llm)])
+def send_message_stream(
+    request: MessageSendRequest,
+    user: CurrentUser,
+    db: Session = Depends(get_db)
+):
+    """Streaming variant of ``/message`` (server-sent events).
+
+    The reply arrives as ``token`` events, then a ``done`` event with the
+    stored AI message. Both messages are saved together when the reply is
+    complete; if the client disconnects first neither is, so the message
+    can simply be sent again.
+    """
+    session = db.query(InterviewSession).filter(
+        InterviewSession.id == request.session_id,
+        InterviewSession.user_id == user.id
+    ).first()
+    
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    rehydrate_session(db, session)
+    
+    last_ai_msg = db.query(InterviewMessage).filter(
+        InterviewMessage.session_id == request.session_id,
+        InterviewMessage.role == "ai"
+    ).order_by(InterviewMessage.seq.desc()).first()
+    
+    make_iterator = interview_stream_factory(
+        session.mode,
+        job_description=session.jd_digest,
+        level=session.difficulty,
+        previous_question=last_ai_msg.content if last_ai_msg else "",
+        user_answer=request.message,
+        resume_text=session.resume_digest,
+        summary=session.context_summary or ""
+    )
+    return StreamingResponse(
+        stream_reply(
+            make_iterator,
+            partial(save_exchange, session.id, last_ai_msg.content if last_ai_msg else "", request.message)
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
 @router.delete("/session/{session_id}", response_model=dict)
 def delete_session(
     session_id: int,
-    email: str = Depends(get_current_user),
+    user: CurrentUser,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Delete an interview session and all its messages.
     
-    Verifies session belongs to logged-in user before deleting.
+    Only deletes a session that belongs to the logged-in user.
     """
     try:
-        user_id = get_user_id(email, db)
-        
-        # Verify session belongs to user
-        session = db.query(InterviewSession).filter(
-            InterviewSession.id == session_id,
-            InterviewSession.user_id == user_id
-        ).first()
-        
-        if not session:
+        deleted = delete_sessions(db, user.id, [InterviewSession.id == session_id])
+        if not deleted:
             raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Delete all messages first
-        db.query(InterviewMessage).filter(
-            InterviewMessage.session_id == session_id
-        ).delete()
-        
-        # Delete session
-        db.delete(session)
         db.commit()
         
+        background_tasks.add_task(mark_archives_dirty, deleted)
         return {"message": "Session deleted successfully"}
     
     except HTTPException:
+        db.rollback()
         raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/sessions/bulk-delete", response_model=dict)
+def bulk_delete_sessions(
+    request: BulkDeleteRequest,
+    user: CurrentUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """Delete many interview sessions and their messages in one transaction."""
+    filters = bulk_filters(request, InterviewSession.id, InterviewSession.created_at)
+    try:
+        deleted = delete_sessions(db, user.id, filters)
+        db.commit()
+        
+        background_tasks.add_task(mark_archives_dirty, deleted)
+        return {"deleted": len(deleted), "ids": [row.id for row in deleted]}
+    
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ========================
 # LEGACY ROUTES (Backwards Compatibility)
 # ========================
 
-@router.post("/start", response_class=Response)
+@router.post("/start", response_class=Response, dependencies=[Depends(require_llm)])
 def start_interview(
     job_description: str,
+    user: CurrentUser,
     mode: str = "programming",
-    resume_text: str = "",
-    email: str = Depends(get_current_user)
+    resume_text: str = ""
 ):
     """LEGACY: Direct interview without session storage.
     
@@ -433,15 +808,15 @@ def start_interview(
         raise HTTPException(status_code=503, detail=str(e))
 
 
-@router.post("/follow-up", response_class=Response)
+@router.post("/follow-up", response_class=Response, dependencies=[Depends(require_llm)])
 def follow_up_question(
     job_description: str,
     previous_question: str,
     answer: str,
+    user: CurrentUser,
     mode: str = "programming",
     level: str = "basic",
-    resume_text: str = "",
-    email: str = Depends(get_current_user)
+    resume_text: str = ""
 ):
     """LEGACY: Direct follow-up without session storage.
     
@@ -1,11 +1,13 @@
+import os
+
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.database import SessionLocal
-from app.models.user import User
 from app.models.resume import Resume
-from app.utils.security import get_current_user
+from app.utils.security import CurrentUser
+from app.utils.ai.llm_provider import _GROQ_AVAILABLE, breaker, require_llm
 from app.utils.ai.programming_interview_engine import generate_question
 
 router = APIRouter(
@@ -19,29 +21,25 @@ router = APIRouter(
 # -----------------------------
 @router.get("/health")
 def check_groq_health():
-    """Check if Groq is properly configured."""
-    try:
-        from app.utils.ai.interview_engine import _get_client, _GROQ_AVAILABLE
-        import os
-        
-        status = {
-            "groq_package_installed": _GROQ_AVAILABLE,
-            "api_key_set": bool(os.getenv("GROQ_API_KEY")),
-            "status": "ok" if _GROQ_AVAILABLE and os.getenv("GROQ_API_KEY") else "not_configured"
-        }
-        
-        if status["status"] == "ok":
-            # Try to initialize client
-            try:
-                _get_client()
-                status["client_initialized"] = True
-            except Exception as e:
-                status["client_initialized"] = False
-                status["error"] = str(e)
-        
-        return status
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    """Check if Groq is configured and whether the circuit breaker lets calls through.
+
+    Only reads state; it never creates a client or calls the provider.
+    """
+    configured = _GROQ_AVAILABLE and bool(os.getenv("GROQ_API_KEY"))
+    circuit = breaker.snapshot()
+    if not configured:
+        status = "not_configured"
+    elif circuit["state"] == "closed":
+        status = "ok"
+    else:
+        status = "degraded"
+    
+    return {
+        "groq_package_installed": _GROQ_AVAILABLE,
+        "api_key_set": bool(os.getenv("GROQ_API_KEY")),
+        "circuit_breaker": circuit,
+        "status": status
+    }
 
 
 class StartInterviewRequest(BaseModel):
@@ -69,13 +67,25 @@ def get_db():
         db.close()
 
 
+def ai_error(e: Exception) -> HTTPException:
+    """503 with a readable message for a failed question generation."""
+    error_message = str(e)
+    if "groq package not available" in error_message:
+        error_message = "Groq AI package is not installed. Please install it with: pip install groq"
+    elif "GROQ_API_KEY" in error_message:
+        error_message = "Groq API key is not configured. Please set GROQ_API_KEY in your .env file. Get your key from https://console.groq.com/"
+    elif not isinstance(e, RuntimeError):
+        error_message = f"Failed to generate interview question: {error_message}"
+    return HTTPException(status_code=503, detail=error_message)
+
+
 # -----------------------------
 # Start Interview
 # -----------------------------
-@router.post("/start", response_class=Response)
+@router.post("/start", response_class=Response, dependencies=[Depends(require_llm)])
 def start_interview(
     request: StartInterviewRequest,
-    email: str = Depends(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Start programming interview.
@@ -87,10 +97,6 @@ def start_interview(
         "level": "basic"
     }
     """
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     resume = (
         db.query(Resume)
         .filter(Resume.user_id == user.id)
@@ -109,32 +115,18 @@ def start_interview(
             level=request.level
         )
         return Response(content=question, media_type="text/plain")
-    except RuntimeError as e:
-        # Handle AI service errors (Groq not available, API key missing, etc.)
-        import traceback
-        error_detail = f"{str(e)}\n{traceback.format_exc()}"
-        print(f">>> PROGRAMMING INTERVIEW ERROR: {error_detail}")
-        error_message = str(e)
-        if "groq package not available" in error_message:
-            error_message = "Groq AI package is not installed. Please install it with: pip install groq"
-        elif "GROQ_API_KEY" in error_message:
-            error_message = "Groq API key is not configured. Please set GROQ_API_KEY in your .env file. Get your key from https://console.groq.com/"
-        raise HTTPException(status_code=503, detail=error_message)
     except Exception as e:
-        # Handle other unexpected errors
-        import traceback
-        error_detail = f"{str(e)}\n{traceback.format_exc()}"
-        print(f">>> PROGRAMMING INTERVIEW ERROR: {error_detail}")
-        raise HTTPException(status_code=503, detail=f"Failed to generate interview question: {str(e)}")
+        print(f">>> PROGRAMMING INTERVIEW ERROR: {e}")
+        raise ai_error(e)
 
 
 # -----------------------------
 # Answer + Auto Evaluation
 # -----------------------------
-@router.post("/answer", response_class=Response)
+@router.post("/answer", response_class=Response, dependencies=[Depends(require_llm)])
 def answer_question(
     request: AnswerRequest,
-    email: str = Depends(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Submit answer and get follow-up question.
@@ -148,10 +140,6 @@ def answer_question(
         "level": "basic"
     }
     """
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     resume = (
         db.query(Resume)
         .filter(Resume.user_id == user.id)
@@ -172,21 +160,7 @@ def answer_question(
             user_answer=request.answer
         )
         return Response(content=question, media_type="text/plain")
-    except RuntimeError as e:
-        # Handle AI service errors (Groq not available, API key missing, etc.)
-        import traceback
-        error_detail = f"{str(e)}\n{traceback.format_exc()}"
-        print(f">>> PROGRAMMING INTERVIEW ANSWER ERROR: {error_detail}")
-        error_message = str(e)
-        if "groq package not available" in error_message:
-            error_message = "Groq AI package is not installed. Please install it with: pip install groq"
-        elif "GROQ_API_KEY" in error_message:
-            error_message = "Groq API key is not configured. Please set GROQ_API_KEY in your .env file. Get your key from https://console.groq.com/"
-        raise HTTPException(status_code=503, detail=error_message)
     except Exception as e:
-        # Handle other unexpected errors
-        import traceback
-        error_detail = f"{str(e)}\n{traceback.format_exc()}"
-        print(f">>> PROGRAMMING INTERVIEW ANSWER ERROR: {error_detail}")
-        raise HTTPException(status_code=503, detail=f"Failed to generate interview question: {str(e)}")
+        print(f">>> PROGRAMMING INTERVIEW ANSWER ERROR: {e}")
+        raise ai_error(e)
 
@@ -1,13 +1,25 @@
+import json
 import os
 import shutil
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
-
-from app.database import SessionLocal, Base, engine
+import tempfile
+import uuid
+import zipfile
+from collections import Counter
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Request, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, undefer
+
+from app.database import SessionLocal, Base, engine, get_async_db
 from app.models.resume import Resume
-from app.models.user import User
 from app.models.job_description import JobDescription
-from app.utils.security import get_current_user
+from app.models.user_stats import bump_user_stats
+from app.utils.security import CurrentUser
+from app.utils.bulk_delete import BulkDeleteRequest, bulk_filters, remove_files
+from app.utils.upload_gc import UPLOAD_DIR
+from app.utils.resume_import import file_sha256, import_resumes
+from app.utils.pagination import DEFAULT_PAGE_SIZE, clamp_limit, keyset_page, split_page
 from app.utils.resume_parser import (
     extract_text_from_pdf,
     extract_text_from_docx
@@ -17,8 +29,6 @@ router = APIRouter()
 
 Base.metadata.create_all(bind=engine)
 
-UPLOAD_DIR = "uploads"
-
 def get_db():
     db = SessionLocal()
     try:
@@ -28,8 +38,8 @@ def get_db():
 
 @router.post("/upload")
 def upload_resume(
+    user: CurrentUser,
     file: UploadFile = File(...),
-    email: str = Depends(get_current_user),
     request: Request = None,
     db: Session = Depends(get_db)
 ):
@@ -45,19 +55,18 @@ def upload_resume(
             detail="Only PDF and DOCX files are allowed"
         )
 
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     user_folder = os.path.join(UPLOAD_DIR, f"user_{user.id}")
     os.makedirs(user_folder, exist_ok=True)
 
-    file_path = os.path.join(user_folder, file.filename)
+    # A unique prefix keeps a re-upload of the same filename from overwriting
+    # the file another resume row still points at
+    file_path = os.path.join(user_folder, f"{uuid.uuid4().hex[:12]}_{os.path.basename(file.filename)}")
 
     try:
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
     except Exception as e:
+        remove_files([file_path])
         raise HTTPException(
             status_code=500,
             detail=f"Failed to save file: {str(e)}"
@@ -70,12 +79,14 @@ def upload_resume(
         else:
             extracted_text = extract_text_from_docx(file_path)
     except Exception as e:
+        remove_files([file_path])
         raise HTTPException(
             status_code=500,
             detail=f"Failed to extract text from file: {str(e)}"
         )
 
     if not extracted_text:
+        remove_files([file_path])
         raise HTTPException(
             status_code=400,
             detail="Could not extract text from resume"
@@ -86,6 +97,7 @@ def upload_resume(
             user_id=user.id,
             filename=file.filename,
             file_path=file_path,
+            content_sha256=file_sha256(file_path),
             extracted_text=extracted_text
         )
 
@@ -93,6 +105,7 @@ def upload_resume(
         db.commit()
     except Exception as e:
         db.rollback()
+        remove_files([file_path])
         raise HTTPException(
             status_code=500,
             detail=f"Failed to save resume to database: {str(e)}"
@@ -105,36 +118,89 @@ def upload_resume(
     }
 
 
+@router.post("/bulk-import")
+def bulk_import_resumes(
+    user: CurrentUser,
+    file: UploadFile = File(...)
+):
+    """Import every PDF/DOCX in a zip archive.
+
+    Streams one NDJSON line per file as it is processed (``imported``,
+    ``duplicate``, ``skipped`` or ``failed``), then a ``summary`` line.
+    Files whose bytes match a resume the user already has are not imported
+    again.
+    """
+    # The upload is spooled to one temp file so members can be read back
+    # lazily after this handler returns; nothing is extracted
+    fd, archive_path = tempfile.mkstemp(suffix=".zip")
+    with os.fdopen(fd, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+    if not zipfile.is_zipfile(archive_path):
+        os.remove(archive_path)
+        raise HTTPException(
+            status_code=400,
+            detail="Upload a zip archive of PDF or DOCX files"
+        )
+
+    def report():
+        db = SessionLocal()
+        counts = Counter()
+        try:
+            for result in import_resumes(db, user.id, archive_path):
+                counts[result["status"]] += 1
+                yield json.dumps(result) + "\n"
+            yield json.dumps({"summary": dict(counts)}) + "\n"
+        finally:
+            db.close()
+            os.remove(archive_path)
+
+    return StreamingResponse(report(), media_type="application/x-ndjson")
+
+
 @router.get("/history")
-def get_resume_history(
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_resume_history(
+    user: CurrentUser,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    include_content: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all previously uploaded resumes for the current user"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    """Get a page of previously uploaded resumes for the current user.
+
+    The extracted text is left out unless ``include_content`` is set; use
+    ``GET /resume/{id}`` to fetch a single document.
+    """
+    limit = clamp_limit(limit)
+    stmt = select(Resume).where(Resume.user_id == user.id)
+    if include_content:
+        stmt = stmt.options(undefer(Resume.extracted_text))
+    else:
+        stmt = stmt.options(load_only(Resume.id, Resume.filename, Resume.uploaded_at))
+    rows = (await db.scalars(keyset_page(stmt, Resume.id, cursor, limit))).all()
+    resumes, next_cursor = split_page(rows, limit)
     
-    resumes = db.query(Resume).filter(Resume.user_id == user.id).order_by(Resume.uploaded_at.desc()).all()
+    items = []
+    for resume in resumes:
+        item = {
+            "id": resume.id,
+            "filename": resume.filename,
+            "uploaded_at": resume.uploaded_at.isoformat() if resume.uploaded_at else None
+        }
+        if include_content:
+            item["content"] = resume.extracted_text
+        items.append(item)
     
     return {
-        "resumes": [
-            {
-                "id": resume.id,
-                "filename": resume.filename,
-                "content": resume.extracted_text,
-                "uploaded_at": resume.uploaded_at.isoformat() if resume.uploaded_at else None
-            }
-            for resume in resumes
-        ]
+        "resumes": items,
+        "next_cursor": next_cursor
     }
 
 
 @router.post("/job-description/upload")
 def upload_job_description(
     title: str,
+    user: CurrentUser,
     file: UploadFile = File(...),
-    email: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Upload a job description file"""
@@ -144,10 +210,6 @@ def upload_job_description(
             detail="Only PDF, DOCX, and TXT files are allowed"
         )
 
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Extract text from uploaded file
     try:
         if file.filename.lower().endswith(".pdf"):
@@ -197,7 +259,7 @@ def upload_job_description(
 def save_job_description_text(
     title: str,
     content: str,
-    email: str = Depends(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Save a job description from text input"""
@@ -207,10 +269,6 @@ def save_job_description_text(
             detail="Job description content cannot be empty"
         )
 
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     try:
         jd = JobDescription(
             user_id=user.id,
@@ -236,46 +294,58 @@ def save_job_description_text(
 
 
 @router.get("/job-description/history")
-def get_job_description_history(
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_job_description_history(
+    user: CurrentUser,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    include_content: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all previously saved job descriptions for the current user"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    """Get a page of previously saved job descriptions for the current user.
+
+    The JD text is left out unless ``include_content`` is set; use
+    ``GET /resume/job-description/{id}`` to fetch a single document.
+    """
+    limit = clamp_limit(limit)
+    stmt = select(JobDescription).where(JobDescription.user_id == user.id)
+    if include_content:
+        stmt = stmt.options(undefer(JobDescription.content))
+    else:
+        stmt = stmt.options(load_only(
+            JobDescription.id, JobDescription.title, JobDescription.filename, JobDescription.uploaded_at
+        ))
+    rows = (await db.scalars(keyset_page(stmt, JobDescription.id, cursor, limit))).all()
+    jds, next_cursor = split_page(rows, limit)
     
-    jds = db.query(JobDescription).filter(JobDescription.user_id == user.id).order_by(JobDescription.uploaded_at.desc()).all()
+    items = []
+    for jd in jds:
+        item = {
+            "id": jd.id,
+            "title": jd.title,
+            "filename": jd.filename,
+            "uploaded_at": jd.uploaded_at.isoformat() if jd.uploaded_at else None
+        }
+        if include_content:
+            item["content"] = jd.content
+        items.append(item)
     
     return {
-        "job_descriptions": [
-            {
-                "id": jd.id,
-                "title": jd.title,
-                "filename": jd.filename,
-                "content": jd.content,
-                "uploaded_at": jd.uploaded_at.isoformat() if jd.uploaded_at else None
-            }
-            for jd in jds
-        ]
+        "job_descriptions": items,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/job-description/{jd_id}")
-def get_job_description(
+async def get_job_description(
     jd_id: int,
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific job description"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    jd = db.query(JobDescription).filter(
+    jd = await db.scalar(select(JobDescription).where(
         JobDescription.id == jd_id,
         JobDescription.user_id == user.id
-    ).first()
+    ).options(undefer(JobDescription.content)))
     
     if not jd:
         raise HTTPException(status_code=404, detail="Job description not found")
@@ -290,20 +360,16 @@ def get_job_description(
 
 
 @router.get("/{resume_id}")
-def get_resume(
+async def get_resume(
     resume_id: int,
-    email: str = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user: CurrentUser,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific resume"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    resume = db.query(Resume).filter(
+    resume = await db.scalar(select(Resume).where(
         Resume.id == resume_id,
         Resume.user_id == user.id
-    ).first()
+    ).options(undefer(Resume.extracted_text)))
     
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -319,16 +385,12 @@ def get_resume(
 @router.delete("/{resume_id}")
 def delete_resume(
     resume_id: int,
-    email: str = Depends(get_current_user),
+    user: CurrentUser,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Delete a specific resume"""
-    print(f"[DELETE RESUME] Attempting to delete resume {resume_id} for user {email}")
-    
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        print(f"[DELETE RESUME] User not found: {email}")
-        raise HTTPException(status_code=404, detail="User not found")
+    print(f"[DELETE RESUME] Attempting to delete resume {resume_id} for user {user.email}")
     
     resume = db.query(Resume).filter(
         Resume.id == resume_id,
@@ -341,16 +403,16 @@ def delete_resume(
     
     try:
         print(f"[DELETE RESUME] Found resume, file path: {resume.file_path}")
-        # Delete file if it exists
-        if os.path.exists(resume.file_path):
-            os.remove(resume.file_path)
-            print(f"[DELETE RESUME] File deleted from disk")
+        file_path = resume.file_path
         
         # Delete from database
         db.delete(resume)
         db.commit()
         print(f"[DELETE RESUME] Successfully deleted from database")
         
+        # The file goes only once the row is gone, after the response is sent
+        background_tasks.add_task(remove_files, [file_path])
+        
         return {
             "message": "Resume deleted successfully"
         }
@@ -366,16 +428,11 @@ def delete_resume(
 @router.delete("/job-description/{jd_id}")
 def delete_job_description(
     jd_id: int,
-    email: str = Depends(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Delete a specific job description"""
-    print(f"[DELETE JD] Attempting to delete JD {jd_id} for user {email}")
-    
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        print(f"[DELETE JD] User not found: {email}")
-        raise HTTPException(status_code=404, detail="User not found")
+    print(f"[DELETE JD] Attempting to delete JD {jd_id} for user {user.email}")
     
     jd = db.query(JobDescription).filter(
         JobDescription.id == jd_id,
@@ -403,4 +460,66 @@ def delete_job_description(
             detail=f"Failed to delete job description: {str(e)}"
         )
 
+@router.post("/bulk-delete")
+def bulk_delete_resumes(
+    request: BulkDeleteRequest,
+    user: CurrentUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """Delete many resumes in one statement.
+
+    Uploaded files are removed in the background after the commit.
+    """
+    filters = bulk_filters(request, Resume.id, Resume.uploaded_at)
+    try:
+        deleted = db.execute(
+            delete(Resume)
+            .where(Resume.user_id == user.id, *filters)
+            .returning(Resume.id, Resume.file_path)
+        ).all()
+        bump_user_stats(db.connection(), user.id, resumes=-len(deleted))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to delete resumes: {str(e)}"
+        )
+
+    background_tasks.add_task(remove_files, [row.file_path for row in deleted])
+    return {
+        "deleted": len(deleted),
+        "ids": [row.id for row in deleted]
+    }
+
+
+@router.post("/job-description/bulk-delete")
+def bulk_delete_job_descriptions(
+    request: BulkDeleteRequest,
+    user: CurrentUser,
+    db: Session = Depends(get_db)
+):
+    """Delete many job descriptions in one statement."""
+    filters = bulk_filters(request, JobDescription.id, JobDescription.uploaded_at)
+    try:
+        deleted = db.execute(
+            delete(JobDescription)
+            .where(JobDescription.user_id == user.id, *filters)
+            .returning(JobDescription.id)
+        ).scalars().all()
+        bump_user_stats(db.connection(), user.id, job_descriptions=-len(deleted))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to delete job descriptions: {str(e)}"
+        )
+
+    return {
+        "deleted": len(deleted),
+        "ids": deleted
+    }
+
 print(">>> RESUME API LOADED <<<")
@@ -0,0 +1,152 @@
+"""
+Circuit breaker for the LLM provider.
+
+Tracks the outcome of the last ``window`` calls. Once at least
+``min_calls`` are recorded and either the share of failures reaches
+``failure_rate`` or the share of calls slower than ``slow_call_seconds``
+reaches ``slow_call_rate``, the breaker opens: calls fail at once with
+``CircuitOpenError`` instead of waiting on a provider that is down or
+overloaded. After ``open_seconds`` it is half-open and lets ``probes``
+calls through; if they succeed it closes again, otherwise it reopens.
+
+One breaker is shared by every thread of a worker process (it lives in
+``llm_provider``); workers do not share state with each other.
+"""
+import os
+import threading
+import time
+from collections import deque
+
+from app.utils import metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+BREAKER_FAILURE_RATE = float(os.getenv("SKILLIO_BREAKER_FAILURE_RATE", "0.5"))
+BREAKER_SLOW_CALL_SECONDS = float(os.getenv("SKILLIO_BREAKER_SLOW_CALL_SECONDS", "10"))
+BREAKER_SLOW_CALL_RATE = float(os.getenv("SKILLIO_BREAKER_SLOW_CALL_RATE", "0.8"))
+BREAKER_OPEN_SECONDS = float(os.getenv("SKILLIO_BREAKER_OPEN_SECONDS", "30"))
+BREAKER_WINDOW = 20
+BREAKER_MIN_CALLS = 5
+BREAKER_PROBES = 1
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+breaker_state = metrics.gauge(
+    "skillio_llm_breaker_state", "LLM circuit breaker state (0 closed, 1 half-open, 2 open)"
+)
+breaker_rejected = metrics.counter(
+    "skillio_llm_breaker_rejected_total", "LLM calls refused while the circuit breaker was open"
+)
+breaker_transitions = metrics.counter(
+    "skillio_llm_breaker_transitions_total", "LLM circuit breaker state changes by new state"
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the provider while the breaker is open."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM provider circuit is open; retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        slow_call_seconds: float = BREAKER_SLOW_CALL_SECONDS,
+        slow_call_rate: float = BREAKER_SLOW_CALL_RATE,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        probes: int = BREAKER_PROBES,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.min_calls = min_calls
+        self.probes = probes
+        self._outcomes: deque = deque(maxlen=window)  # (failed, slow)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+        breaker_state.set(_STATE_VALUES[CLOSED], breaker=name)
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self._outcomes.clear()
+        breaker_state.set(_STATE_VALUES[state], breaker=self.name)
+        breaker_transitions.inc(breaker=self.name, state=state)
+        print(f"[llm] circuit breaker {self.name} is now {state}")
+
+    def _blocked_for(self) -> float:
+        if self._state == OPEN:
+            remaining = self._opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                return remaining
+            self._set_state(HALF_OPEN)
+        if self._state == HALF_OPEN and self._probes_in_flight >= self.probes:
+            # Asking again in a moment lets the probe finish first
+            return 1.0
+        return 0.0
+
+    def retry_after(self) -> float:
+        """Seconds until a call may be let through; 0 if one would be now."""
+        with self._lock:
+            return self._blocked_for()
+
+    def before_call(self) -> None:
+        """Admit a call or raise ``CircuitOpenError``; admitted calls must be recorded."""
+        with self._lock:
+            blocked_for = self._blocked_for()
+            if blocked_for > 0:
+                breaker_rejected.inc(breaker=self.name)
+                raise CircuitOpenError(blocked_for)
+            if self._state == HALF_OPEN:
+                self._probes_in_flight += 1
+
+    def record(self, failed: bool, duration: float) -> None:
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if failed or slow:
+                    self._set_state(OPEN)
+                else:
+                    self._probes_in_flight -= 1
+                    self._outcomes.append((False, False))
+                    if len(self._outcomes) >= self.probes:
+                        self._set_state(CLOSED)
+                return
+            if self._state == OPEN:
+                # Admitted before the breaker opened
+                return
+
+            self._outcomes.append((failed, slow))
+            calls = len(self._outcomes)
+            if calls < self.min_calls:
+                return
+            failures = sum(f for f, _ in self._outcomes)
+            slow_calls = sum(s for _, s in self._outcomes)
+            if failures / calls >= self.failure_rate or slow_calls / calls >= self.slow_call_rate:
+                self._set_state(OPEN)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_after = self._blocked_for()
+            calls = len(self._outcomes)
+            return {
+                "state": self._state,
+                "retry_after_seconds": round(retry_after, 1),
+                "recent_calls": calls,
+                "recent_failures": sum(f for f, _ in self._outcomes),
+                "recent_slow_calls": sum(s for _, s in self._outcomes),
+            }
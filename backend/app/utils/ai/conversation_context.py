@@ -0,0 +1,147 @@
+"""
+Token-budgeted context for interview follow-up prompts.
+
+Follow-ups used to carry the full JD and resume every turn but only the last
+question and answer. Here each session keeps a rolling summary of its earlier
+turns (``update_summary``, stored on the session), and the variable parts of
+a prompt are cut down to ``CONTEXT_TOKEN_BUDGET`` tokens. The latest exchange
+and the summary get fixed caps; the JD and resume share what the caps leave
+(``fit_documents``), however short the turn is, so they come out the same on
+every turn of a session and the prompt prefix holding them stays cacheable.
+
+Tokens are counted locally: exactly with tiktoken when it is installed (its
+cl100k encoding is close to the Llama tokenizer), otherwise with a cheap
+estimate that errs on the high side. Nothing here calls the LLM.
+"""
+import math
+import os
+import re
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+    _TIKTOKEN_AVAILABLE = True
+except Exception:
+    _ENCODING = None
+    _TIKTOKEN_AVAILABLE = False
+
+SUMMARY_TOKEN_BUDGET = 250
+QUESTION_TOKENS = 300
+ANSWER_TOKENS = 500
+# Size of each resume/JD digest (see app.utils.document_digest); defined here
+# so the default budget below leaves room for both in full
+DIGEST_TOKEN_BUDGET = int(os.getenv("SKILLIO_DIGEST_TOKEN_BUDGET", "400"))
+CONTEXT_TOKEN_BUDGET = int(os.getenv(
+    "SKILLIO_CONTEXT_TOKEN_BUDGET",
+    str(QUESTION_TOKENS + ANSWER_TOKENS + SUMMARY_TOKEN_BUDGET + 2 * DIGEST_TOKEN_BUDGET)
+))
+# Per turn in the summary
+SUMMARY_QUESTION_TOKENS = 40
+SUMMARY_ANSWER_TOKENS = 60
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+ELLIPSIS = " …"
+
+
+def _piece_tokens(piece: str) -> int:
+    return max(1, math.ceil(len(piece) / 6))
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    if _TIKTOKEN_AVAILABLE:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return sum(_piece_tokens(m.group()) for m in _PIECE.finditer(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """``text`` cut to about ``max_tokens`` tokens, marked with an ellipsis if cut."""
+    if not text or count_tokens(text) <= max_tokens:
+        return text or ""
+    if max_tokens <= 0:
+        return ""
+    if _TIKTOKEN_AVAILABLE:
+        return _ENCODING.decode(_ENCODING.encode(text, disallowed_special=())[:max_tokens]).rstrip() + ELLIPSIS
+    used = end = 0
+    for m in _PIECE.finditer(text):
+        used += _piece_tokens(m.group())
+        if used > max_tokens:
+            break
+        end = m.end()
+    return text[:end].rstrip() + ELLIPSIS
+
+
+def fit_sections(sections: list, budget: int = CONTEXT_TOKEN_BUDGET) -> dict:
+    """Cut ``(name, text, cap)`` sections down to ``budget`` tokens in total.
+
+    Sections with a cap get up to it, in order, while budget remains. Those
+    with ``cap=None`` then share the rest evenly; what one does not need
+    goes to the others. Returns ``{name: text}``.
+    """
+    fitted = {}
+    remaining = budget
+    shared = []
+    for name, text, cap in sections:
+        if cap is None:
+            shared.append((name, text))
+            continue
+        fitted[name] = truncate_to_tokens(text, min(cap, remaining))
+        remaining -= count_tokens(fitted[name])
+
+    pending = sorted(shared, key=lambda section: count_tokens(section[1]))
+    while pending:
+        share = max(remaining, 0) // len(pending)
+        name, text = pending.pop(0)
+        fitted[name] = truncate_to_tokens(text, share)
+        remaining -= count_tokens(fitted[name])
+    return fitted
+
+
+def fit_documents(resume_text: str, jd_text: str, budget: int = CONTEXT_TOKEN_BUDGET) -> dict:
+    """The resume and JD cut to the share of ``budget`` no turn can claim.
+
+    With the default budget that share is two full digests. Depends on
+    nothing but its arguments, so a session gets the same text for its
+    opening question and every follow-up.
+    """
+    share = max(budget - QUESTION_TOKENS - ANSWER_TOKENS - SUMMARY_TOKEN_BUDGET, 0)
+    return fit_sections([("resume", resume_text, None), ("jd", jd_text, None)], share)
+
+
+def followup_context(
+    previous_question: str,
+    candidate_answer: str,
+    summary: str | None,
+    budget: int = CONTEXT_TOKEN_BUDGET,
+) -> dict:
+    """The per-turn parts of a follow-up prompt, each cut to its cap.
+
+    Together with ``fit_documents`` for the same ``budget`` they stay
+    within it.
+    """
+    return fit_sections([
+        ("question", previous_question, QUESTION_TOKENS),
+        ("answer", candidate_answer, ANSWER_TOKENS),
+        ("summary", summary or "", SUMMARY_TOKEN_BUDGET),
+    ], budget)
+
+
+def _one_line(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def update_summary(summary: str | None, question: str, answer: str) -> str:
+    """``summary`` with one more question/answer turn folded in.
+
+    Each turn becomes a clipped ``Q:``/``A:`` line; the oldest lines are
+    dropped once the summary exceeds ``SUMMARY_TOKEN_BUDGET``.
+    """
+    line = (
+        f"Q: {truncate_to_tokens(_one_line(question), SUMMARY_QUESTION_TOKENS)} "
+        f"A: {truncate_to_tokens(_one_line(answer), SUMMARY_ANSWER_TOKENS)}"
+    )
+    lines = [l for l in (summary or "").split("\n") if l] + [line]
+    while len(lines) > 1 and count_tokens("\n".join(lines)) > SUMMARY_TOKEN_BUDGET:
+        lines.pop(0)
+    return "\n".join(lines)
@@ -1,38 +1,6 @@
-import os
-
-try:
-    from groq import Groq
-    _GROQ_AVAILABLE = True
-except Exception:
-    Groq = None
-    _GROQ_AVAILABLE = False
-
-_client = None
-
-
-def _get_client():
-    global _client
-    if not _GROQ_AVAILABLE:
-        raise RuntimeError("groq package not available")
-
-    if _client is None:
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise RuntimeError("GROQ_API_KEY environment variable is not set")
-        _client = Groq(api_key=api_key)
-
-    return _client
+# Kept for existing imports; the client lives in app.utils.ai.llm_provider
+from app.utils.ai.llm_provider import _GROQ_AVAILABLE, _get_client, complete  # noqa: F401
 
 
 def generate_text(prompt: str) -> str:
-    client = _get_client()
-    response = client.chat.completions.create(
-        model="llama-3.1-8b-instant",
-        messages=[
-            {"role": "system", "content": "You are a helpful AI assistant."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.3,
-        max_tokens=500
-    )
-    return response.choices[0].message.content
+    return complete("You are a helpful AI assistant.", prompt, temperature=0.3, max_tokens=500)
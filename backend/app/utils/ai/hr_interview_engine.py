@@ -1,27 +1,9 @@
-import os
-
-try:
-    from groq import Groq
-    _GROQ_AVAILABLE = True
-except Exception:
-    Groq = None
-    _GROQ_AVAILABLE = False
-
-_client = None
-
-
-def _get_client():
-    global _client
-    if not _GROQ_AVAILABLE:
-        raise RuntimeError("groq package not available")
-    
-    if _client is None:
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise RuntimeError("GROQ_API_KEY not set")
-        _client = Groq(api_key=api_key)
-    
-    return _client
+from typing import Iterator
+
+from app.utils.ai.llm_provider import _GROQ_AVAILABLE, _get_client, complete, stream_complete  # noqa: F401
+from app.utils.ai.conversation_context import CONTEXT_TOKEN_BUDGET, fit_documents, followup_context
+from app.utils.ai.response_cache import ResponseCache, prompt_key
+from app.utils.near_dup import NearDuplicateCache
 
 HR_SYSTEM_PROMPT = """
 You are an experienced HR interviewer conducting a behavioral interview for a job position.
@@ -41,6 +23,10 @@ Rules:
 - No technical jargon unless specifically relevant.
 """
 
+# Opening questions depend only on their prompt; near-identical JDs share
+# them too when the prompt has no resume (see _opening_similar)
+hr_opening_cache = ResponseCache("hr_opening", near=NearDuplicateCache())
+
 def _get_beginner_hr_prompt():
     """Beginner level HR interview prompt guidelines."""
     return """
@@ -80,8 +66,23 @@ Focus on leadership, ownership, and strategic thinking:
 Ask challenging questions expecting mature thinking, strategic approach, and demonstration of leadership qualities.
 """
 
-def generate_hr_opening_question(resume_text: str, jd_text: str, level: str = "beginner") -> str:
-    """Generate the opening HR interview question based on resume and JD."""
+def _opening_similar(resume_text: str, jd_text: str, level: str) -> tuple | None:
+    """Near-duplicate key for an opening question, or None for exact match only.
+
+    HR openings are drawn from the resume, so with one the question is only
+    reused for the identical prompt (see interview_engine._opening_similar).
+    """
+    if resume_text:
+        return None
+    return prompt_key(HR_SYSTEM_PROMPT, level, 0.6, 250), {"jd": jd_text}
+
+
+def _hr_session_prefix(resume_text: str, jd_text: str, level: str, budget: int = CONTEXT_TOKEN_BUDGET) -> str:
+    """The start of every prompt in an HR session, identical on every turn.
+
+    Opening and follow-up prompts are this plus the turn, so the provider
+    can serve the shared part from its prompt cache.
+    """
     level_guidelines = ""
     if level == "intermediate":
         level_guidelines = _get_intermediate_hr_prompt()
@@ -89,66 +90,57 @@ def generate_hr_opening_question(resume_text: str, jd_text: str, level: str = "b
         level_guidelines = _get_advanced_hr_prompt()
     else:
         level_guidelines = _get_beginner_hr_prompt()
-    
-    prompt = f"""
+
+    documents = fit_documents(resume_text, jd_text, budget)
+
+    return f"""
 {level_guidelines}
 
 Candidate Resume:
-{resume_text}
+{documents['resume']}
 
 Job Description:
-{jd_text}
+{documents['jd']}
+"""
+
 
+def _hr_opening_turn(level: str) -> str:
+    return f"""
 Start an HR/behavioral interview at {level} level naturally. Ask the candidate an opening question to understand them better. Keep it warm and conversational. This should be an appropriate ice-breaker for the {level} level.
 """
 
+
+def generate_hr_opening_question(resume_text: str, jd_text: str, level: str = "beginner") -> str:
+    """Generate the opening HR interview question based on resume and JD."""
+    prefix = _hr_session_prefix(resume_text, jd_text, level)
+    prompt = prefix + _hr_opening_turn(level)
+
     try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": HR_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.6,
-            max_tokens=250
+        return hr_opening_cache.get_or_generate(
+            prompt_key(HR_SYSTEM_PROMPT, prompt, 0.6, 250),
+            lambda: complete(HR_SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=250, prefix=prefix).strip(),
+            similar=_opening_similar(resume_text, jd_text, level)
         )
-
-        return response.choices[0].message.content.strip()
     except Exception as e:
         raise RuntimeError(f"AI unavailable: {e}")
 
 
-def evaluate_and_followup_hr(
+def _hr_followup_turn(
     previous_question: str,
     candidate_answer: str,
-    resume_text: str,
-    jd_text: str,
-    level: str = "beginner"
+    level: str,
+    summary: str = "",
+    budget: int = CONTEXT_TOKEN_BUDGET
 ) -> str:
-    """Generate a follow-up HR question based on candidate's answer."""
-    level_guidelines = ""
-    if level == "intermediate":
-        level_guidelines = _get_intermediate_hr_prompt()
-    elif level == "advanced":
-        level_guidelines = _get_advanced_hr_prompt()
-    else:
-        level_guidelines = _get_beginner_hr_prompt()
-    
-    prompt = f"""
-{level_guidelines}
+    context = followup_context(previous_question, candidate_answer, summary, budget)
+    earlier = f"\nEarlier in this interview:\n{context['summary']}\n" if context["summary"] else ""
 
+    return f"""{earlier}
 Previous question:
-{previous_question}
+{context['question']}
 
 Candidate answer:
-{candidate_answer}
-
-Candidate Resume:
-{resume_text}
-
-Job Description:
-{jd_text}
+{context['answer']}
 
 Evaluate the answer naturally. Ask a thoughtful follow-up question to understand the candidate better at {level} level. Focus on:
 - Communication clarity
@@ -161,19 +153,36 @@ Evaluate the answer naturally. Ask a thoughtful follow-up question to understand
 Keep the conversation flowing naturally. Ask ONE follow-up question.
 """
 
-    try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": HR_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.6,
-            max_tokens=300
-        )
 
-        return response.choices[0].message.content.strip()
+def _hr_followup_prompt(
+    previous_question: str,
+    candidate_answer: str,
+    resume_text: str,
+    jd_text: str,
+    level: str,
+    summary: str = "",
+    budget: int = CONTEXT_TOKEN_BUDGET
+) -> str:
+    return (
+        _hr_session_prefix(resume_text, jd_text, level, budget)
+        + _hr_followup_turn(previous_question, candidate_answer, level, summary, budget)
+    )
+
+
+def evaluate_and_followup_hr(
+    previous_question: str,
+    candidate_answer: str,
+    resume_text: str,
+    jd_text: str,
+    level: str = "beginner",
+    summary: str = ""
+) -> str:
+    """Generate a follow-up HR question based on candidate's answer."""
+    prefix = _hr_session_prefix(resume_text, jd_text, level)
+    prompt = prefix + _hr_followup_turn(previous_question, candidate_answer, level, summary)
+
+    try:
+        return complete(HR_SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=300, prefix=prefix).strip()
     except Exception as e:
         raise RuntimeError(f"AI unavailable: {e}")
 
@@ -184,15 +193,20 @@ def generate_hr_question(
     previous_question: str | None = None,
     user_answer: str | None = None,
     resume_text: str = "",
+    summary: str = "",
 ) -> str:
-    """Wrapper for interview_api route compatibility - HR interview."""
+    """Wrapper for interview_api route compatibility - HR interview.
+
+    ``summary`` is the session's rolling summary of its earlier turns.
+    """
     if previous_question and user_answer:
         return evaluate_and_followup_hr(
             previous_question=previous_question,
             candidate_answer=user_answer,
             resume_text=resume_text,
             jd_text=job_description,
-            level=level
+            level=level,
+            summary=summary
         )
     else:
         return generate_hr_opening_question(
@@ -200,3 +214,24 @@ def generate_hr_question(
             jd_text=job_description,
             level=level
         )
+
+
+def stream_hr_question(
+    job_description: str,
+    level: str = "beginner",
+    previous_question: str | None = None,
+    user_answer: str | None = None,
+    resume_text: str = "",
+    summary: str = "",
+) -> Iterator[str]:
+    """``generate_hr_question`` yielding the reply in pieces as it is generated."""
+    prefix = _hr_session_prefix(resume_text, job_description, level)
+    if previous_question and user_answer:
+        prompt = prefix + _hr_followup_turn(previous_question, user_answer, level, summary)
+        return stream_complete(HR_SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=300, prefix=prefix)
+    prompt = prefix + _hr_opening_turn(level)
+    return hr_opening_cache.stream(
+        prompt_key(HR_SYSTEM_PROMPT, prompt, 0.6, 250),
+        lambda: stream_complete(HR_SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=250, prefix=prefix),
+        similar=_opening_similar(resume_text, job_description, level)
+    )
@@ -1,27 +1,9 @@
-import os
-
-try:
-    from groq import Groq
-    _GROQ_AVAILABLE = True
-except Exception:
-    Groq = None
-    _GROQ_AVAILABLE = False
-
-_client = None
-
-
-def _get_client():
-    global _client
-    if not _GROQ_AVAILABLE:
-        raise RuntimeError("groq package not available")
-    
-    if _client is None:
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise RuntimeError("GROQ_API_KEY not set")
-        _client = Groq(api_key=api_key)
-    
-    return _client
+from typing import Iterator
+
+from app.utils.ai.llm_provider import _GROQ_AVAILABLE, _get_client, complete, stream_complete  # noqa: F401
+from app.utils.ai.conversation_context import CONTEXT_TOKEN_BUDGET, fit_documents, followup_context
+from app.utils.ai.response_cache import ResponseCache, prompt_key
+from app.utils.near_dup import NearDuplicateCache
 
 SYSTEM_PROMPT = """
 You are a strict senior technical interviewer at a top product company.
@@ -42,6 +24,10 @@ IMPORTANT RULES:
 - Follow up with deeper questions based on their understanding level.
 """
 
+# Opening questions depend only on their prompt; near-identical JDs share
+# them too when the prompt has no resume (see _opening_similar)
+opening_cache = ResponseCache("interview_opening", near=NearDuplicateCache())
+
 def _get_beginner_prompt():
     """Beginner level interview prompt guidelines - Technical Concepts."""
     return """
@@ -82,7 +68,25 @@ ADVANCED LEVEL: Ask questions about:
 Ask challenging questions expecting deep, production-grade understanding of complex systems.
 """
 
-def generate_interview_question(resume_text: str, jd_text: str, level: str = "beginner") -> str:
+def _opening_similar(resume_text: str, jd_text: str, level: str) -> tuple | None:
+    """Near-duplicate key for an opening question, or None for exact match only.
+
+    A long JD outweighs a short resume in one signature, so two people's
+    resumes with the same JD look near-identical. A question built from a
+    resume must never reach someone else: only resume-less prompts are
+    shared between near-identical JDs.
+    """
+    if resume_text:
+        return None
+    return prompt_key(SYSTEM_PROMPT, level, 0.6, 300), {"jd": jd_text}
+
+
+def _session_prefix(resume_text: str, jd_text: str, level: str, budget: int = CONTEXT_TOKEN_BUDGET) -> str:
+    """The start of every prompt in a session, identical on every turn.
+
+    Opening and follow-up prompts are this plus the turn, so the provider
+    can serve the shared part from its prompt cache.
+    """
     level_guidelines = ""
     if level == "intermediate":
         level_guidelines = _get_intermediate_prompt()
@@ -90,85 +94,92 @@ def generate_interview_question(resume_text: str, jd_text: str, level: str = "be
         level_guidelines = _get_advanced_prompt()
     else:
         level_guidelines = _get_beginner_prompt()
-    
-    prompt = f"""
+
+    documents = fit_documents(resume_text, jd_text, budget)
+
+    return f"""
 {level_guidelines}
 
 Candidate Resume:
-{resume_text}
+{documents['resume']}
 
 Job Description:
-{jd_text}
+{documents['jd']}
+"""
 
+
+def _opening_turn(level: str) -> str:
+    return f"""
 Start a programming interview at {level} level.
 Begin with an appropriate DSA or logic question for this difficulty level.
 """
 
+
+def generate_interview_question(resume_text: str, jd_text: str, level: str = "beginner") -> str:
+    prefix = _session_prefix(resume_text, jd_text, level)
+    prompt = prefix + _opening_turn(level)
+
     try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.6,
-            max_tokens=300
+        return opening_cache.get_or_generate(
+            prompt_key(SYSTEM_PROMPT, prompt, 0.6, 300),
+            lambda: complete(SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=300, prefix=prefix).strip(),
+            similar=_opening_similar(resume_text, jd_text, level)
         )
-
-        return response.choices[0].message.content.strip()
     except Exception as e:
         raise RuntimeError(f"AI unavailable: {e}")
 
 
-def evaluate_and_followup(
+def _followup_turn(
     previous_question: str,
     candidate_answer: str,
-    resume_text: str,
-    jd_text: str,
-    level: str = "beginner"
+    level: str,
+    summary: str = "",
+    budget: int = CONTEXT_TOKEN_BUDGET
 ) -> str:
-    level_guidelines = ""
-    if level == "intermediate":
-        level_guidelines = _get_intermediate_prompt()
-    elif level == "advanced":
-        level_guidelines = _get_advanced_prompt()
-    else:
-        level_guidelines = _get_beginner_prompt()
-    
-    prompt = f"""
-{level_guidelines}
+    context = followup_context(previous_question, candidate_answer, summary, budget)
+    earlier = f"\nEarlier in this interview:\n{context['summary']}\n" if context["summary"] else ""
 
+    return f"""{earlier}
 Previous question:
-{previous_question}
+{context['question']}
 
 Candidate answer:
-{candidate_answer}
-
-Candidate Resume:
-{resume_text}
-
-Job Description:
-{jd_text}
+{context['answer']}
 
 Evaluate the answer.
 Respond naturally.
 Ask the next programming question or follow-up at {level} difficulty level.
 """
 
-    try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.6,
-            max_tokens=350
-        )
 
-        return response.choices[0].message.content.strip()
+def _followup_prompt(
+    previous_question: str,
+    candidate_answer: str,
+    resume_text: str,
+    jd_text: str,
+    level: str,
+    summary: str = "",
+    budget: int = CONTEXT_TOKEN_BUDGET
+) -> str:
+    return (
+        _session_prefix(resume_text, jd_text, level, budget)
+        + _followup_turn(previous_question, candidate_answer, level, summary, budget)
+    )
+
+
+def evaluate_and_followup(
+    previous_question: str,
+    candidate_answer: str,
+    resume_text: str,
+    jd_text: str,
+    level: str = "beginner",
+    summary: str = ""
+) -> str:
+    prefix = _session_prefix(resume_text, jd_text, level)
+    prompt = prefix + _followup_turn(previous_question, candidate_answer, level, summary)
+
+    try:
+        return complete(SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=350, prefix=prefix).strip()
     except Exception as e:
         raise RuntimeError(f"AI unavailable: {e}")
 
@@ -178,15 +189,20 @@ def generate_question(
     level: str = "beginner",
     previous_question: str | None = None,
     user_answer: str | None = None,
+    summary: str = "",
 ) -> str:
-    """Wrapper for interview_api route compatibility."""
+    """Wrapper for interview_api route compatibility.
+
+    ``summary`` is the session's rolling summary of its earlier turns.
+    """
     if previous_question and user_answer:
         return evaluate_and_followup(
             previous_question=previous_question,
             candidate_answer=user_answer,
             resume_text="",
             jd_text=job_description,
-            level=level
+            level=level,
+            summary=summary
         )
     else:
         return generate_interview_question(
@@ -194,3 +210,23 @@ def generate_question(
             jd_text=job_description,
             level=level
         )
+
+
+def stream_question(
+    job_description: str,
+    level: str = "beginner",
+    previous_question: str | None = None,
+    user_answer: str | None = None,
+    summary: str = "",
+) -> Iterator[str]:
+    """``generate_question`` yielding the reply in pieces as it is generated."""
+    prefix = _session_prefix("", job_description, level)
+    if previous_question and user_answer:
+        prompt = prefix + _followup_turn(previous_question, user_answer, level, summary)
+        return stream_complete(SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=350, prefix=prefix)
+    prompt = prefix + _opening_turn(level)
+    return opening_cache.stream(
+        prompt_key(SYSTEM_PROMPT, prompt, 0.6, 300),
+        lambda: stream_complete(SYSTEM_PROMPT, prompt, temperature=0.6, max_tokens=300, prefix=prefix),
+        similar=_opening_similar("", job_description, level)
+    )
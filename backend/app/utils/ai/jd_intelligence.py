@@ -1,8 +1,10 @@
-import os
-from app.utils.ai.groq_client import _get_client
+from app.utils.ai.llm_provider import complete
 
 print(">>> JD INTELLIGENCE (GROQ) LOADED <<<")
 
+# Returned text starts with this when the provider call failed
+AI_UNAVAILABLE = "AI unavailable: "
+
 
 def generate_jd_ai_explanation(resume_text: str, jd_text: str, analysis: dict) -> str:
     prompt = f"""
@@ -29,18 +31,7 @@ Use simple bullet points.
 """
 
     try:
-        client = _get_client()
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": "You are a professional career advisor."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content
+        return complete("You are a professional career advisor.", prompt, temperature=0.3, max_tokens=600)
     except Exception as e:
         # Surface a clear message without crashing import-time
-        return f"AI unavailable: {e}"
+        return f"{AI_UNAVAILABLE}{e}"
@@ -0,0 +1,341 @@
+"""
+The one place that talks to the LLM provider (Groq).
+
+Every engine goes through ``complete()``. The client is created once per
+process under a lock and shares a keep-alive httpx pool, so concurrent
+requests reuse connections instead of opening one each.
+
+Each call has a deadline (``LLM_TIMEOUT_SECONDS`` unless given), cut short
+by any request-wide deadline set with ``llm_deadline()``. Rate limits
+(429), server errors (5xx), timeouts and dropped connections are retried
+with jittered exponential backoff until the deadline or ``LLM_MAX_ATTEMPTS``
+runs out; other errors fail at once. The SDK's own retries are turned off so
+they do not stack with these.
+
+A per-process circuit breaker (``breaker``) watches failures and latency;
+while it is open calls raise ``CircuitOpenError`` at once and routes guarded
+by ``require_llm`` answer 503 without doing any work.
+
+Identical concurrent calls (same model, prompt and settings, e.g. a
+double-clicked submit) are coalesced: the first caller makes the request and
+the others wait for and share its result, or its error.
+
+``stream_complete()`` yields the reply as it is generated. Only opening the
+stream is retried; once text has been handed out a failure is raised.
+
+Callers that keep the start of their prompt fixed pass it as ``prefix``; it
+is not sent separately, only hashed and counted (see ``prompt_prefix``) to
+show how much of each prompt the provider could serve from its cache.
+"""
+import hashlib
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import httpx
+from fastapi import HTTPException
+from tenacity import (
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_before_delay,
+    wait_random_exponential,
+)
+
+from app.utils import metrics
+from app.utils.ai.circuit_breaker import CircuitBreaker, CircuitOpenError  # noqa: F401
+from app.utils.ai.prompt_prefix import record_prefix, record_usage
+
+try:
+    from groq import Groq, APIConnectionError, APIStatusError
+    _GROQ_AVAILABLE = True
+except Exception:
+    Groq = None
+    _GROQ_AVAILABLE = False
+
+GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
+
+LLM_TIMEOUT_SECONDS = float(os.getenv("SKILLIO_LLM_TIMEOUT_SECONDS", "30"))
+LLM_MAX_ATTEMPTS = int(os.getenv("SKILLIO_LLM_MAX_ATTEMPTS", "3"))
+LLM_MAX_CONNECTIONS = int(os.getenv("SKILLIO_LLM_MAX_CONNECTIONS", "20"))
+# Never wait longer than this between attempts
+LLM_MAX_BACKOFF_SECONDS = 8
+
+_client = None
+_client_lock = threading.Lock()
+
+_in_flight: dict = {}
+_in_flight_lock = threading.Lock()
+
+breaker = CircuitBreaker("groq")
+
+_request_deadline: ContextVar[float | None] = ContextVar("llm_request_deadline", default=None)
+
+llm_requests = metrics.counter(
+    "skillio_llm_requests_total", "LLM completions by outcome (ok, error or cancelled)"
+)
+llm_retries = metrics.counter(
+    "skillio_llm_retries_total", "LLM attempts retried after a transient error"
+)
+llm_coalesced = metrics.counter(
+    "skillio_llm_coalesced_total", "LLM calls served by an identical call already in flight"
+)
+llm_duration = metrics.summary(
+    "skillio_llm_request_duration_seconds", "Wall time of LLM completions, retries included"
+)
+
+
+def _get_client():
+    global _client
+    if not _GROQ_AVAILABLE:
+        raise RuntimeError("groq package not available")
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    raise RuntimeError("GROQ_API_KEY not set")
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                    ),
+                    timeout=LLM_TIMEOUT_SECONDS,
+                )
+                _client = Groq(api_key=api_key, http_client=http_client, max_retries=0)
+
+    return _client
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if not _GROQ_AVAILABLE:
+        return False
+    if isinstance(exc, APIStatusError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    # Includes APITimeoutError
+    return isinstance(exc, APIConnectionError)
+
+
+def _trips_breaker(exc: BaseException) -> bool:
+    # Client errors (400, 401...) say nothing about the provider's health
+    return _is_retryable(exc) or isinstance(exc, TimeoutError)
+
+
+def require_llm() -> None:
+    """Route dependency: 503 right away while the circuit breaker is open."""
+    retry_after = breaker.retry_after()
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=503,
+            detail="AI service is temporarily unavailable. Please try again shortly.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def is_unavailable(exc: BaseException) -> bool:
+    """Whether ``exc`` (or what it wraps) means the provider is down, slow or shedding load."""
+    while exc is not None:
+        if isinstance(exc, CircuitOpenError) or _trips_breaker(exc):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+@contextmanager
+def llm_deadline(seconds: float):
+    """Give every LLM call made in this block at most ``seconds`` from now, retries included.
+
+    Nested blocks can only shorten the deadline. It follows contextvars,
+    so it covers the current thread or task only.
+    """
+    deadline = time.monotonic() + seconds
+    current = _request_deadline.get()
+    token = _request_deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def _call_budget(timeout: float | None) -> float:
+    budget = timeout or LLM_TIMEOUT_SECONDS
+    request_deadline = _request_deadline.get()
+    if request_deadline is not None:
+        budget = min(budget, request_deadline - time.monotonic())
+    if budget <= 0:
+        raise TimeoutError("Request deadline reached before the LLM call")
+    return budget
+
+
+def _count_retry(retry_state) -> None:
+    llm_retries.inc()
+
+
+def _retrying(budget: float) -> Retrying:
+    return Retrying(
+        # Gives up rather than sleep past the deadline
+        stop=stop_after_attempt(LLM_MAX_ATTEMPTS) | stop_before_delay(budget),
+        wait=wait_random_exponential(multiplier=0.5, max=LLM_MAX_BACKOFF_SECONDS),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=_count_retry,
+        reraise=True,
+    )
+
+
+def _create(client, deadline: float, budget: float, **kwargs):
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError(f"LLM deadline of {budget:.0f}s exceeded")
+    return client.chat.completions.create(model=GROQ_MODEL, timeout=remaining, **kwargs)
+
+
+def _messages(system: str, prompt: str) -> list:
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _flight_key(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def _single_flight(key: str, call, timeout: float):
+    """Run ``call()``, or wait up to ``timeout`` for the identical call already running."""
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+    if not leader:
+        llm_coalesced.inc()
+        # Raises TimeoutError if this caller's deadline is the shorter one
+        return future.result(timeout=timeout)
+
+    try:
+        result = call()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+
+def complete(
+    system: str,
+    prompt: str,
+    temperature: float = 0.6,
+    max_tokens: int = 300,
+    timeout: float | None = None,
+    prefix: str = "",
+) -> str:
+    """One chat completion; returns the reply text (unstripped).
+
+    ``timeout`` bounds the whole call, retries and backoff included. Raises
+    ``CircuitOpenError`` without calling out while the breaker is open.
+    ``prefix`` is the leading part of ``prompt`` shared with other calls.
+    """
+    budget = _call_budget(timeout)
+    key = _flight_key(GROQ_MODEL, system, prompt, temperature, max_tokens)
+    return _single_flight(key, lambda: _complete(system, prompt, temperature, max_tokens, budget, prefix), budget)
+
+
+def _complete(system: str, prompt: str, temperature: float, max_tokens: int, budget: float, prefix: str) -> str:
+    client = _get_client()
+    deadline = time.monotonic() + budget
+
+    def attempt() -> str:
+        response = _create(
+            client, deadline, budget,
+            messages=_messages(system, prompt),
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        record_usage(response)
+        return response.choices[0].message.content
+
+    breaker.before_call()
+    record_prefix(system, prompt, prefix)
+    started = time.perf_counter()
+    failed = False
+    try:
+        text = _retrying(budget)(attempt)
+    except Exception as e:
+        failed = _trips_breaker(e)
+        llm_requests.inc(outcome="error")
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        llm_duration.observe(elapsed)
+        breaker.record(failed, elapsed)
+    llm_requests.inc(outcome="ok")
+    return text
+
+
+def stream_complete(
+    system: str,
+    prompt: str,
+    temperature: float = 0.6,
+    max_tokens: int = 300,
+    timeout: float | None = None,
+    prefix: str = "",
+) -> Iterator[str]:
+    """``complete()`` as a generator of text pieces, yielded as they arrive.
+
+    Closing the generator early closes the upstream response, so an
+    abandoned stream stops generating (and billing) tokens.
+    """
+    client = _get_client()
+    budget = _call_budget(timeout)
+    deadline = time.monotonic() + budget
+
+    breaker.before_call()
+    record_prefix(system, prompt, prefix)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        # The breaker judges how long the stream took to open, not how long
+        # the reply took to generate
+        try:
+            stream = _retrying(budget)(
+                _create, client, deadline, budget,
+                messages=_messages(system, prompt),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+        except Exception as e:
+            breaker.record(_trips_breaker(e), time.perf_counter() - started)
+            raise
+        breaker.record(False, time.perf_counter() - started)
+        try:
+            for chunk in stream:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"LLM deadline of {budget:.0f}s exceeded")
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+            outcome = "ok"
+        finally:
+            stream.close()
+    except GeneratorExit:
+        # The caller went away; neither a success nor a provider error
+        outcome = "cancelled"
+        raise
+    finally:
+        llm_requests.inc(outcome=outcome)
+        llm_duration.observe(time.perf_counter() - started)
@@ -0,0 +1,87 @@
+"""
+Instrumentation for provider-side prompt caching.
+
+Providers that cache prompts reuse work only for a byte-identical prefix of
+the messages. The interview engines therefore put everything that is fixed
+for a session first (system prompt, level guidelines, resume and JD) and the
+turn last, and pass that stable part to ``complete()`` as ``prefix``.
+
+``record_prefix`` hashes system prompt + prefix and counts whether this
+process sent the same prefix within ``PREFIX_WINDOW_SECONDS``, i.e. whether
+the provider had a chance to serve it from cache, along with how many prompt
+tokens that covers. Where the provider reports cached prompt tokens in its
+usage data, ``record_usage`` counts those too, so the estimate can be
+checked against what was actually reused.
+"""
+import hashlib
+import os
+
+from app.utils import metrics
+from app.utils.cache import TTLCache
+from app.utils.ai.conversation_context import count_tokens
+
+# Roughly how long providers keep an unused prefix cached
+PREFIX_WINDOW_SECONDS = 600
+PREFIX_WINDOW_MAXSIZE = 4096
+# Print the hash of every prefix sent, to follow individual sessions
+LOG_PROMPT_PREFIX = os.getenv("SKILLIO_LOG_PROMPT_PREFIX", "0") == "1"
+
+_recent = TTLCache(maxsize=PREFIX_WINDOW_MAXSIZE, ttl=PREFIX_WINDOW_SECONDS)
+
+prefix_requests = metrics.counter(
+    "skillio_llm_prompt_prefix_total",
+    "LLM calls by whether their prompt prefix was sent recently (repeat) or not (new)"
+)
+prefix_tokens = metrics.counter(
+    "skillio_llm_prompt_prefix_tokens_total",
+    "Estimated prompt tokens in the stable prefix of LLM calls, by repeat or new"
+)
+prompt_tokens = metrics.counter(
+    "skillio_llm_prompt_tokens_total", "Estimated prompt tokens sent to the LLM, prefix included"
+)
+provider_prompt_tokens = metrics.counter(
+    "skillio_llm_provider_prompt_tokens_total", "Prompt tokens reported by the provider"
+)
+provider_cached_tokens = metrics.counter(
+    "skillio_llm_provider_cached_tokens_total", "Prompt tokens the provider reports serving from its cache"
+)
+
+
+def prefix_hash(system: str, prefix: str) -> str:
+    digest = hashlib.sha256(system.encode("utf-8"))
+    digest.update(b"\x1f")
+    digest.update(prefix.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def record_prefix(system: str, prompt: str, prefix: str = "") -> str:
+    """Count one call's prefix and prompt tokens; returns the prefix hash.
+
+    ``prefix`` is the leading part of ``prompt`` that stays the same across
+    calls; without one (or if the prompt does not start with it) the system
+    prompt alone is counted as the prefix.
+    """
+    if not prompt.startswith(prefix):
+        prefix = ""
+    key = prefix_hash(system, prefix)
+    result = "repeat" if _recent.get(key) else "new"
+    _recent.set(key, True)
+
+    stable = count_tokens(system) + count_tokens(prefix)
+    prefix_requests.inc(result=result)
+    prefix_tokens.inc(stable, result=result)
+    prompt_tokens.inc(stable + count_tokens(prompt[len(prefix):]))
+    if LOG_PROMPT_PREFIX:
+        print(f"[llm] prompt prefix {key} ({stable} tokens, {result})")
+    return key
+
+
+def record_usage(response) -> None:
+    """Count the prompt and cached tokens a non-streamed response reports, if any."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    provider_prompt_tokens.inc(getattr(usage, "prompt_tokens", 0) or 0)
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0) if details is not None else 0
+    provider_cached_tokens.inc(cached or 0)
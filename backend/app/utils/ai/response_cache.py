@@ -0,0 +1,152 @@
+"""
+Exact-match cache for LLM replies that depend only on their prompt.
+
+Opening questions are fully determined by the prompt (mode, level, JD,
+resume), so repeated session starts with the same inputs can skip the LLM.
+To keep questions varied, each key holds a pool of up to ``variants``
+replies: until the pool is full every lookup is a miss that generates and
+adds a new one; after that a random variant is served.
+
+Keys are SHA-256 hashes of ``PROMPT_VERSION`` plus the full request, so no
+prompt text (resumes, JDs) is kept in memory, and changing the prompts
+(bump ``PROMPT_VERSION``) never serves replies generated for the old ones.
+Per-process like every ``TTLCache``.
+
+With a ``NearDuplicateCache`` attached, an exact miss can still be served
+from the full pool of a near-identical prompt (see ``app.utils.near_dup``).
+"""
+import hashlib
+import os
+import random
+import threading
+from typing import Callable, Iterator
+
+from app.utils import metrics
+from app.utils.cache import TTLCache
+from app.utils.near_dup import NearDuplicateCache
+
+# Bump whenever a cached prompt or its generation settings change
+PROMPT_VERSION = "1"
+
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("SKILLIO_RESPONSE_CACHE_TTL_SECONDS", "3600"))
+# 0 turns the cache off
+RESPONSE_CACHE_VARIANTS = int(os.getenv("SKILLIO_RESPONSE_CACHE_VARIANTS", "3"))
+RESPONSE_CACHE_MAXSIZE = 2048
+
+cache_requests = metrics.counter(
+    "skillio_llm_cache_requests_total", "LLM response cache lookups by cache and result (hit, near_hit or miss)"
+)
+cache_hit_ratio = metrics.gauge(
+    "skillio_llm_cache_hit_ratio", "Share of LLM response cache lookups served from the cache"
+)
+
+_lookups: dict = {}
+_lookups_lock = threading.Lock()
+
+
+def record_lookup(cache: str, result: str) -> None:
+    """Count a lookup of ``cache`` as ``hit``, ``near_hit`` or ``miss``."""
+    cache_requests.inc(cache=cache, result=result)
+    with _lookups_lock:
+        hits, total = _lookups.get(cache, (0, 0))
+        hits += result != "miss"
+        total += 1
+        _lookups[cache] = (hits, total)
+    cache_hit_ratio.set(hits / total, cache=cache)
+
+
+def prompt_key(*parts) -> str:
+    """Hash of the prompt version and every input that shapes the reply."""
+    digest = hashlib.sha256(PROMPT_VERSION.encode())
+    for part in parts:
+        digest.update(b"\x1f")
+        digest.update(str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Pools of up to ``variants`` replies per prompt key, with TTL and LRU eviction.
+
+    ``similar`` arguments are ``(namespace, fields)`` for the attached
+    ``near`` cache: the parts of the prompt that must match exactly, and the
+    texts (JD, resume) that only need to be near-identical.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        variants: int = RESPONSE_CACHE_VARIANTS,
+        maxsize: int = RESPONSE_CACHE_MAXSIZE,
+        ttl: float = RESPONSE_CACHE_TTL_SECONDS,
+        near: NearDuplicateCache | None = None,
+    ):
+        self.name = name
+        self.variants = variants
+        self.near = near
+        self._pools = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def lookup(self, key: str, similar: tuple | None = None) -> str | None:
+        """A random cached variant once the key's pool is full, else None."""
+        if self.variants <= 0:
+            return None
+        pool = self._pools.get(key, ())
+        result = "hit" if len(pool) >= self.variants else "miss"
+        if result == "miss" and similar is not None and self.near is not None:
+            found = self.near.find(*similar)
+            if found is not None:
+                near_pool = self._pools.get(found[0], ())
+                if len(near_pool) >= self.variants:
+                    pool, result = near_pool, "near_hit"
+        record_lookup(self.name, result)
+        return random.choice(pool) if result != "miss" else None
+
+    def add(self, key: str, text: str, similar: tuple | None = None) -> None:
+        if self.variants <= 0 or not text:
+            return
+        pool = self._pools.get(key, ())
+        # A concurrent miss may have filled it meanwhile; losing a variant
+        # to that race only costs one more miss later
+        if len(pool) < self.variants:
+            pool += (text,)
+            self._pools.set(key, pool)
+            # Indexed once, when the pool becomes servable
+            if len(pool) == self.variants and similar is not None and self.near is not None:
+                namespace, fields = similar
+                self.near.add(namespace, fields, key)
+
+    def get_or_generate(self, key: str, generate: Callable[[], str], similar: tuple | None = None) -> str:
+        text = self.lookup(key, similar)
+        if text is None:
+            text = generate()
+            self.add(key, text, similar)
+        return text
+
+    def stream(
+        self,
+        key: str,
+        make_stream: Callable[[], Iterator[str]],
+        similar: tuple | None = None,
+    ) -> Iterator[str]:
+        """``get_or_generate`` for token streams: a hit is yielded in one piece.
+
+        A streamed reply is only added once it has been read to the end.
+        """
+        text = self.lookup(key, similar)
+        if text is not None:
+            yield text
+            return
+        parts = []
+        stream = make_stream()
+        try:
+            for piece in stream:
+                parts.append(piece)
+                yield piece
+        finally:
+            # Closes the upstream response too when the reader stops early
+            stream.close()
+        self.add(key, "".join(parts).strip(), similar)
+
+    def clear(self) -> None:
+        self._pools.clear()
+        if self.near is not None:
+            self.near.clear()
@@ -0,0 +1,93 @@
+"""
+Write and aggregate helpers for the normalized analysis_skill table.
+"""
+from typing import Dict, Iterable, List
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.analysis import AnalysisHistory
+from app.models.analysis_skill import Skill, AnalysisSkill
+
+MATCHED = "matched"
+MISSING = "missing"
+
+
+def split_skills(joined: str | None) -> List[str]:
+    """Split the legacy comma-joined skill column into clean names."""
+    if not joined:
+        return []
+    return [s.strip() for s in joined.split(",") if s.strip()]
+
+
+def get_skill_ids(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Map skill names to ids, creating any that do not exist yet."""
+    names = sorted({n.strip().lower() for n in names if n and n.strip()})
+    if not names:
+        return {}
+    db.execute(
+        sqlite_insert(Skill)
+        .values([{"name": n} for n in names])
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    return dict(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(names))).all())
+
+
+def record_analysis_skills(
+    db: Session,
+    analysis_id: int,
+    matched: Iterable[str],
+    missing: Iterable[str]
+) -> None:
+    """Stage analysis_skill rows for one analysis; the caller commits."""
+    matched = [m.strip().lower() for m in matched]
+    missing = [m.strip().lower() for m in missing]
+    ids = get_skill_ids(db, matched + missing)
+
+    rows = {}
+    for name in missing:
+        if name in ids:
+            rows[ids[name]] = MISSING
+    # A skill listed on both sides counts as matched
+    for name in matched:
+        if name in ids:
+            rows[ids[name]] = MATCHED
+    if rows:
+        db.execute(
+            sqlite_insert(AnalysisSkill)
+            .values([
+                {"analysis_id": analysis_id, "skill_id": skill_id, "status": status}
+                for skill_id, status in rows.items()
+            ])
+            .on_conflict_do_nothing()
+        )
+
+
+def skill_frequency_query(status: str, user_id: int, limit: int = 20):
+    """Statements for one user's most frequent skills with the given status.
+
+    Returns ``(counts_stmt, total_stmt)`` so both sync and async sessions can
+    run them; the grouping happens in SQL.
+    """
+    stmt = (
+        select(Skill.name, func.count().label("count"))
+        .select_from(AnalysisSkill)
+        .join(Skill, Skill.id == AnalysisSkill.skill_id)
+        .join(AnalysisHistory, AnalysisHistory.id == AnalysisSkill.analysis_id)
+        .where(AnalysisSkill.status == status, AnalysisHistory.user_id == user_id)
+    )
+    total_stmt = select(func.count()).select_from(AnalysisHistory).where(AnalysisHistory.user_id == user_id)
+    stmt = stmt.group_by(Skill.name).order_by(func.count().desc(), Skill.name).limit(limit)
+    return stmt, total_stmt
+
+
+def format_skill_frequency(rows, total: int) -> List[dict]:
+    return [
+        {
+            "skill": name,
+            "count": count,
+            "share": round(count / total, 3) if total else 0.0
+        }
+        for name, count in rows
+    ]
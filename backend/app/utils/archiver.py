@@ -0,0 +1,326 @@
+"""
+Cold storage for idle interview transcripts.
+
+Sessions with no activity for ``ARCHIVE_IDLE_DAYS`` have their messages moved
+out of interview_messages into gzip-compressed JSONL segments, one file per
+user per month (``archive/user_<id>/<YYYY-MM>.jsonl.gz``). Each archived
+session is appended as its own gzip member, and the session row keeps the
+segment path and byte offset so a single transcript can be read back without
+scanning the file. The session row itself stays in place as the summary.
+
+Opening an archived session rehydrates it: the messages are inserted back
+with their original seq and the archive pointer is cleared. Message counters
+in user_stats are left alone in both directions because the messages still
+exist, just elsewhere.
+
+Rehydrating or deleting an archived session leaves a dead member behind and
+flags its segment with a ``.dirty`` marker. Once a segment's month is over
+(no more appends), ``compact_segments`` rewrites it without the dead members.
+"""
+import gzip
+import json
+import os
+from datetime import datetime
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.chat_history import InterviewSession, InterviewMessage
+
+ARCHIVE_DIR = os.getenv("SKILLIO_ARCHIVE_DIR", "archive")
+ARCHIVE_IDLE_DAYS = int(os.getenv("SKILLIO_ARCHIVE_IDLE_DAYS", "90"))
+# Seconds between archiver passes run by the maintenance scheduler; 0 disables them
+ARCHIVE_INTERVAL_SECONDS = int(os.getenv("SKILLIO_ARCHIVE_INTERVAL_SECONDS", "21600"))
+ARCHIVE_BATCH_SIZE = 100
+
+
+# ------------------------
+# Segment files
+# ------------------------
+def _segment_for(user_id: int) -> str:
+    return os.path.join(f"user_{user_id}", datetime.utcnow().strftime("%Y-%m") + ".jsonl.gz")
+
+
+def _is_open_segment(segment: str) -> bool:
+    # Only the current month's segment is appended to; older ones are frozen
+    return os.path.basename(segment).startswith(datetime.utcnow().strftime("%Y-%m") + ".")
+
+
+def _append_record(segment: str, record: dict) -> int:
+    """Append one transcript as a new gzip member; returns its byte offset.
+
+    A single O_APPEND write keeps concurrent writers from interleaving, and
+    the offset is taken after the write so it is ours even if they raced.
+    """
+    path = os.path.join(ARCHIVE_DIR, segment)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    member = gzip.compress((json.dumps(record, default=str) + "\n").encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        os.write(fd, member)
+        os.fsync(fd)
+        return os.lseek(fd, 0, os.SEEK_CUR) - len(member)
+    finally:
+        os.close(fd)
+
+
+def read_archived_transcript(segment: str, offset: int) -> dict:
+    """Read the transcript stored at ``offset`` in a segment."""
+    with open(os.path.join(ARCHIVE_DIR, segment), "rb") as f:
+        f.seek(offset)
+        with gzip.GzipFile(fileobj=f) as member:
+            return json.loads(member.readline())
+
+
+def mark_segment_dirty(segment: str) -> None:
+    """Flag a segment as holding transcripts nobody references any more."""
+    path = os.path.join(ARCHIVE_DIR, segment + ".dirty")
+    if os.path.isdir(os.path.dirname(path)):
+        open(path, "a").close()
+
+
+def compact_segments(db: Session) -> int:
+    """Rewrite dirty, frozen segments without their dead transcripts.
+
+    The live transcripts are copied into a new file, the sessions are
+    repointed in one transaction, and only then is the old file removed.
+    Returns the number of bytes reclaimed.
+    """
+    reclaimed = 0
+    if not os.path.isdir(ARCHIVE_DIR):
+        return reclaimed
+
+    for user_dir in os.scandir(ARCHIVE_DIR):
+        if not user_dir.is_dir():
+            continue
+        for entry in os.scandir(user_dir.path):
+            if not entry.name.endswith(".dirty"):
+                continue
+            segment = os.path.join(user_dir.name, entry.name[:-len(".dirty")])
+            if _is_open_segment(segment):
+                continue
+            os.remove(entry.path)
+
+            old_path = os.path.join(ARCHIVE_DIR, segment)
+            if not os.path.exists(old_path):
+                continue
+            old_size = os.path.getsize(old_path)
+            live = db.execute(
+                select(InterviewSession.id, InterviewSession.archive_offset)
+                .where(InterviewSession.archive_segment == segment)
+            ).all()
+
+            new_segment = None
+            moved = []
+            if live:
+                stem = os.path.basename(segment).split(".")[0]
+                new_segment = os.path.join(
+                    user_dir.name, f"{stem}.c{int(datetime.utcnow().timestamp() * 1000)}.jsonl.gz"
+                )
+                for session_id, offset in live:
+                    record = read_archived_transcript(segment, offset)
+                    moved.append((session_id, _append_record(new_segment, record)))
+
+            for session_id, offset in moved:
+                db.execute(
+                    update(InterviewSession)
+                    .where(InterviewSession.id == session_id, InterviewSession.archive_segment == segment)
+                    .values(archive_segment=new_segment, archive_offset=offset)
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+
+            os.remove(old_path)
+            new_size = os.path.getsize(os.path.join(ARCHIVE_DIR, new_segment)) if new_segment else 0
+            reclaimed += old_size - new_size
+    return reclaimed
+
+
+# ------------------------
+# Archiving
+# ------------------------
+def idle_sessions_query(idle_days: int, limit: int):
+    """Live sessions whose newest message (or creation) is older than ``idle_days``."""
+    last_activity = (
+        select(func.max(InterviewMessage.created_at))
+        .where(InterviewMessage.session_id == InterviewSession.id)
+        .scalar_subquery()
+    )
+    cutoff = func.datetime("now", f"-{int(idle_days)} days")
+    return (
+        select(InterviewSession.id)
+        .where(
+            InterviewSession.archived_at.is_(None),
+            func.coalesce(last_activity, InterviewSession.created_at) < cutoff,
+        )
+        .order_by(InterviewSession.id)
+        .limit(limit)
+    )
+
+
+def archive_session(db: Session, session_id: int) -> int | None:
+    """Move one session's messages to cold storage.
+
+    Returns the number of messages archived, or ``None`` if the session was
+    already archived or received a message while it was being archived.
+    """
+    session = db.get(InterviewSession, session_id)
+    if session is None or session.archived_at is not None:
+        return None
+
+    messages = db.scalars(
+        select(InterviewMessage)
+        .where(InterviewMessage.session_id == session_id)
+        .order_by(InterviewMessage.seq)
+    ).all()
+    last_seq = messages[-1].seq if messages else 0
+    record = {
+        "session_id": session_id,
+        "messages": [
+            {"seq": m.seq, "role": m.role, "content": m.content, "created_at": m.created_at}
+            for m in messages
+        ],
+    }
+
+    # The segment is written first; if the transaction below backs out the
+    # member is simply never referenced and compaction drops it
+    segment = _segment_for(session.user_id)
+    offset = _append_record(segment, record)
+
+    claimed = db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.id == session_id, InterviewSession.archived_at.is_(None))
+        .values(
+            archived_at=func.now(),
+            archive_segment=segment,
+            archive_offset=offset,
+            archived_message_count=len(messages),
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.execute(delete(InterviewMessage).where(
+        InterviewMessage.session_id == session_id,
+        InterviewMessage.seq <= last_seq,
+    ))
+    remaining = db.scalar(
+        select(func.count()).select_from(InterviewMessage)
+        .where(InterviewMessage.session_id == session_id)
+    )
+    if not claimed or remaining:
+        db.rollback()
+        mark_segment_dirty(segment)
+        return None
+
+    db.commit()
+    return len(messages)
+
+
+def archive_idle_sessions(
+    db: Session,
+    idle_days: int = ARCHIVE_IDLE_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE
+) -> tuple:
+    """Archive every idle session, one transaction per session.
+
+    Returns ``(sessions, messages)`` archived.
+    """
+    sessions = messages = 0
+    last_id = 0
+    while True:
+        ids = db.scalars(
+            idle_sessions_query(idle_days, batch_size).where(InterviewSession.id > last_id)
+        ).all()
+        if not ids:
+            return sessions, messages
+        for session_id in ids:
+            archived = archive_session(db, session_id)
+            if archived is not None:
+                sessions += 1
+                messages += archived
+        last_id = ids[-1]
+
+
+def run_archive_pass(idle_days: int = ARCHIVE_IDLE_DAYS) -> dict:
+    """Archive idle sessions and compact frozen segments with its own DB session."""
+    db = SessionLocal()
+    try:
+        sessions, messages = archive_idle_sessions(db, idle_days)
+        reclaimed = compact_segments(db)
+        return {"sessions": sessions, "messages": messages, "reclaimed_bytes": reclaimed}
+    finally:
+        db.close()
+
+
+# ------------------------
+# Rehydration
+# ------------------------
+def _restore_rows(session_id: int, record: dict) -> list:
+    return [
+        {
+            "session_id": session_id,
+            "seq": m["seq"],
+            "role": m["role"],
+            "content": m["content"],
+            "created_at": datetime.fromisoformat(m["created_at"]) if m["created_at"] else None,
+        }
+        for m in record["messages"]
+    ]
+
+
+def _unarchive(session_id: int):
+    # Only the caller that flips archived_at restores the messages; anyone
+    # racing it blocks on the write lock and then sees the hot rows
+    return (
+        update(InterviewSession)
+        .where(InterviewSession.id == session_id, InterviewSession.archived_at.is_not(None))
+        .values(archived_at=None, archive_segment=None, archive_offset=None, archived_message_count=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def rehydrate_session(db: Session, session: InterviewSession) -> None:
+    """Bring an archived session's messages back into interview_messages."""
+    for _ in range(2):
+        if session.archived_at is None:
+            return
+        segment = session.archive_segment
+        try:
+            record = read_archived_transcript(segment, session.archive_offset)
+        except FileNotFoundError:
+            # Compaction moved the segment under us; reload the pointer once
+            db.refresh(session)
+            continue
+        if db.execute(_unarchive(session.id)).rowcount:
+            rows = _restore_rows(session.id, record)
+            if rows:
+                db.execute(insert(InterviewMessage), rows)
+            mark_segment_dirty(segment)
+        db.commit()
+        db.refresh(session)
+        return
+    raise FileNotFoundError(f"Archive segment for session {session.id} is missing")
+
+
+async def rehydrate_session_async(db: AsyncSession, session: InterviewSession) -> None:
+    """``rehydrate_session`` for async handlers; the file is read off the event loop."""
+    for _ in range(2):
+        if session.archived_at is None:
+            return
+        segment = session.archive_segment
+        try:
+            record = await run_in_threadpool(read_archived_transcript, segment, session.archive_offset)
+        except FileNotFoundError:
+            await db.refresh(session)
+            continue
+        if (await db.execute(_unarchive(session.id))).rowcount:
+            rows = _restore_rows(session.id, record)
+            if rows:
+                await db.execute(insert(InterviewMessage), rows)
+            mark_segment_dirty(segment)
+        await db.commit()
+        await db.refresh(session)
+        return
+    raise FileNotFoundError(f"Archive segment for session {session.id} is missing")
@@ -0,0 +1,332 @@
+"""
+Offline batch scoring of a resume corpus against a JD corpus.
+
+Every (resume, JD) pair is run through the selected analyzers
+(``analyze_skill_gap``, ``analyze_ats``, ``improve_resume``) in a
+multiprocessing pool. Pairs are numbered resume-major and cut into
+fixed-size chunks. Each chunk is one task whose rows are written by the
+worker to its own part file (``part-00012.csv`` or ``.parquet``) through a
+temp file and a rename.
+
+A finished part is the checkpoint: re-running with the same corpus and
+options skips every chunk that already has one. ``_manifest.json`` records a
+fingerprint of the corpus and options, so a run is never resumed against
+different inputs.
+
+Parquet output needs ``pyarrow``; CSV parts are merged into one
+``results.csv`` once every chunk is done.
+"""
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, List
+
+from app.utils.ats_analyzer import analyze_ats
+from app.utils.resume_improver import improve_resume
+from app.utils.skill_analyzer import analyze_skill_gap
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    _PARQUET_AVAILABLE = True
+except ImportError:
+    _PARQUET_AVAILABLE = False
+
+CHUNK_SIZE = 200
+CORPUS_EXTENSIONS = (".pdf", ".docx", ".txt")
+# Leading underscore (and dot for temp files) keeps them out of a Parquet
+# dataset read of the output directory
+MANIFEST_FILE = "_manifest.json"
+STATS_FILE = "_stats.json"
+RESULTS_CSV = "results.csv"
+
+
+# ------------------------
+# Stages
+# ------------------------
+def _joined(values: Iterable[str]) -> str:
+    return "; ".join(sorted(values))
+
+
+def _skill_gap(resume_text: str, jd_text: str) -> dict:
+    result = analyze_skill_gap(resume_text, jd_text)
+    return {
+        "confidence_score": result["summary"]["confidence_score"],
+        "fit_level": result["summary"]["fit_level"],
+        "matched_skills": _joined(result["skills"]["matched_skills"]),
+        "missing_skills": _joined(result["skills"]["missing_skills"]),
+        "bonus_skills": _joined(result["skills"]["bonus_skills_detected"]),
+    }
+
+
+def _ats(resume_text: str, jd_text: str) -> dict:
+    result = analyze_ats(resume_text, jd_text)
+    return {
+        "ats_score": result["ats_score"],
+        "ats_level": result["level"],
+        "keyword_density": result["keyword_density"],
+        "ats_missing_keywords": _joined(result["missing_keywords"]),
+        "formatting_issues": len(result["formatting_issues"]),
+    }
+
+
+def _improve(resume_text: str, jd_text: str) -> dict:
+    result = improve_resume(resume_text, jd_text)
+    return {
+        "improvement_score": result["improvement_score"],
+        "suggestions": result["total_suggestions"],
+        "improve_missing_keywords": _joined(result["missing_keywords"]),
+    }
+
+
+STAGES = {
+    "skill_gap": (_skill_gap, ["confidence_score", "fit_level", "matched_skills", "missing_skills", "bonus_skills"]),
+    "ats": (_ats, ["ats_score", "ats_level", "keyword_density", "ats_missing_keywords", "formatting_issues"]),
+    "improve": (_improve, ["improvement_score", "suggestions", "improve_missing_keywords"]),
+}
+
+KEY_COLUMNS = ["resume_id", "resume_name", "jd_id", "jd_name"]
+
+
+def output_columns(stages: List[str]) -> List[str]:
+    return KEY_COLUMNS + [c for stage in stages for c in STAGES[stage][1]]
+
+
+# ------------------------
+# Corpora
+# ------------------------
+def _load_file(path: str) -> str:
+    if path.lower().endswith(".txt"):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    from app.utils.resume_parser import extract_text_from_docx, extract_text_from_pdf
+    try:
+        if path.lower().endswith(".pdf"):
+            return extract_text_from_pdf(path)
+        return extract_text_from_docx(path)
+    except Exception as e:
+        print(f"  ! Could not parse {path}: {e}")
+        return ""
+
+
+def load_dir_corpus(path: str, workers: int) -> List[tuple]:
+    """``(id, name, text)`` for every PDF/DOCX/TXT under ``path``, parsed in parallel."""
+    paths = sorted(
+        os.path.join(root, f)
+        for root, _, files in os.walk(path)
+        for f in files
+        if f.lower().endswith(CORPUS_EXTENSIONS) and not f.startswith(".")
+    )
+    with multiprocessing.Pool(workers) as pool:
+        texts = pool.map(_load_file, paths, chunksize=8)
+    return [
+        (os.path.relpath(p, path), os.path.basename(p), text)
+        for p, text in zip(paths, texts)
+        if text
+    ]
+
+
+def load_db_corpus(kind: str, email: str | None = None) -> List[tuple]:
+    """``(id, name, text)`` for the stored resumes or job descriptions."""
+    from sqlalchemy import select
+
+    from app.database import SessionLocal
+    from app.models.job_description import JobDescription
+    from app.models.resume import Resume
+    from app.models.user import User
+
+    if kind == "resumes":
+        model, name, text = Resume, Resume.filename, Resume.extracted_text
+    else:
+        model, name, text = JobDescription, JobDescription.title, JobDescription.content
+    stmt = select(model.id, name, text).order_by(model.id)
+    if email:
+        stmt = stmt.join(User, User.id == model.user_id).where(User.email == email)
+
+    db = SessionLocal()
+    try:
+        rows = db.execute(stmt.execution_options(yield_per=500))
+        return [(str(row[0]), row[1] or "", row[2]) for row in rows if row[2]]
+    finally:
+        db.close()
+
+
+def corpus_fingerprint(resumes: List[tuple], jds: List[tuple], stages: List[str], chunk_size: int, fmt: str) -> str:
+    digest = hashlib.sha256(json.dumps([stages, chunk_size, fmt]).encode())
+    for corpus in (resumes, jds):
+        digest.update(b"\0")
+        for item_id, _, text in corpus:
+            digest.update(f"{item_id}\0{hashlib.sha256(text.encode()).hexdigest()}\n".encode())
+    return digest.hexdigest()
+
+
+# ------------------------
+# Workers
+# ------------------------
+_worker = {}
+
+
+def _init_worker(resumes, jds, stages, chunk_size, out_dir, fmt):
+    _worker.update(
+        resumes=resumes, jds=jds, stages=stages,
+        chunk_size=chunk_size, out_dir=out_dir, fmt=fmt,
+    )
+
+
+def part_path(out_dir: str, chunk_id: int, fmt: str) -> str:
+    return os.path.join(out_dir, f"part-{chunk_id:05d}.{fmt}")
+
+
+def _write_part(path: str, rows: List[dict], columns: List[str], fmt: str) -> None:
+    tmp = os.path.join(os.path.dirname(path), "." + os.path.basename(path) + ".tmp")
+    if fmt == "parquet":
+        pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows).select(columns), tmp)
+    else:
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writerows(rows)
+    os.replace(tmp, path)
+
+
+def _run_chunk(chunk_id: int) -> tuple:
+    """Score one chunk of pairs and write its part; returns ``(chunk_id, pairs, stage_seconds)``."""
+    resumes, jds = _worker["resumes"], _worker["jds"]
+    stages, chunk_size = _worker["stages"], _worker["chunk_size"]
+    total = len(resumes) * len(jds)
+    start = chunk_id * chunk_size
+    end = min(start + chunk_size, total)
+
+    seconds = {stage: 0.0 for stage in stages}
+    rows = []
+    for pair in range(start, end):
+        resume_id, resume_name, resume_text = resumes[pair // len(jds)]
+        jd_id, jd_name, jd_text = jds[pair % len(jds)]
+        row = {"resume_id": resume_id, "resume_name": resume_name, "jd_id": jd_id, "jd_name": jd_name}
+        for stage in stages:
+            started = time.perf_counter()
+            row.update(STAGES[stage][0](resume_text, jd_text))
+            seconds[stage] += time.perf_counter() - started
+        rows.append(row)
+
+    _write_part(
+        part_path(_worker["out_dir"], chunk_id, _worker["fmt"]),
+        rows, output_columns(stages), _worker["fmt"],
+    )
+    return chunk_id, end - start, seconds
+
+
+# ------------------------
+# Driver
+# ------------------------
+def _check_manifest(out_dir: str, fingerprint: str, restart: bool) -> None:
+    path = os.path.join(out_dir, MANIFEST_FILE)
+    if os.path.exists(path) and not restart:
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get("fingerprint") != fingerprint:
+            raise ValueError(
+                f"{out_dir} holds a run over different inputs or options; "
+                "use another output directory or --restart"
+            )
+        return
+    for name in os.listdir(out_dir):
+        if name.startswith("part-") or name in (RESULTS_CSV, STATS_FILE):
+            os.remove(os.path.join(out_dir, name))
+    with open(path, "w") as f:
+        json.dump({"fingerprint": fingerprint}, f)
+
+
+def merge_csv_parts(out_dir: str, columns: List[str], chunks: int) -> str:
+    """Concatenate the CSV parts in chunk order under one header, then drop them."""
+    path = os.path.join(out_dir, RESULTS_CSV)
+    with open(path + ".tmp", "w", newline="", encoding="utf-8") as out:
+        csv.writer(out).writerow(columns)
+        for chunk_id in range(chunks):
+            with open(part_path(out_dir, chunk_id, "csv"), encoding="utf-8", newline="") as part:
+                for block in iter(lambda: part.read(1024 * 1024), ""):
+                    out.write(block)
+    os.replace(path + ".tmp", path)
+    for chunk_id in range(chunks):
+        os.remove(part_path(out_dir, chunk_id, "csv"))
+    return path
+
+
+def run_batch(
+    resumes: List[tuple],
+    jds: List[tuple],
+    out_dir: str,
+    stages: List[str],
+    fmt: str = "csv",
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    restart: bool = False,
+    load_seconds: float = 0.0,
+) -> Dict:
+    """Score every pair, resuming from existing parts; returns the run stats."""
+    if fmt == "parquet" and not _PARQUET_AVAILABLE:
+        raise ValueError("Parquet output needs pyarrow (pip install pyarrow)")
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+
+    fingerprint = corpus_fingerprint(resumes, jds, stages, chunk_size, fmt)
+    _check_manifest(out_dir, fingerprint, restart)
+
+    total_pairs = len(resumes) * len(jds)
+    chunks = -(-total_pairs // chunk_size)
+    results_csv = os.path.join(out_dir, RESULTS_CSV)
+    if fmt == "csv" and os.path.exists(results_csv):
+        todo = []
+    else:
+        todo = [i for i in range(chunks) if not os.path.exists(part_path(out_dir, i, fmt))]
+
+    stats = {
+        "resumes": len(resumes),
+        "jds": len(jds),
+        "pairs": total_pairs,
+        "chunks": chunks,
+        "chunks_resumed": chunks - len(todo),
+        "workers": workers,
+        "stages": {"load": {"items": len(resumes) + len(jds), "seconds": round(load_seconds, 3)}},
+    }
+    stage_seconds = {stage: 0.0 for stage in stages}
+    pairs_done = 0
+
+    started = time.perf_counter()
+    if todo:
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(resumes, jds, stages, chunk_size, out_dir, fmt),
+        ) as pool:
+            for done, (chunk_id, pairs, seconds) in enumerate(pool.imap_unordered(_run_chunk, todo), 1):
+                pairs_done += pairs
+                for stage, value in seconds.items():
+                    stage_seconds[stage] += value
+                if done % max(1, len(todo) // 20) == 0 or done == len(todo):
+                    elapsed = time.perf_counter() - started
+                    print(f"  {done}/{len(todo)} chunks, {pairs_done / elapsed:,.0f} pairs/s")
+    wall = time.perf_counter() - started
+
+    for stage in stages:
+        seconds = stage_seconds[stage]
+        stats["stages"][stage] = {
+            "items": pairs_done,
+            "seconds": round(seconds, 3),
+            # Summed across workers, so this is per-core throughput
+            "per_worker_per_second": round(pairs_done / seconds, 1) if seconds else None,
+        }
+    stats["pairs_scored"] = pairs_done
+    stats["wall_seconds"] = round(wall, 3)
+    stats["pairs_per_second"] = round(pairs_done / wall, 1) if wall and pairs_done else None
+
+    if fmt == "csv" and not os.path.exists(results_csv):
+        stats["output"] = merge_csv_parts(out_dir, output_columns(stages), chunks)
+    else:
+        stats["output"] = results_csv if fmt == "csv" else out_dir
+
+    with open(os.path.join(out_dir, STATS_FILE), "w") as f:
+        json.dump(stats, f, indent=2)
+    return stats
@@ -0,0 +1,46 @@
+"""
+Shared request model and helpers for the bulk delete endpoints.
+"""
+import os
+from datetime import datetime
+from typing import Iterable, List
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+MAX_BULK_IDS = 1000
+
+
+class BulkDeleteRequest(BaseModel):
+    """Rows to delete: explicit ids, everything created before a time, or all.
+
+    Filters combine with AND; at least one must be given so an empty body
+    never wipes a user's data.
+    """
+    ids: List[int] | None = None
+    before: datetime | None = None
+    all: bool = False
+
+
+def bulk_filters(request: BulkDeleteRequest, id_column, created_column) -> list:
+    """WHERE clauses for a bulk delete; the caller adds the user_id clause."""
+    filters = []
+    if request.ids is not None:
+        if len(request.ids) > MAX_BULK_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_IDS} ids per request")
+        filters.append(id_column.in_(request.ids))
+    if request.before is not None:
+        filters.append(created_column < request.before)
+    if not filters and not request.all:
+        raise HTTPException(status_code=400, detail="Provide ids, before, or all=true")
+    return filters
+
+
+def remove_files(paths: Iterable[str]) -> None:
+    """Delete files left behind by committed rows; run as a background task."""
+    for path in paths:
+        try:
+            if path and os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            print(f"[bulk_delete] Could not remove {path}: {e}")
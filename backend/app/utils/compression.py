@@ -0,0 +1,134 @@
+"""
+Transparent compression for large Text columns.
+
+``CompressedText`` stores values above ``MIN_COMPRESS_BYTES`` as a one-byte
+codec tag followed by the compressed UTF-8 payload; shorter values, and values
+that do not shrink, are stored as plain text. Rows written before a column
+switched to this type come back as ``str`` and are returned unchanged, so no
+rewrite is needed before deploying.
+
+zstd is used when the optional ``zstandard`` package is installed, zlib
+otherwise. ``SKILLIO_ZSTD_DICT`` may point at a dictionary trained with
+``train_compression_dict.py``; it is used for new writes and must stay
+available for as long as rows written with it exist.
+
+Decompression happens when a row is loaded, so pair the column with
+``deferred()`` on mappers whose list queries do not need the text.
+"""
+import os
+import threading
+import zlib
+
+from sqlalchemy.types import Text, TypeDecorator
+
+try:
+    import zstandard
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    _ZSTD_AVAILABLE = False
+
+# Values shorter than this are stored uncompressed
+MIN_COMPRESS_BYTES = int(os.getenv("SKILLIO_COMPRESS_MIN_BYTES", "256"))
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 6
+
+# Codec tags, the first byte of every compressed value
+_ZLIB = 0x01
+_ZSTD = 0x02
+_ZSTD_DICT = 0x03
+
+_local = threading.local()
+_dict_lock = threading.Lock()
+_zstd_dict = None
+
+
+def _load_zstd_dict():
+    global _zstd_dict
+    path = os.getenv("SKILLIO_ZSTD_DICT")
+    if not path or not _ZSTD_AVAILABLE:
+        return None
+    if _zstd_dict is None:
+        with _dict_lock:
+            if _zstd_dict is None:
+                with open(path, "rb") as f:
+                    _zstd_dict = zstandard.ZstdCompressionDict(f.read())
+    return _zstd_dict
+
+
+def _zstd_compressor(dict_data):
+    # zstandard contexts are not thread-safe, keep one per thread
+    key = "cctx_dict" if dict_data is not None else "cctx"
+    cctx = getattr(_local, key, None)
+    if cctx is None:
+        cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data)
+        setattr(_local, key, cctx)
+    return cctx
+
+
+def _zstd_decompressor(dict_data):
+    key = "dctx_dict" if dict_data is not None else "dctx"
+    dctx = getattr(_local, key, None)
+    if dctx is None:
+        dctx = zstandard.ZstdDecompressor(dict_data=dict_data)
+        setattr(_local, key, dctx)
+    return dctx
+
+
+def compress_text(value: str, codec: str | None = None) -> str | bytes:
+    """Encode ``value`` for storage; returns it unchanged when not worth compressing.
+
+    ``codec`` forces ``"zlib"`` or ``"zstd"``; by default zstd is used when
+    available.
+    """
+    raw = value.encode("utf-8")
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return value
+
+    codec = codec or ("zstd" if _ZSTD_AVAILABLE else "zlib")
+    if codec == "zstd":
+        dict_data = _load_zstd_dict()
+        tag = _ZSTD_DICT if dict_data is not None else _ZSTD
+        packed = bytes([tag]) + _zstd_compressor(dict_data).compress(raw)
+    else:
+        packed = bytes([_ZLIB]) + zlib.compress(raw, ZLIB_LEVEL)
+
+    return packed if len(packed) < len(raw) else value
+
+
+def decompress_text(value: str | bytes) -> str:
+    """Inverse of ``compress_text``; plain strings pass through."""
+    if isinstance(value, str):
+        return value
+
+    tag, payload = value[0], value[1:]
+    if tag == _ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if tag in (_ZSTD, _ZSTD_DICT):
+        if not _ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read this value")
+        dict_data = None
+        if tag == _ZSTD_DICT:
+            dict_data = _load_zstd_dict()
+            if dict_data is None:
+                raise RuntimeError("SKILLIO_ZSTD_DICT is required to read this value")
+        return _zstd_decompressor(dict_data).decompress(payload).decode("utf-8")
+    raise ValueError(f"Unknown compressed text codec: {tag:#x}")
+
+
+class CompressedText(TypeDecorator):
+    """Text column stored compressed; reads and writes plain ``str``."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decompress_text(value)
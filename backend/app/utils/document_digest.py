@@ -0,0 +1,236 @@
+"""
+Compact digests of resumes and JDs for interview prompts.
+
+Text extracted from PDFs carries page headers and footers, contact lines and
+whitespace runs, and all of it used to go into every interview prompt.
+``build_digest`` runs once, when a document is stored (see
+app.models.document), and keeps what an interviewer needs: skills, the roles
+held or hired for, projects and the main bullet points, cut to
+``DIGEST_TOKEN_BUDGET`` tokens. A text that already fits the budget once
+cleaned is kept as it is, minus boilerplate sections such as benefits.
+
+Resumes and JDs share the documents table, so one digest format serves both.
+Everything here is local string work; nothing calls the LLM.
+"""
+import re
+from collections import Counter
+
+from app.utils.ai.conversation_context import DIGEST_TOKEN_BUDGET, count_tokens, truncate_to_tokens
+from app.utils.skill_analyzer import BONUS_SKILLS, CLOUD_SKILLS, CORE_SKILLS, SYSTEM_SKILLS
+
+MAX_SKILLS = 30
+MAX_ROLES = 6
+MAX_PROJECTS = 6
+MAX_EDUCATION = 2
+MAX_HIGHLIGHTS = 12
+LINE_CHARS = 160
+# Longer unbulleted lines are descriptions, not titles (PDF extraction often
+# loses the bullet markers)
+TITLE_CHARS = 80
+SKILL_CHARS = 40
+
+# Lines seen this often are page headers or footers
+REPEATED_LINE_MIN = 3
+
+SECTION_HEADINGS = {
+    "skills": (
+        "skills", "technical skills", "key skills", "core competencies", "competencies",
+        "technologies", "tech stack", "tools", "tools and technologies",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "work history", "internships", "internship",
+    ),
+    "projects": ("projects", "personal projects", "academic projects", "key projects", "selected projects"),
+    "education": ("education", "academic background", "qualifications and education"),
+    "requirements": (
+        "requirements", "qualifications", "required qualifications", "minimum qualifications",
+        "preferred qualifications", "what you'll need", "what you need", "what we're looking for",
+        "who you are", "must have", "must haves", "nice to have", "nice to haves",
+        "skills and experience", "required skills", "preferred skills",
+    ),
+    "responsibilities": (
+        "responsibilities", "key responsibilities", "what you'll do", "what you will do",
+        "the role", "your role", "role overview", "duties", "job description",
+    ),
+    "summary": ("summary", "professional summary", "profile", "objective", "career objective", "about me"),
+    # Dropped from the digest, even when the text would fit whole
+    "skip": (
+        "about us", "about the company", "who we are", "benefits", "perks", "what we offer",
+        "hobbies", "interests", "references", "languages", "declaration", "equal opportunity",
+        "certifications", "achievements", "awards", "contact",
+    ),
+}
+_HEADINGS = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+
+# Order in which bullet points are picked as highlights
+HIGHLIGHT_SECTIONS = ("summary", "requirements", "responsibilities", "experience", "projects", "preamble")
+
+KNOWN_SKILLS = sorted(CORE_SKILLS | SYSTEM_SKILLS | CLOUD_SKILLS | BONUS_SKILLS)
+_SKILL_PATTERNS = [
+    (skill, re.compile(r"(?<![a-z0-9+#])" + re.escape(skill) + r"(?![a-z0-9+#])")) for skill in KNOWN_SKILLS
+]
+
+_ROLE_WORDS = re.compile(
+    r"\b(engineer|developer|intern|manager|analyst|scientist|architect|lead|consultant|designer|"
+    r"administrator|specialist|programmer|devops|sre|researcher)\b",
+    re.IGNORECASE,
+)
+_BULLET = re.compile(r"^\s*(?:[-•*▪●◦·‣–—>]|\d{1,2}[.)])\s+")
+_PAGE_MARKER = re.compile(r"^(?:page\s*)?\d+(?:\s*(?:of|/)\s*\d+)?$", re.IGNORECASE)
+_CONTACT = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.-]+"                 # email
+    r"|(?:https?://|www\.)\S+"                   # URL
+    r"|\b(?:linkedin|github)\.com/\S*"
+    r"|\+?\d[\d\s().-]{7,}\d",                   # phone number, if it has 10+ digits
+    re.IGNORECASE,
+)
+PHONE_MIN_DIGITS = 10
+_LIST_SPLIT = re.compile(r"\s*[,;|•·]\s*")
+
+
+def _clip(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(" ,;:-") + " …"
+
+
+def _drop_contact(match) -> str:
+    value = match.group()
+    if value[0].isdigit() or value[0] == "+":
+        # Date ranges such as "2019 - 2021" look like phone numbers too
+        if sum(c.isdigit() for c in value) < PHONE_MIN_DIGITS:
+            return value
+    return " "
+
+
+def _heading(line: str) -> str | None:
+    """The section a heading line opens, if it is one."""
+    key = re.sub(r"[^a-z' ]+", " ", line.lower().replace("’", "'")).split()
+    return _HEADINGS.get(" ".join(key)) if 0 < len(key) <= 5 else None
+
+
+def clean_lines(text: str) -> list:
+    """``(line, is_bullet)`` for the lines worth keeping, in order.
+
+    Whitespace is collapsed; page markers, repeated headers/footers, contact
+    details and duplicate lines are dropped.
+    """
+    raw = [" ".join(line.split()) for line in (text or "").replace("\r", "\n").split("\n")]
+    repeats = Counter(line.lower() for line in raw if line)
+
+    kept, seen = [], set()
+    for line in raw:
+        if not line or _PAGE_MARKER.match(line):
+            continue
+        is_bullet = bool(_BULLET.match(line))
+        if repeats[line.lower()] >= REPEATED_LINE_MIN and not is_bullet and _heading(line) is None:
+            continue
+        line = _BULLET.sub("", line)
+        line = " ".join(_CONTACT.sub(_drop_contact, line).split()).strip(" |,;")
+        if len(re.sub(r"[^A-Za-z0-9]", "", line)) < 2:
+            continue
+        key = line.lower()
+        if key in seen and _heading(line) is None:
+            continue
+        seen.add(key)
+        kept.append((line, is_bullet))
+    return kept
+
+
+def _without_skipped(lines: list) -> list:
+    """``lines`` minus the sections listed under "skip", headings included."""
+    kept, skipping = [], False
+    for line, is_bullet in lines:
+        section = None if is_bullet else _heading(line)
+        if section is not None:
+            skipping = section == "skip"
+        if not skipping:
+            kept.append((line, is_bullet))
+    return kept
+
+
+def _sections(lines: list) -> dict:
+    sections = {"preamble": []}
+    current = "preamble"
+    for line, is_bullet in lines:
+        section = None if is_bullet else _heading(line)
+        if section is not None:
+            current = section
+            sections.setdefault(current, [])
+            continue
+        sections[current].append((line, is_bullet))
+    return sections
+
+
+def _skills(text: str, skill_lines: list) -> list:
+    skills = []
+    for line, _ in skill_lines:
+        # "Languages: Python, Go" -> "Python", "Go"
+        items = line.split(":", 1)[-1]
+        skills.extend(item for item in _LIST_SPLIT.split(items) if item)
+    lowered = text.lower()
+    skills.extend(skill for skill, pattern in _SKILL_PATTERNS if pattern.search(lowered))
+
+    unique, seen = [], set()
+    for skill in skills:
+        skill = _clip(skill.strip(" .()"), SKILL_CHARS)
+        if skill and skill.lower() not in seen:
+            seen.add(skill.lower())
+            unique.append(skill)
+    return unique[:MAX_SKILLS]
+
+
+def _is_title(line: str, is_bullet: bool) -> bool:
+    return not is_bullet and len(line) <= TITLE_CHARS and not line.endswith(".")
+
+
+def _titles(lines: list, limit: int) -> list:
+    """Title lines (roles, companies, dates), falling back to the others."""
+    titles = [line for line, is_bullet in lines if _is_title(line, is_bullet)] or [line for line, _ in lines]
+    return [_clip(line, LINE_CHARS) for line in titles[:limit]]
+
+
+def _highlights(sections: dict) -> list:
+    picked = []
+    for name in HIGHLIGHT_SECTIONS:
+        for line, is_bullet in sections.get(name, ()):
+            if name in ("experience", "projects") and _is_title(line, is_bullet):
+                continue  # Listed as a role or project
+            if name == "preamble" and _ROLE_WORDS.search(line):
+                continue
+            picked.append(_clip(line, LINE_CHARS))
+            if len(picked) >= MAX_HIGHLIGHTS:
+                return picked
+    return picked
+
+
+def build_digest(text: str, budget: int = DIGEST_TOKEN_BUDGET) -> str:
+    """A prompt-ready digest of a resume or JD, at most about ``budget`` tokens."""
+    lines = _without_skipped(clean_lines(text))
+    cleaned = "\n".join(f"- {line}" if is_bullet else line for line, is_bullet in lines)
+    if count_tokens(cleaned) <= budget:
+        return cleaned
+
+    sections = _sections(lines)
+    roles = _titles(sections.get("experience", []), MAX_ROLES)
+    if not roles:
+        # JDs usually open with the title of the role
+        roles = [_clip(line, LINE_CHARS) for line, _ in sections["preamble"] if _ROLE_WORDS.search(line)][:MAX_ROLES]
+
+    parts = []
+    skills = _skills(cleaned, sections.get("skills", []))
+    if skills:
+        parts.append("Skills: " + ", ".join(skills))
+    if roles:
+        parts.append("Roles: " + "; ".join(roles))
+    projects = _titles(sections.get("projects", []), MAX_PROJECTS)
+    if projects:
+        parts.append("Projects: " + "; ".join(projects))
+    education = _titles(sections.get("education", []), MAX_EDUCATION)
+    if education:
+        parts.append("Education: " + "; ".join(education))
+    highlights = _highlights(sections)
+    if highlights:
+        parts.append("Highlights:\n" + "\n".join(f"- {line}" for line in highlights))
+    return truncate_to_tokens("\n".join(parts), budget)
@@ -0,0 +1,287 @@
+"""
+Streaming export of everything a user has stored.
+
+Records are read with ``yield_per`` so only one batch is held in memory at a
+time, serialized as NDJSON or CSV and, when the client accepts it, gzipped
+on the fly. Every record carries a cursor; passing the last one received back
+to the export resumes right after that record, so a dropped download does
+not have to start over.
+
+Kinds are exported in ``EXPORT_KINDS`` order, each ordered by its key.
+Transcripts of archived sessions are read straight from their cold-storage
+segment without rehydrating the session.
+"""
+import base64
+import binascii
+import csv
+import io
+import json
+import zlib
+from typing import Iterator, List
+
+from fastapi import HTTPException
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session, aliased
+
+from app.database import SessionLocal
+from app.models.analysis import AnalysisHistory
+from app.models.chat_history import InterviewSession, InterviewMessage
+from app.models.document import Document
+from app.models.job_description import JobDescription
+from app.models.resume import Resume
+from app.utils.archiver import read_archived_transcript
+
+EXPORT_BATCH_SIZE = 500
+# Serialized bytes collected before a chunk is (compressed and) sent
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+EXPORT_COLUMNS = {
+    "analyses": ["id", "created_at", "confidence_score", "fit_level", "matched_skills", "missing_skills"],
+    "resumes": ["id", "uploaded_at", "filename", "extracted_text"],
+    "job_descriptions": ["id", "uploaded_at", "title", "filename", "content"],
+    "sessions": [
+        "id", "created_at", "updated_at", "mode", "difficulty", "title",
+        "archived", "job_description", "resume_text",
+    ],
+    "messages": ["session_id", "seq", "role", "created_at", "content"],
+}
+EXPORT_KINDS = list(EXPORT_COLUMNS)
+
+# Number of integers in each kind's cursor key
+_KEY_LENGTHS = {"messages": 2}
+
+_CURSOR_PREFIX = "e1:"
+
+
+# ------------------------
+# Cursors
+# ------------------------
+def encode_export_cursor(kind: str, key: tuple) -> str:
+    raw = _CURSOR_PREFIX + ":".join([kind, *map(str, key)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_export_cursor(cursor: str | None) -> tuple | None:
+    """Decode an export cursor into ``(kind, key)``; ``None`` starts from the top."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError(raw)
+        kind, *key = raw[len(_CURSOR_PREFIX):].split(":")
+        if kind not in EXPORT_COLUMNS or len(key) != _KEY_LENGTHS.get(kind, 1):
+            raise ValueError(raw)
+        return kind, tuple(int(k) for k in key)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# ------------------------
+# Record sources
+# ------------------------
+def _stream(db: Session, stmt):
+    return db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+
+def _table_records(model, db: Session, user_id: int, after: tuple | None):
+    stmt = (
+        select(*(getattr(model, c) for c in _MODEL_COLUMNS[model]))
+        .where(model.user_id == user_id)
+        .order_by(model.id)
+    )
+    if after:
+        stmt = stmt.where(model.id > after[0])
+    for row in _stream(db, stmt):
+        yield (row.id,), row._asdict()
+
+
+def _session_records(db: Session, user_id: int, after: tuple | None):
+    jd = aliased(Document)
+    resume = aliased(Document)
+    stmt = (
+        select(
+            InterviewSession.id,
+            InterviewSession.created_at,
+            InterviewSession.updated_at,
+            InterviewSession.mode,
+            InterviewSession.difficulty,
+            InterviewSession.title,
+            InterviewSession.archived_at.is_not(None).label("archived"),
+            jd.content.label("job_description"),
+            resume.content.label("resume_text"),
+        )
+        .join(jd, jd.id == InterviewSession.jd_document_id)
+        .outerjoin(resume, resume.id == InterviewSession.resume_document_id)
+        .where(InterviewSession.user_id == user_id)
+        .order_by(InterviewSession.id)
+    )
+    if after:
+        stmt = stmt.where(InterviewSession.id > after[0])
+    for row in _stream(db, stmt):
+        yield (row.id,), row._asdict()
+
+
+def _archived_transcript(session_id: int, segment: str, offset: int) -> list:
+    try:
+        return read_archived_transcript(segment, offset)["messages"]
+    except FileNotFoundError:
+        pass
+    # Compacted or rehydrated after this export's snapshot was taken; look
+    # the transcript up again outside that snapshot
+    db = SessionLocal()
+    try:
+        session = db.get(InterviewSession, session_id)
+        if session is None:
+            return []
+        if session.archived_at is not None:
+            return read_archived_transcript(session.archive_segment, session.archive_offset)["messages"]
+        return [
+            {"seq": m.seq, "role": m.role, "content": m.content, "created_at": m.created_at}
+            for m in db.scalars(
+                select(InterviewMessage)
+                .where(InterviewMessage.session_id == session_id)
+                .order_by(InterviewMessage.seq)
+            )
+        ]
+    finally:
+        db.close()
+
+
+def _message_records(db: Session, user_id: int, after: tuple | None):
+    """Messages ordered by (session_id, seq), hot and archived merged."""
+    after = after or (0, 0)
+    hot = _stream(
+        db,
+        select(
+            InterviewMessage.session_id,
+            InterviewMessage.seq,
+            InterviewMessage.role,
+            InterviewMessage.created_at,
+            InterviewMessage.content,
+        )
+        .join(InterviewSession, InterviewSession.id == InterviewMessage.session_id)
+        .where(
+            InterviewSession.user_id == user_id,
+            tuple_(InterviewMessage.session_id, InterviewMessage.seq) > tuple_(*after),
+        )
+        .order_by(InterviewMessage.session_id, InterviewMessage.seq),
+    )
+    archived = iter(_stream(
+        db,
+        select(InterviewSession.id, InterviewSession.archive_segment, InterviewSession.archive_offset)
+        .where(
+            InterviewSession.user_id == user_id,
+            InterviewSession.archived_at.is_not(None),
+            InterviewSession.id >= after[0],
+        )
+        .order_by(InterviewSession.id),
+    ))
+
+    def archived_until(session_id):
+        nonlocal pending
+        while pending is not None and (session_id is None or pending.id < session_id):
+            for m in _archived_transcript(*pending):
+                if (pending.id, m["seq"]) > after:
+                    yield (pending.id, m["seq"]), {
+                        "session_id": pending.id,
+                        "seq": m["seq"],
+                        "role": m["role"],
+                        "created_at": m["created_at"],
+                        "content": m["content"],
+                    }
+            pending = next(archived, None)
+
+    pending = next(archived, None)
+    for row in hot:
+        yield from archived_until(row.session_id)
+        yield (row.session_id, row.seq), row._asdict()
+    yield from archived_until(None)
+
+
+_MODEL_COLUMNS = {
+    AnalysisHistory: EXPORT_COLUMNS["analyses"],
+    Resume: EXPORT_COLUMNS["resumes"],
+    JobDescription: EXPORT_COLUMNS["job_descriptions"],
+}
+
+_SOURCES = {
+    "analyses": lambda *args: _table_records(AnalysisHistory, *args),
+    "resumes": lambda *args: _table_records(Resume, *args),
+    "job_descriptions": lambda *args: _table_records(JobDescription, *args),
+    "sessions": _session_records,
+    "messages": _message_records,
+}
+
+
+def export_records(db: Session, user_id: int, kinds: List[str], start: tuple | None = None):
+    """Yield ``(kind, cursor, record)`` for the user, resuming after ``start``."""
+    for kind in kinds:
+        after = None
+        if start is not None:
+            if kinds.index(kind) < kinds.index(start[0]):
+                continue
+            if kind == start[0]:
+                after = start[1]
+        for key, record in _SOURCES[kind](db, user_id, after):
+            yield kind, encode_export_cursor(kind, key), record
+        # End the read transaction between kinds so a long export does not
+        # hold back WAL checkpoints for its whole duration
+        db.rollback()
+
+
+# ------------------------
+# Encoding
+# ------------------------
+def ndjson_lines(records) -> Iterator[str]:
+    for kind, cursor, record in records:
+        yield json.dumps({"type": kind, "cursor": cursor, "data": record}, default=str) + "\n"
+
+
+def csv_lines(records, kind: str) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = EXPORT_COLUMNS[kind]
+    writer.writerow([*columns, "cursor"])
+    for _, cursor, record in records:
+        writer.writerow([*(record[c] for c in columns), cursor])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def encode_chunks(lines, compress: bool) -> Iterator[bytes]:
+    """Group lines into ~``EXPORT_CHUNK_BYTES`` chunks, gzipped if asked.
+
+    Each gzip chunk ends with a sync flush, so everything a client received
+    before a dropped connection still decompresses.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    parts = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        parts.append(data)
+        size += len(data)
+        if size >= EXPORT_CHUNK_BYTES:
+            chunk = b"".join(parts)
+            parts, size = [], 0
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH) if compressor else chunk
+    tail = b"".join(parts)
+    if compressor:
+        yield compressor.compress(tail) + compressor.flush()
+    elif tail:
+        yield tail
+
+
+def stream_export(user_id: int, kinds: List[str], start: tuple | None, fmt: str, compress: bool) -> Iterator[bytes]:
+    """Response body for an export; owns its DB session for the whole stream."""
+    db = SessionLocal()
+    try:
+        records = export_records(db, user_id, kinds, start)
+        lines = ndjson_lines(records) if fmt == "ndjson" else csv_lines(records, kinds[0])
+        yield from encode_chunks(lines, compress)
+    finally:
+        db.close()
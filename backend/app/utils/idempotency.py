@@ -0,0 +1,113 @@
+"""
+Idempotency keys for the mutating interview endpoints.
+
+A client that sends ``Idempotency-Key: <random id>`` can safely retry the
+same POST: the first request claims the key, and its response is stored in
+the same transaction as the rows it writes. A retry then gets that stored
+response instead of generating (and saving) a second AI reply. A retry that
+arrives while the first request is still running gets 409 with Retry-After
+after a short wait, rather than holding a worker thread for the whole LLM
+call; if the first request fails, the key is released and the next retry
+runs normally.
+
+Keys are scoped per user and endpoint and purged after
+``IDEMPOTENCY_TTL_HOURS`` by the maintenance scheduler.
+"""
+import hashlib
+import json
+import os
+import time
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.idempotency_key import IdempotencyKey
+
+IDEMPOTENCY_TTL_HOURS = int(os.getenv("SKILLIO_IDEMPOTENCY_TTL_HOURS", "24"))
+# How long a duplicate waits for the first request before answering 409;
+# short, since it holds a threadpool worker while it waits
+IDEMPOTENCY_WAIT_SECONDS = 1.0
+POLL_SECONDS = 0.25
+# Sent with the 409 so the client knows when to try again
+RETRY_AFTER_SECONDS = 2
+MAX_KEY_LENGTH = 255
+
+
+def request_hash(payload) -> str:
+    """Fingerprint of a request body, to spot a key reused for another request."""
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _where(user_id: int, endpoint: str, key: str):
+    return (
+        IdempotencyKey.user_id == user_id,
+        IdempotencyKey.endpoint == endpoint,
+        IdempotencyKey.key == key,
+    )
+
+
+def claim_key(db: Session, user_id: int, endpoint: str, key: str, fingerprint: str) -> dict | None:
+    """Claim ``key`` for this request; returns the stored response if it already ran.
+
+    ``None`` means the caller owns the key and must either ``store_response``
+    (with its own commit) or ``release_key``.
+    """
+    if len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters")
+
+    deadline = time.monotonic() + IDEMPOTENCY_WAIT_SECONDS
+    while True:
+        claimed = db.execute(
+            sqlite_insert(IdempotencyKey)
+            .values(user_id=user_id, endpoint=endpoint, key=key, request_hash=fingerprint)
+            .on_conflict_do_nothing(index_elements=["user_id", "endpoint", "key"])
+        ).rowcount
+        db.commit()
+        if claimed:
+            return None
+
+        row = db.execute(
+            select(IdempotencyKey.request_hash, IdempotencyKey.response).where(*_where(user_id, endpoint, key))
+        ).first()
+        db.rollback()
+        if row is None:
+            # The first request failed and released the key
+            continue
+        if row.request_hash != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+        if row.response is not None:
+            return json.loads(row.response)
+        if time.monotonic() >= deadline:
+            raise HTTPException(
+                status_code=409,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+            )
+        time.sleep(POLL_SECONDS)
+
+
+def store_response(db: Session, user_id: int, endpoint: str, key: str, response: dict) -> None:
+    """Stage the response for the claimed key; the caller's commit saves it."""
+    db.execute(
+        update(IdempotencyKey)
+        .where(*_where(user_id, endpoint, key))
+        .values(response=json.dumps(jsonable_encoder(response)))
+    )
+
+
+def release_key(db: Session, user_id: int, endpoint: str, key: str) -> None:
+    """Give up a claimed key after a failure so a retry can run."""
+    db.rollback()
+    db.execute(delete(IdempotencyKey).where(*_where(user_id, endpoint, key)))
+    db.commit()
+
+
+def purge_expired_keys(db: Session, ttl_hours: int = IDEMPOTENCY_TTL_HOURS) -> int:
+    cutoff = func.datetime("now", f"-{int(ttl_hours)} hours")
+    deleted = db.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)).rowcount
+    db.commit()
+    return deleted
@@ -0,0 +1,315 @@
+"""
+In-process scheduler for database maintenance.
+
+Every worker runs the scheduler loop, but only the one holding the
+``maintenance`` lease in scheduler_leases runs jobs. The lease is renewed on
+every tick and expires after ``LEASE_TTL_SECONDS``, so another worker takes
+over if the leader dies.
+
+Light jobs run on their interval at any time; heavy ones (``window_only``)
+only inside the low-traffic window set by ``SKILLIO_MAINTENANCE_WINDOW``
+(``HH:MM-HH:MM`` UTC, may wrap midnight), at most one per tick. When each
+job last ran is kept in maintenance_runs, so a new leader (after a restart
+or failover) picks up the schedule instead of running every job at once.
+Each run is timed and published through ``app.utils.metrics``.
+"""
+import asyncio
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.database import SessionLocal, engine
+from app.models.document import delete_orphan_documents
+from app.models.scheduler_lease import MaintenanceRun, SchedulerLease
+from app.models.user import User
+from app.utils import metrics
+from app.utils.archiver import ARCHIVE_IDLE_DAYS, ARCHIVE_INTERVAL_SECONDS, run_archive_pass
+from app.utils.idempotency import purge_expired_keys
+from app.utils.stats_reconciler import reconcile_user_stats
+from app.utils.upload_gc import collect_upload_garbage
+
+MAINTENANCE_ENABLED = os.getenv("SKILLIO_MAINTENANCE_ENABLED", "1") == "1"
+MAINTENANCE_WINDOW = os.getenv("SKILLIO_MAINTENANCE_WINDOW", "02:00-05:00")
+
+TICK_SECONDS = 15
+LEASE_NAME = "maintenance"
+LEASE_TTL_SECONDS = 120
+
+# Pages released per incremental_vacuum run, so one run never holds the
+# write lock for long
+INCREMENTAL_VACUUM_PAGES = 2000
+# Users recounted per transaction by the user_stats reconciliation
+RECONCILE_BATCH_SIZE = 500
+
+_holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+job_duration = metrics.summary(
+    "skillio_maintenance_job_duration_seconds", "Wall time of maintenance job runs"
+)
+job_last_duration = metrics.gauge(
+    "skillio_maintenance_job_last_duration_seconds", "Wall time of the latest run of each maintenance job"
+)
+job_last_success = metrics.gauge(
+    "skillio_maintenance_job_last_success_timestamp", "Unix time each maintenance job last succeeded"
+)
+job_failures = metrics.counter(
+    "skillio_maintenance_job_failures_total", "Maintenance job runs that raised"
+)
+is_leader = metrics.gauge(
+    "skillio_maintenance_leader", "1 if this worker holds the maintenance lease"
+)
+
+
+# ------------------------
+# Jobs
+# ------------------------
+def _pragma(statement: str):
+    with engine.connect() as connection:
+        result = connection.execute(text(statement))
+        rows = result.all() if result.returns_rows else []
+        connection.commit()
+        return rows
+
+
+def optimize() -> None:
+    # Lets SQLite re-ANALYZE only the tables whose statistics look stale
+    _pragma("PRAGMA optimize")
+
+
+def analyze() -> None:
+    _pragma("ANALYZE")
+
+
+def wal_checkpoint() -> None:
+    # PASSIVE never blocks readers or writers; the window job truncates
+    _pragma("PRAGMA wal_checkpoint(PASSIVE)")
+
+
+def wal_truncate() -> None:
+    _pragma("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def incremental_vacuum() -> None:
+    """Return free pages to the OS; a no-op unless auto_vacuum is INCREMENTAL."""
+    mode = _pragma("PRAGMA auto_vacuum")[0][0]
+    if mode != 2:
+        return
+    _pragma(f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES})")
+
+
+def archive() -> None:
+    run_archive_pass(ARCHIVE_IDLE_DAYS)
+
+
+def upload_gc() -> None:
+    db = SessionLocal()
+    try:
+        report = collect_upload_garbage(db)
+    finally:
+        db.close()
+    if report["quarantined"] or report["deleted"]:
+        print(f"[maintenance] upload_gc quarantined {report['quarantined']} files, "
+              f"reclaimed {report['reclaimed_bytes']} bytes")
+
+
+def idempotency_purge() -> None:
+    db = SessionLocal()
+    try:
+        purge_expired_keys(db)
+    finally:
+        db.close()
+
+
+def document_gc() -> None:
+    db = SessionLocal()
+    try:
+        deleted = delete_orphan_documents(db)
+        db.commit()
+    finally:
+        db.close()
+    if deleted:
+        print(f"[maintenance] document_gc deleted {deleted} unreferenced documents")
+
+
+def reconcile_stats() -> None:
+    """Repair user_stats counters that drifted from the source tables."""
+    repaired = 0
+    last_id = 0
+    db = SessionLocal()
+    try:
+        while True:
+            user_ids = db.scalars(
+                select(User.id).where(User.id > last_id).order_by(User.id).limit(RECONCILE_BATCH_SIZE)
+            ).all()
+            if not user_ids:
+                break
+            repaired += reconcile_user_stats(db, user_ids)
+            db.commit()
+            last_id = user_ids[-1]
+    finally:
+        db.close()
+    if repaired:
+        print(f"[maintenance] reconcile_user_stats repaired {repaired} users")
+
+
+@dataclass
+class MaintenanceJob:
+    name: str
+    func: Callable[[], None]
+    interval_seconds: int
+    window_only: bool = False
+    last_run: float = 0.0
+
+
+JOBS = [
+    MaintenanceJob("wal_checkpoint", wal_checkpoint, 5 * 60),
+    MaintenanceJob("optimize", optimize, 60 * 60),
+    MaintenanceJob("analyze", analyze, 24 * 60 * 60, window_only=True),
+    MaintenanceJob("incremental_vacuum", incremental_vacuum, 60 * 60, window_only=True),
+    MaintenanceJob("wal_truncate", wal_truncate, 24 * 60 * 60, window_only=True),
+    MaintenanceJob("upload_gc", upload_gc, 24 * 60 * 60, window_only=True),
+    MaintenanceJob("document_gc", document_gc, 24 * 60 * 60, window_only=True),
+    MaintenanceJob("reconcile_user_stats", reconcile_stats, 24 * 60 * 60, window_only=True),
+    MaintenanceJob("idempotency_purge", idempotency_purge, 60 * 60),
+]
+if ARCHIVE_INTERVAL_SECONDS > 0:
+    JOBS.append(MaintenanceJob("archive", archive, ARCHIVE_INTERVAL_SECONDS, window_only=True))
+
+
+# ------------------------
+# Scheduling
+# ------------------------
+def in_window(now: datetime, window: str = MAINTENANCE_WINDOW) -> bool:
+    """Whether ``now`` (UTC) falls inside an ``HH:MM-HH:MM`` window."""
+    if not window:
+        return True
+    start, end = (datetime.strptime(t.strip(), "%H:%M").time() for t in window.split("-"))
+    current = now.time()
+    if start <= end:
+        return start <= current < end
+    return current >= start or current < end
+
+
+def acquire_lease(name: str = LEASE_NAME, ttl: int = LEASE_TTL_SECONDS) -> bool:
+    """Take or renew the named lease; True if this worker holds it afterwards."""
+    now = time.time()
+    stmt = sqlite_insert(SchedulerLease).values(name=name, holder=_holder_id, expires_at=now + ttl)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SchedulerLease.name],
+        set_={"holder": _holder_id, "expires_at": now + ttl},
+        where=(SchedulerLease.holder == _holder_id) | (SchedulerLease.expires_at < now),
+    )
+    with engine.connect() as connection:
+        acquired = connection.execute(stmt).rowcount == 1
+        connection.commit()
+    return acquired
+
+
+def release_lease(name: str = LEASE_NAME) -> None:
+    with engine.connect() as connection:
+        connection.execute(
+            SchedulerLease.__table__.delete().where(
+                SchedulerLease.name == name, SchedulerLease.holder == _holder_id
+            )
+        )
+        connection.commit()
+
+
+def load_last_runs(jobs=JOBS) -> None:
+    """Carry on the schedule from the stored run times, e.g. on becoming leader.
+
+    Without this every job would run at once after each restart or failover.
+    """
+    with engine.connect() as connection:
+        stored = dict(connection.execute(select(MaintenanceRun.name, MaintenanceRun.last_run)).all())
+    for job in jobs:
+        job.last_run = max(job.last_run, stored.get(job.name, 0.0))
+
+
+def _save_last_run(job: MaintenanceJob) -> None:
+    stmt = sqlite_insert(MaintenanceRun).values(name=job.name, last_run=job.last_run)
+    stmt = stmt.on_conflict_do_update(index_elements=[MaintenanceRun.name], set_={"last_run": job.last_run})
+    with engine.connect() as connection:
+        connection.execute(stmt)
+        connection.commit()
+
+
+def run_job(job: MaintenanceJob) -> float:
+    """Run one job and record its duration; returns the duration in seconds."""
+    started = time.perf_counter()
+    try:
+        job.func()
+    except Exception as e:
+        job_failures.inc(job=job.name)
+        print(f"[maintenance] {job.name} failed: {e}")
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        job.last_run = time.time()
+        try:
+            _save_last_run(job)
+        except Exception as e:
+            print(f"[maintenance] could not record {job.name} run: {e}")
+        job_duration.observe(elapsed, job=job.name)
+        job_last_duration.set(elapsed, job=job.name)
+    job_last_success.set(job.last_run, job=job.name)
+    return elapsed
+
+
+def due_jobs(now: float, jobs=JOBS) -> list:
+    window_open = in_window(datetime.fromtimestamp(now, timezone.utc))
+    return [
+        job for job in jobs
+        if now - job.last_run >= job.interval_seconds and (window_open or not job.window_only)
+    ]
+
+
+_leading = False
+
+
+def _tick() -> None:
+    global _leading
+    leader = acquire_lease()
+    is_leader.set(1 if leader else 0)
+    if leader and not _leading:
+        load_last_runs()
+    _leading = leader
+    if not leader:
+        return
+    ran_heavy = False
+    for job in due_jobs(time.time()):
+        # One window job per tick, so heavy jobs never run back to back
+        if job.window_only:
+            if ran_heavy:
+                continue
+            ran_heavy = True
+        try:
+            run_job(job)
+        except Exception:
+            pass
+        # Renew between jobs so a long run does not let the lease lapse
+        if not acquire_lease():
+            is_leader.set(0)
+            _leading = False
+            return
+
+
+async def maintenance_loop() -> None:
+    """Background task started with the app; see the module docstring."""
+    try:
+        while True:
+            try:
+                await run_in_threadpool(_tick)
+            except Exception as e:
+                print(f"[maintenance] tick failed: {e}")
+            await asyncio.sleep(TICK_SECONDS)
+    finally:
+        await run_in_threadpool(release_lease)
@@ -0,0 +1,111 @@
+"""
+In-process metrics exposed in the Prometheus text format at ``GET /metrics``.
+
+Each worker process keeps its own values; scrape every worker (or sum them
+in the query) when running more than one.
+"""
+import threading
+from typing import Dict, Tuple
+
+_lock = threading.Lock()
+_metrics: Dict[str, "_Metric"] = {}
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.values: Dict[Tuple, float] = {}
+
+    @staticmethod
+    def _key(labels: dict) -> Tuple:
+        return tuple(sorted(labels.items()))
+
+    def samples(self):
+        for key, value in self.values.items():
+            yield self.name, key, value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self.values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with _lock:
+            self.values[self._key(labels)] = value
+
+    def value(self, **labels) -> float:
+        return self.values.get(self._key(labels), 0)
+
+
+class Summary(_Metric):
+    """Count and sum of observations, enough for rates and averages."""
+    kind = "summary"
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            count, total = self.values.get(key, (0, 0.0))
+            self.values[key] = (count + 1, total + value)
+
+    def samples(self):
+        for key, (count, total) in self.values.items():
+            yield self.name + "_count", key, count
+            yield self.name + "_sum", key, total
+
+
+def _register(cls, name: str, help_text: str):
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = cls(name, help_text)
+    return metric
+
+
+def counter(name: str, help_text: str) -> Counter:
+    return _register(Counter, name, help_text)
+
+
+def gauge(name: str, help_text: str) -> Gauge:
+    return _register(Gauge, name, help_text)
+
+
+def summary(name: str, help_text: str) -> Summary:
+    return _register(Summary, name, help_text)
+
+
+def _format_labels(key: Tuple) -> str:
+    if not key:
+        return ""
+    parts = []
+    for name, value in key:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def render() -> str:
+    """All registered metrics in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        metrics = list(_metrics.values())
+        snapshot = [(m, list(m.samples())) for m in metrics]
+    for metric, samples in snapshot:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, key, value in samples:
+            lines.append(f"{name}{_format_labels(key)} {value}")
+    return "\n".join(lines) + "\n"
@@ -1,3 +1,8 @@
+import random
+
+from app.utils.skill_analyzer import analyze_skill_gap
+
+
 def generate_mock_interview_questions(analysis_result: dict) -> dict:
     """
     Generates mock interview questions based on skill gap analysis
@@ -70,3 +75,38 @@ def generate_mock_interview_questions(analysis_result: dict) -> dict:
     ])
 
     return questions
+
+
+# Question pools drawn from, most preferred first, when the LLM is unavailable
+FALLBACK_POOLS = {
+    "hr": ["behavioral_questions", "project_questions"],
+    "beginner": ["conceptual_questions", "technical_questions", "project_questions"],
+    "intermediate": ["technical_questions", "project_questions", "skill_gap_questions"],
+    "advanced": ["skill_gap_questions", "project_questions", "technical_questions"],
+}
+
+
+def generate_fallback_question(
+    resume_text: str,
+    job_description: str,
+    mode: str = "programming",
+    level: str = "beginner",
+    asked=()
+) -> str:
+    """
+    One template question from the skill gap between resume and JD, for when
+    the LLM cannot answer in time. Questions in ``asked`` are not repeated
+    while others remain.
+    """
+    analysis_result = analyze_skill_gap(resume_text or "", job_description or "")
+    questions = generate_mock_interview_questions(analysis_result)
+
+    pools = FALLBACK_POOLS["hr"] if mode.lower() == "hr" else FALLBACK_POOLS.get(level, FALLBACK_POOLS["beginner"])
+    asked = set(asked)
+    # The most preferred pool that still has a fresh question
+    for pool in pools:
+        fresh = [q for q in questions[pool] if q not in asked]
+        if fresh:
+            return random.choice(fresh)
+    # Every pool list includes the fixed project or behavioral questions
+    return random.choice([q for pool in pools for q in questions[pool]])
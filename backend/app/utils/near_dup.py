@@ -0,0 +1,166 @@
+"""
+Near-duplicate lookup for texts such as JDs and resumes (MinHash + LSH).
+
+Users often paste nearly the same JD for a popular role: extra whitespace,
+reordered sections, a different company blurb. Exact keys miss those. Here
+each text is normalized, cut into word shingles and reduced to a MinHash
+signature; banded LSH buckets give candidates in constant time and the
+estimated Jaccard similarity of the signatures decides whether a candidate
+is close enough (``threshold``).
+
+Several fields (e.g. JD and resume) can make up one key; their shingles are
+tagged with the field name so they never match each other. Everything that
+must match exactly (mode, level, prompt version) goes in ``namespace``.
+
+Only signatures are kept, never the texts. Per-process like ``TTLCache``.
+Signatures are computed with numpy when it is installed, in pure Python
+otherwise; both give the same values.
+"""
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    _NUMPY_AVAILABLE = False
+
+NEAR_DUP_THRESHOLD = float(os.getenv("SKILLIO_NEAR_DUP_THRESHOLD", "0.9"))
+NEAR_DUP_CACHE_TTL_SECONDS = float(os.getenv("SKILLIO_NEAR_DUP_CACHE_TTL_SECONDS", "3600"))
+NEAR_DUP_MAXSIZE = 2048
+
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs above ~0.7 similarity almost always share a
+# bucket, so any threshold from there up is only decided by the estimate
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Largest prime below 2**32: a * h + b stays below 2**64, so numpy's uint64
+# arithmetic cannot overflow
+_PRIME = 4294967291
+_rng = random.Random(0x5EED)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+if _NUMPY_AVAILABLE:
+    _PERM_A = np.array([a for a, _ in _PERMS], dtype=np.uint64)[:, None]
+    _PERM_B = np.array([b for _, b in _PERMS], dtype=np.uint64)[:, None]
+
+
+def normalize(text: str) -> list:
+    """Lowercased words with punctuation dropped."""
+    return re.sub(r"[^a-z0-9+#]+", " ", (text or "").lower()).split()
+
+
+def shingles(text: str, field: str = "") -> set:
+    words = normalize(text)
+    if len(words) < SHINGLE_SIZE:
+        return {f"{field}\x1f{' '.join(words)}"} if words else set()
+    return {
+        f"{field}\x1f{' '.join(words[i:i + SHINGLE_SIZE])}"
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def signature(fields: dict) -> tuple:
+    """MinHash signature of the union of every field's shingles."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big") % _PRIME
+        for name, text in sorted(fields.items())
+        for s in shingles(text, name)
+    ]
+    if not hashes:
+        return ()
+    if _NUMPY_AVAILABLE:
+        values = np.array(hashes, dtype=np.uint64)[None, :]
+        return tuple(int(v) for v in ((_PERM_A * values + _PERM_B) % _PRIME).min(axis=1))
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def similarity(sig_a: tuple, sig_b: tuple) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def _bands(namespace: str, sig: tuple) -> list:
+    return [(namespace, i, sig[i * ROWS:(i + 1) * ROWS]) for i in range(BANDS)]
+
+
+class NearDuplicateCache:
+    """Values keyed by near-duplicate texts, with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUP_THRESHOLD,
+        maxsize: int = NEAR_DUP_MAXSIZE,
+        ttl: float = NEAR_DUP_CACHE_TTL_SECONDS,
+    ):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # id -> (expires_at, namespace, sig, value)
+        self._buckets: defaultdict = defaultdict(set)
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _drop(self, entry_id: int) -> None:
+        _, namespace, sig, _ = self._entries.pop(entry_id)
+        for band in _bands(namespace, sig):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[band]
+
+    def find(self, namespace: str, fields: dict, sig: tuple | None = None):
+        """``(value, similarity)`` of the closest entry at or above the threshold, else None."""
+        sig = signature(fields) if sig is None else sig
+        if not sig:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            candidates = set()
+            for band in _bands(namespace, sig):
+                candidates.update(self._buckets.get(band, ()))
+            best_id, best = None, self.threshold
+            for entry_id in candidates:
+                expires_at, _, other, _ = self._entries[entry_id]
+                if expires_at <= now:
+                    self._drop(entry_id)
+                    continue
+                score = similarity(sig, other)
+                if score >= best:
+                    best_id, best = entry_id, score
+            if best_id is None:
+                return None
+            self._entries.move_to_end(best_id)
+            return self._entries[best_id][3], best
+
+    def add(self, namespace: str, fields: dict, value, sig: tuple | None = None) -> None:
+        sig = signature(fields) if sig is None else sig
+        if not sig:
+            return
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (time.monotonic() + self.ttl, namespace, sig, value)
+            for band in _bands(namespace, sig):
+                self._buckets[band].add(entry_id)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
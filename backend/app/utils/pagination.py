@@ -0,0 +1,62 @@
+"""
+Keyset (cursor) pagination helpers shared by the list endpoints.
+
+Lists are ordered newest first by primary key. Ids grow with insert order, so
+this matches the old created_at ordering while staying stable across ties and
+letting each page start with an index seek instead of an OFFSET scan.
+"""
+import base64
+import binascii
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_CURSOR_PREFIX = "v1:"
+
+
+def encode_cursor(key: int) -> str:
+    """Turn the last key of a page into an opaque cursor token."""
+    return base64.urlsafe_b64encode(f"{_CURSOR_PREFIX}{key}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    """Decode a cursor token back into a key; ``None`` means the first page."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError(raw)
+        return int(raw[len(_CURSOR_PREFIX):])
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def clamp_limit(limit: int | None) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def keyset_page(query, key_column, cursor: str | None, limit: int):
+    """Restrict ``query`` to the page after ``cursor``, newest first.
+
+    Works on both ORM ``Query`` and ``select()`` statements. One extra row is
+    fetched so ``split_page`` can tell whether another page exists.
+    """
+    after = decode_cursor(cursor)
+    if after is not None:
+        query = query.where(key_column < after)
+    return query.order_by(key_column.desc()).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, key=lambda row: row.id):
+    """Return ``(items, next_cursor)`` for rows fetched via ``keyset_page``."""
+    items = rows[:limit]
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > limit else None
+    return items, next_cursor
@@ -0,0 +1,231 @@
+"""
+Bulk import of resumes from a zip archive or a directory.
+
+Members are read one at a time (zip members are streamed out of the archive,
+never extracted as a whole) and hashed; a file whose bytes the user already
+has is reported as a duplicate without being parsed. The rest are parsed in
+a shared process pool, written to the user's upload folder and inserted in
+batched transactions. ``import_resumes`` yields one result per file as it
+goes so callers can stream the report.
+
+At most ``2 * IMPORT_WORKERS`` files are in flight, which bounds memory to a
+few files regardless of the archive size.
+"""
+import hashlib
+import multiprocessing
+import os
+import threading
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.resume import Resume
+from app.models.user_stats import bump_user_stats
+from app.utils.bulk_delete import remove_files
+from app.utils.resume_parser import extract_text_from_bytes
+from app.utils.upload_gc import UPLOAD_DIR
+
+IMPORT_WORKERS = int(os.getenv("SKILLIO_IMPORT_WORKERS", str(min(4, os.cpu_count() or 1))))
+IMPORT_BATCH_SIZE = 50
+MAX_IMPORT_FILE_BYTES = 10 * 1024 * 1024
+ALLOWED_EXTENSIONS = (".pdf", ".docx")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """The process pool shared by every import in this process."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: forking a process that is running threads
+            # (the server's threadpool) can leave locks held in the child
+            _pool = ProcessPoolExecutor(IMPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ------------------------
+# Sources
+# ------------------------
+def _check_name(name: str) -> str | None:
+    if not name.lower().endswith(ALLOWED_EXTENSIONS):
+        return "Only PDF and DOCX files are allowed"
+    return None
+
+
+def _zip_members(path: str) -> Iterator[tuple]:
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or os.path.basename(name).startswith(".") or name.startswith("__MACOSX/"):
+                continue
+            error = _check_name(name)
+            if error is None and info.file_size > MAX_IMPORT_FILE_BYTES:
+                error = "File is too large"
+            if error:
+                yield name, None, error
+                continue
+            with archive.open(info) as member:
+                # The header size can lie; never read more than the limit
+                data = member.read(MAX_IMPORT_FILE_BYTES + 1)
+            if len(data) > MAX_IMPORT_FILE_BYTES:
+                yield name, None, "File is too large"
+                continue
+            yield name, data, None
+
+
+def _dir_members(path: str) -> Iterator[tuple]:
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for filename in sorted(files):
+            if filename.startswith("."):
+                continue
+            full_path = os.path.join(root, filename)
+            name = os.path.relpath(full_path, path)
+            error = _check_name(name)
+            if error is None and os.path.getsize(full_path) > MAX_IMPORT_FILE_BYTES:
+                error = "File is too large"
+            if error:
+                yield name, None, error
+                continue
+            with open(full_path, "rb") as f:
+                yield name, f.read(), None
+
+
+def iter_members(source: str) -> Iterator[tuple]:
+    """Yield ``(name, data, error)`` for each file in a zip archive or directory."""
+    if os.path.isdir(source):
+        return _dir_members(source)
+    return _zip_members(source)
+
+
+# ------------------------
+# Import
+# ------------------------
+def _insert_batch(db: Session, user_id: int, rows: list) -> list:
+    # Bulk insert skips the mapper events, so the counter is bumped here
+    ids = db.scalars(insert(Resume).returning(Resume.id, sort_by_parameter_order=True), rows).all()
+    bump_user_stats(db.connection(), user_id, resumes=len(rows))
+    db.commit()
+    return ids
+
+
+def import_resumes(db: Session, user_id: int, source: str, batch_size: int = IMPORT_BATCH_SIZE) -> Iterator[dict]:
+    """Import every resume in ``source``; yields a result dict per file.
+
+    ``status`` is ``imported`` (with ``id``), ``duplicate``, ``skipped`` or
+    ``failed`` (both with ``error``).
+    """
+    user_folder = os.path.join(UPLOAD_DIR, f"user_{user_id}")
+    os.makedirs(user_folder, exist_ok=True)
+
+    seen = set(db.scalars(
+        select(Resume.content_sha256)
+        .where(Resume.user_id == user_id, Resume.content_sha256.is_not(None))
+    ))
+    db.rollback()
+
+    pool = get_pool()
+    max_in_flight = 2 * IMPORT_WORKERS
+    in_flight = {}
+    pending = []
+
+    def collect(futures):
+        for future in futures:
+            name, digest, data = in_flight.pop(future)
+            try:
+                text = future.result()
+            except BrokenProcessPool:
+                shutdown_pool()
+                raise
+            except Exception as e:
+                yield {"file": name, "status": "failed", "error": f"Failed to extract text: {e}"}
+                continue
+            if not text:
+                yield {"file": name, "status": "failed", "error": "Could not extract text from resume"}
+                continue
+            file_path = os.path.join(user_folder, f"{uuid.uuid4().hex[:12]}_{os.path.basename(name)}")
+            with open(file_path, "wb") as f:
+                f.write(data)
+            pending.append((name, {
+                "user_id": user_id,
+                "filename": os.path.basename(name),
+                "file_path": file_path,
+                "content_sha256": digest,
+                "extracted_text": text,
+            }))
+
+    def flush():
+        if not pending:
+            return
+        names, rows = zip(*pending)
+        pending.clear()
+        try:
+            ids = _insert_batch(db, user_id, list(rows))
+        except Exception as e:
+            db.rollback()
+            remove_files(row["file_path"] for row in rows)
+            for name, row in zip(names, rows):
+                seen.discard(row["content_sha256"])
+                yield {"file": name, "status": "failed", "error": f"Failed to save resume: {e}"}
+            return
+        for name, row, resume_id in zip(names, rows, ids):
+            yield {
+                "file": name,
+                "status": "imported",
+                "id": resume_id,
+                "text_length": len(row["extracted_text"]),
+            }
+
+    try:
+        for name, data, error in iter_members(source):
+            if error:
+                yield {"file": name, "status": "skipped", "error": error}
+                continue
+            digest = hashlib.sha256(data).hexdigest()
+            if digest in seen:
+                yield {"file": name, "status": "duplicate"}
+                continue
+            seen.add(digest)
+
+            in_flight[pool.submit(extract_text_from_bytes, name, data)] = (name, digest, data)
+            while len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+            if len(pending) >= batch_size:
+                yield from flush()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+            if len(pending) >= batch_size:
+                yield from flush()
+        yield from flush()
+    finally:
+        # Reached early when the caller stops reading (e.g. the client went
+        # away): nothing parsed but not committed is left on disk
+        for future in in_flight:
+            future.cancel()
+        remove_files(row["file_path"] for _, row in pending)
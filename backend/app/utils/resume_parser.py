@@ -1,3 +1,5 @@
+import io
+
 from PyPDF2 import PdfReader
 from docx import Document
 
@@ -13,3 +15,11 @@ def extract_text_from_pdf(file_path: str) -> str:
 def extract_text_from_docx(file_path: str) -> str:
     doc = Document(file_path)
     return "\n".join([para.text for para in doc.paragraphs]).strip()
+
+
+def extract_text_from_bytes(filename: str, data: bytes) -> str:
+    """Parse an in-memory PDF or DOCX; picklable, so it can run in a worker process."""
+    stream = io.BytesIO(data)
+    if filename.lower().endswith(".pdf"):
+        return extract_text_from_pdf(stream)
+    return extract_text_from_docx(stream)
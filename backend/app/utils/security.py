@@ -1,12 +1,24 @@
+import re
 from passlib.context import CryptContext
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Annotated
 from jose import jwt, JWTError
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event
+
+from app.database import SessionLocal, async_engine, engine
+from app.models.user import User
+from app.utils.cache import TTLCache
 
 SECRET_KEY = "supersecretkey"
 ALGORITHM = "HS256"
 
+# How long a resolved principal is trusted before the users row is re-read
+PRINCIPAL_CACHE_TTL_SECONDS = 300
+
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -22,18 +34,116 @@ def create_access_token(data: dict, expires_minutes: int = 60):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+def _decode_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str | None = payload.get("sub")
-        if email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token"
-            )
-        return email
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
         )
+
+def get_current_user(token: str = Depends(oauth2_scheme)):
+    payload = _decode_token(token)
+    email: str | None = payload.get("sub")
+    if email is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+    return email
+
+
+# ------------------------
+# Principal resolution
+# ------------------------
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user, detached from any DB session."""
+    id: int
+    email: str
+    name: str
+
+
+_principal_cache = TTLCache(maxsize=4096, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def _load_principal(user_id: int | None = None, email: str | None = None) -> Principal | None:
+    db = SessionLocal()
+    try:
+        query = db.query(User.id, User.email, User.name)
+        if user_id is not None:
+            row = query.filter(User.id == user_id).first()
+        else:
+            row = query.filter(User.email == email).first()
+        return Principal(id=row.id, email=row.email, name=row.name) if row else None
+    finally:
+        db.close()
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop a cached principal so the next request re-reads the users row."""
+    _principal_cache.pop(user_id)
+
+
+async def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    """Resolve the bearer token to a Principal.
+
+    Tokens carry the immutable user id in the ``uid`` claim, so the common
+    path is a cache hit with no query at all and never leaves the event loop.
+    Tokens issued before the claim existed fall back to a lookup by email.
+    """
+    payload = _decode_token(token)
+    user_id = payload.get("uid")
+    email = payload.get("sub")
+    if user_id is None and email is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+
+    principal = _principal_cache.get(user_id) if user_id is not None else None
+    if principal is None:
+        principal = await run_in_threadpool(
+            _load_principal, user_id=user_id, email=email if user_id is None else None
+        )
+        if principal is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        _principal_cache.set(principal.id, principal)
+    return principal
+
+
+CurrentUser = Annotated[Principal, Depends(get_current_principal)]
+
+
+# Any UPDATE or DELETE on users clears the cache once it commits. Matching
+# the SQL covers ORM flushes, Core update()/delete(), query.update() and raw
+# SQL alike; mapper events would miss all but the first. Clearing before the
+# commit would let a concurrent request re-cache the row as it was. Writes
+# from another process (migration scripts, the sqlite3 shell) cannot reach
+# this cache; they show up once PRINCIPAL_CACHE_TTL_SECONDS have passed.
+_USERS_WRITE = re.compile(r'^\s*(?:UPDATE|DELETE\s+FROM)\s+"?users"?[\s(]', re.IGNORECASE)
+_PENDING_KEY = "principal_cache_stale"
+
+
+@event.listens_for(engine, "after_cursor_execute")
+@event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+def _note_users_write(connection, cursor, statement, parameters, context, executemany):
+    if _USERS_WRITE.match(statement):
+        connection.info[_PENDING_KEY] = True
+
+
+@event.listens_for(engine, "commit")
+@event.listens_for(async_engine.sync_engine, "commit")
+def _invalidate_on_commit(connection):
+    if connection.info.pop(_PENDING_KEY, False):
+        _principal_cache.clear()
+
+
+@event.listens_for(engine, "rollback")
+@event.listens_for(async_engine.sync_engine, "rollback")
+def _discard_on_rollback(connection):
+    connection.info.pop(_PENDING_KEY, None)
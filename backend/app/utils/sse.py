@@ -0,0 +1,71 @@
+"""
+Server-sent events helpers for streaming LLM output to the browser.
+
+``relay`` runs a blocking token iterator (``stream_complete`` and the
+engines built on it) in a worker thread and hands its items to an async
+generator. The iterator is only ever touched from that thread. When the
+consumer stops (the client disconnected and Starlette cancelled the
+response), the thread is told to stop and closes the iterator itself,
+which closes the upstream HTTP stream.
+"""
+import asyncio
+import json
+import threading
+from typing import AsyncIterator, Callable, Iterator
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stops nginx from buffering the stream into one response
+    "X-Accel-Buffering": "no",
+}
+
+_DONE = object()
+
+
+def sse_event(data: dict, event: str | None = None) -> str:
+    lines = [f"event: {event}"] if event else []
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def relay(make_iterator: Callable[[], Iterator[str]]) -> AsyncIterator[str]:
+    """Yield the items of ``make_iterator()`` without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def put(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed (server shutting down)
+            stop.set()
+
+    def worker() -> None:
+        iterator = None
+        try:
+            iterator = make_iterator()
+            for item in iterator:
+                if stop.is_set():
+                    break
+                put(item)
+        except Exception as e:
+            put(e)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            put(_DONE)
+
+    thread = threading.Thread(target=worker, name="sse-relay", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,88 @@
+"""
+Recount the user_stats counters from the source tables.
+
+The mapper events in ``app.models.user_stats`` keep counters current on every
+write; this is the safety net for rows written before the table existed,
+set-based statements that bypassed the events, or manual edits to the DB.
+"""
+from typing import Dict, Iterable, List
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.analysis import AnalysisHistory
+from app.models.chat_history import InterviewSession, InterviewMessage
+from app.models.job_description import JobDescription
+from app.models.resume import Resume
+from app.models.user import User
+from app.models.user_stats import UserStats, COUNTER_COLUMNS
+
+
+def _counts_by_user(user_ids: List[int] | None) -> Dict[str, List[Select]]:
+    def grouped(user_column, *joins, total=func.count()):
+        stmt = select(user_column, total)
+        for target, onclause in joins:
+            stmt = stmt.join(target, onclause)
+        if user_ids is not None:
+            stmt = stmt.where(user_column.in_(user_ids))
+        return stmt.group_by(user_column)
+
+    return {
+        "analyses": [grouped(AnalysisHistory.user_id)],
+        "interview_sessions": [grouped(InterviewSession.user_id)],
+        "interview_messages": [
+            grouped(
+                InterviewSession.user_id,
+                (InterviewMessage, InterviewMessage.session_id == InterviewSession.id),
+            ),
+            # Archived transcripts still count; see app.utils.archiver
+            grouped(
+                InterviewSession.user_id,
+                total=func.coalesce(func.sum(InterviewSession.archived_message_count), 0),
+            ),
+        ],
+        "resumes": [grouped(Resume.user_id)],
+        "job_descriptions": [grouped(JobDescription.user_id)],
+    }
+
+
+def reconcile_user_stats(db: Session, user_ids: Iterable[int] | None = None) -> int:
+    """Rewrite counters that disagree with the source tables.
+
+    ``user_ids`` limits the pass to those users; ``None`` checks everyone.
+    ``db`` may be a Session or a Connection (as inside mapper events).
+    Returns the number of user_stats rows that were created or corrected.
+    The caller commits.
+    """
+    user_ids = sorted(set(user_ids)) if user_ids is not None else None
+
+    users_stmt = select(User.id)
+    stored_stmt = select(UserStats.user_id, *(getattr(UserStats, c) for c in COUNTER_COLUMNS))
+    if user_ids is not None:
+        users_stmt = users_stmt.where(User.id.in_(user_ids))
+        stored_stmt = stored_stmt.where(UserStats.user_id.in_(user_ids))
+
+    actual = {uid: dict.fromkeys(COUNTER_COLUMNS, 0) for uid in db.scalars(users_stmt)}
+    for column, stmts in _counts_by_user(user_ids).items():
+        for stmt in stmts:
+            for uid, count in db.execute(stmt):
+                if uid in actual:
+                    actual[uid][column] += count
+
+    stored = {
+        row.user_id: {c: getattr(row, c) for c in COUNTER_COLUMNS}
+        for row in db.execute(stored_stmt)
+    }
+
+    repaired = 0
+    for uid, counts in actual.items():
+        if stored.get(uid) == counts:
+            continue
+        stmt = sqlite_insert(UserStats).values(user_id=uid, **counts)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[UserStats.user_id],
+            set_={**counts, "updated_at": func.now()},
+        ))
+        repaired += 1
+    return repaired
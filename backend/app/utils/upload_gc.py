@@ -0,0 +1,147 @@
+"""
+Garbage collection for uploaded resume files.
+
+Files under ``UPLOAD_DIR`` that no resumes row points at are orphans: left by
+a crash between writing the file and committing the row, a failed upload,
+or an older copy of an overwritten file. The collector walks the directory
+in batches, checks each batch with one indexed lookup, and moves orphans
+into ``.quarantine`` rather than deleting them. Quarantined files are only
+deleted once they have sat there for ``QUARANTINE_DAYS``, and are moved back
+if a row references them again in the meantime.
+
+The database is only read, in short per-batch queries, so the collector can
+run while the API is serving traffic. It never changes the schema.
+"""
+import os
+import time
+from typing import Iterator, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.resume import Resume
+from app.utils import metrics
+
+UPLOAD_DIR = "uploads"
+QUARANTINE_DIR = os.path.join(UPLOAD_DIR, ".quarantine")
+
+GC_BATCH_SIZE = 500
+# Files younger than this may belong to an upload whose row is not committed yet
+GRACE_SECONDS = 60 * 60
+QUARANTINE_DAYS = int(os.getenv("SKILLIO_UPLOAD_QUARANTINE_DAYS", "7"))
+
+reclaimed_bytes = metrics.counter(
+    "skillio_upload_gc_reclaimed_bytes_total", "Bytes freed by deleting orphaned uploads"
+)
+quarantined_files = metrics.counter(
+    "skillio_upload_gc_quarantined_files_total", "Orphaned uploads moved to quarantine"
+)
+
+
+def _walk(root: str, skip: str | None = None) -> Iterator[os.DirEntry]:
+    """Yield every file under ``root`` without building the full list."""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != skip:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _batches(entries: Iterator[os.DirEntry], size: int) -> Iterator[List[os.DirEntry]]:
+    batch = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _referenced(db: Session, paths: List[str]) -> set:
+    return set(db.scalars(select(Resume.file_path).where(Resume.file_path.in_(paths))))
+
+
+def _original_path(quarantined: str) -> str:
+    return os.path.join(UPLOAD_DIR, os.path.relpath(quarantined, QUARANTINE_DIR))
+
+
+def collect_upload_garbage(db: Session, dry_run: bool = False, batch_size: int = GC_BATCH_SIZE) -> dict:
+    """One GC pass over uploads/ and the quarantine; returns counts and bytes."""
+    now = time.time()
+    report = {
+        "scanned": 0,
+        "quarantined": 0,
+        "restored": 0,
+        "deleted": 0,
+        "reclaimed_bytes": 0,
+        "missing_files": 0,
+    }
+
+    # The file_path lookups rely on ix_resumes_file_path (add_pagination_indexes.py)
+
+    # 1. Quarantine orphans
+    for batch in _batches(_walk(UPLOAD_DIR, skip=QUARANTINE_DIR), batch_size):
+        report["scanned"] += len(batch)
+        referenced = _referenced(db, [e.path for e in batch])
+        for entry in batch:
+            if entry.path in referenced or now - entry.stat().st_mtime < GRACE_SECONDS:
+                continue
+            report["quarantined"] += 1
+            if dry_run:
+                continue
+            target = os.path.join(QUARANTINE_DIR, os.path.relpath(entry.path, UPLOAD_DIR))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(entry.path, target)
+            # mtime now records when the file entered quarantine
+            os.utime(target)
+            quarantined_files.inc()
+        db.rollback()
+
+    # 2. Delete files that sat out the quarantine, unless referenced again
+    cutoff = now - QUARANTINE_DAYS * 24 * 60 * 60
+    for batch in _batches(_walk(QUARANTINE_DIR), batch_size):
+        originals = {e.path: _original_path(e.path) for e in batch}
+        referenced = _referenced(db, list(originals.values()))
+        for entry in batch:
+            original = originals[entry.path]
+            if original in referenced:
+                report["restored"] += 1
+                if not dry_run:
+                    os.makedirs(os.path.dirname(original), exist_ok=True)
+                    os.replace(entry.path, original)
+                continue
+            if entry.stat().st_mtime > cutoff:
+                continue
+            size = entry.stat().st_size
+            report["deleted"] += 1
+            report["reclaimed_bytes"] += size
+            if not dry_run:
+                os.remove(entry.path)
+                reclaimed_bytes.inc(size)
+        db.rollback()
+
+    # 3. Rows whose file is gone; reported only, the extracted text is still usable
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Resume.id, Resume.file_path)
+            .where(Resume.id > last_id)
+            .order_by(Resume.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        report["missing_files"] += sum(1 for row in rows if not os.path.exists(row.file_path))
+        last_id = rows[-1].id
+        db.rollback()
+
+    return report
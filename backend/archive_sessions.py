@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""Script to move idle interview transcripts to cold storage.
+
+The maintenance scheduler runs the same pass every
+SKILLIO_ARCHIVE_INTERVAL_SECONDS inside its window; this runs it once, e.g.
+from cron with SKILLIO_ARCHIVE_INTERVAL_SECONDS=0.
+
+    python archive_sessions.py            # SKILLIO_ARCHIVE_IDLE_DAYS, default 90
+    python archive_sessions.py 30         # sessions idle for 30+ days
+"""
+
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.utils.archiver import ARCHIVE_DIR, ARCHIVE_IDLE_DAYS, run_archive_pass
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Archiving Idle Interview Sessions")
+    print("=" * 60)
+
+    idle_days = int(sys.argv[1]) if len(sys.argv) > 1 else ARCHIVE_IDLE_DAYS
+    print(f"Idle threshold: {idle_days} days, archive directory: {ARCHIVE_DIR}")
+
+    try:
+        result = run_archive_pass(idle_days)
+    except Exception as e:
+        print(f"\n✗ Archiving failed: {e}")
+    else:
+        print(f"\n✓ Archived {result['sessions']} sessions ({result['messages']} messages)")
+        print(f"✓ Compaction reclaimed {result['reclaimed_bytes']:,} bytes")
+
+    print("=" * 60)
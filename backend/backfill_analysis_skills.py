@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Script to backfill the analysis_skill table from analysis_history."""
+
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import select
+
+from app.database import Base, engine, SessionLocal
+from app.models.analysis import AnalysisHistory
+from app.models.analysis_skill import AnalysisSkill
+from app.utils.analysis_skills import record_analysis_skills, split_skills
+
+BATCH_SIZE = 500
+
+def backfill_analysis_skills():
+    """Split matched/missing skill strings of analyses that have no analysis_skill rows yet."""
+
+    # Creates the skills and analysis_skill tables if they are missing
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    done = 0
+    last_id = 0
+    try:
+        while True:
+            already = select(AnalysisSkill.analysis_id)
+            records = db.execute(
+                select(AnalysisHistory.id, AnalysisHistory.matched_skills, AnalysisHistory.missing_skills)
+                .where(AnalysisHistory.id > last_id, AnalysisHistory.id.not_in(already))
+                .order_by(AnalysisHistory.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not records:
+                break
+
+            for analysis_id, matched, missing in records:
+                record_analysis_skills(db, analysis_id, split_skills(matched), split_skills(missing))
+            db.commit()
+
+            done += len(records)
+            last_id = records[-1].id
+            print(f"  ... {done} analyses backfilled")
+        return done
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error backfilling analysis skills: {e}")
+        return None
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Backfilling Analysis Skills")
+    print("=" * 60)
+
+    count = backfill_analysis_skills()
+
+    if count is None:
+        print("\n✗ Backfill failed!")
+    else:
+        print(f"\n✓ Backfill complete: {count} analyses normalized.")
+
+    print("=" * 60)
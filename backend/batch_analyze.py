@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Score a resume corpus against a JD corpus offline, on every core.
+
+    python batch_analyze.py --resumes ./cohort --jds db --out reports/cohort
+    python batch_analyze.py --resumes db --jds ./jds --user coach@example.com \\
+        --stages skill_gap,ats --format parquet --out reports/spring
+
+A corpus is a directory of PDF/DOCX/TXT files or ``db`` for the stored
+resumes / job descriptions (optionally only those of --user). Re-running the
+same command resumes from the last finished chunk; see
+app.utils.batch_analysis for the output layout.
+"""
+
+import argparse
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.utils.batch_analysis import CHUNK_SIZE, STAGES, load_db_corpus, load_dir_corpus, run_batch
+
+def load_corpus(source, kind, email, workers):
+    if source == "db":
+        return load_db_corpus(kind, email)
+    if not os.path.isdir(source):
+        raise ValueError(f"{source} is not a directory")
+    return load_dir_corpus(source, workers)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", required=True, help="directory or 'db'")
+    parser.add_argument("--jds", required=True, help="directory or 'db'")
+    parser.add_argument("--out", required=True, help="output directory (checkpoints live here too)")
+    parser.add_argument("--user", help="with 'db', only this user's documents")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"comma-separated subset of {', '.join(STAGES)}")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="pairs per task")
+    parser.add_argument("--restart", action="store_true", help="discard earlier progress in --out")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Batch Analysis")
+    print("=" * 60)
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown or not stages:
+        print(f"✗ Unknown stages: {', '.join(unknown) or '(none given)'}")
+        sys.exit(1)
+
+    try:
+        started = time.perf_counter()
+        resumes = load_corpus(args.resumes, "resumes", args.user, args.workers)
+        jds = load_corpus(args.jds, "jds", args.user, args.workers)
+        load_seconds = time.perf_counter() - started
+        print(f"✓ Loaded {len(resumes)} resumes and {len(jds)} JDs in {load_seconds:.1f}s")
+
+        stats = run_batch(
+            resumes, jds, args.out, stages,
+            fmt=args.format,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            restart=args.restart,
+            load_seconds=load_seconds,
+        )
+    except Exception as e:
+        print(f"\n✗ Batch analysis failed: {e}")
+        print("=" * 60)
+        sys.exit(1)
+
+    if stats["chunks_resumed"]:
+        print(f"✓ Resumed: {stats['chunks_resumed']}/{stats['chunks']} chunks were already done")
+    print(f"\n{'stage':<12}{'items':>10}{'seconds':>10}{'per worker/s':>14}")
+    for stage, s in stats["stages"].items():
+        rate = s.get("per_worker_per_second")
+        if stage == "load":
+            rate = round(s["items"] / s["seconds"], 1) if s["seconds"] else None
+        print(f"{stage:<12}{s['items']:>10}{s['seconds']:>10.2f}{rate if rate is not None else '-':>14}")
+    if stats["pairs_per_second"]:
+        print(f"\n✓ {stats['pairs_scored']} pairs in {stats['wall_seconds']:.1f}s "
+              f"({stats['pairs_per_second']:,.0f} pairs/s on {stats['workers']} workers)")
+    print(f"✓ Results: {stats['output']}")
+
+    print("=" * 60)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""Size and latency trade-offs of the CompressedText column type.
+
+Compresses a corpus of resumes and job descriptions with every available
+codec and reports the compression ratio and per-document encode/decode cost.
+With zstandard installed it also trains a dictionary on a second sample and
+reports zstd with it. It then loads the corpus into two scratch SQLite files,
+one plain and one compressed, and times a list query that skips the text
+against a full read.
+
+    python benchmarks/bench_compression.py                    # synthetic corpus
+    python benchmarks/bench_compression.py --db skillio.db    # real documents
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils import compression
+from app.utils.compression import compress_text, decompress_text
+
+SECTIONS = ["Summary", "Experience", "Projects", "Education", "Skills", "Certifications"]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "SQL", "PostgreSQL", "Docker", "Kubernetes",
+    "AWS", "Azure", "GCP", "FastAPI", "Django", "Flask", "React", "Node.js", "REST APIs",
+    "microservices", "CI/CD", "machine learning", "data structures", "algorithms", "system design",
+]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Automated", "Implemented", "Maintained"]
+OBJECTS = [
+    "a payment processing service", "the internal analytics dashboard", "a recommendation pipeline",
+    "REST endpoints for the mobile app", "the CI/CD pipeline", "a real-time chat backend",
+    "data ingestion jobs", "the authentication layer", "an inventory management system",
+]
+OUTCOMES = [
+    "reducing latency by {n}%", "serving {n}k daily users", "cutting cloud costs by {n}%",
+    "improving test coverage to {n}%", "handling {n}k requests per minute",
+]
+JD_LINES = [
+    "We are looking for a {level} {role} to join our {team} team.",
+    "You will design, build and operate services used by millions of customers.",
+    "Strong experience with {a} and {b} is required.",
+    "Familiarity with {a}, {b} or {c} is a plus.",
+    "You have {n}+ years of professional software development experience.",
+    "You care about code quality, testing and observability.",
+    "Benefits include health insurance, flexible hours and a learning budget.",
+]
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    docs = []
+    for i in range(count):
+        if i % 2:
+            lines = [f"{rng.choice(['Jane', 'Arjun', 'Wei', 'Maria'])} {rng.choice(['Doe', 'Patel', 'Chen', 'Garcia'])}"]
+            for section in SECTIONS:
+                lines.append(section.upper())
+                for _ in range(rng.randint(3, 8)):
+                    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+                    lines.append(
+                        f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using "
+                        f"{rng.choice(SKILLS)} and {rng.choice(SKILLS)}, {outcome}."
+                    )
+            docs.append("\n".join(lines))
+        else:
+            lines = []
+            for _ in range(rng.randint(8, 20)):
+                a, b, c = rng.sample(SKILLS, 3)
+                lines.append(rng.choice(JD_LINES).format(
+                    level=rng.choice(["junior", "mid-level", "senior"]),
+                    role=rng.choice(["backend engineer", "full-stack developer", "data engineer"]),
+                    team=rng.choice(["platform", "payments", "growth"]),
+                    a=a, b=b, c=c, n=rng.randint(1, 8),
+                ))
+            docs.append("\n".join(lines))
+    return docs
+
+
+def db_corpus(path: str) -> list:
+    con = sqlite3.connect(path)
+    con.create_function("decompress", 1, decompress_text)
+    docs = []
+    for table, column in (("resumes", "extracted_text"), ("job_descriptions", "content"), ("documents", "content")):
+        try:
+            docs += [row[0] for row in con.execute(f"SELECT decompress({column}) FROM {table}")]
+        except sqlite3.OperationalError:
+            pass
+    con.close()
+    return [d for d in docs if d]
+
+
+def use_dictionary(training: list) -> None:
+    """Train a zstd dictionary and make compress_text use it from now on."""
+    import zstandard
+
+    dictionary = zstandard.train_dictionary(64 * 1024, [d.encode("utf-8") for d in training])
+    fd, path = tempfile.mkstemp(suffix=".zdict")
+    with os.fdopen(fd, "wb") as f:
+        f.write(dictionary.as_bytes())
+    os.environ["SKILLIO_ZSTD_DICT"] = path
+
+
+def bench_codec(docs: list, codec: str) -> dict:
+    raw = sum(len(d.encode("utf-8")) for d in docs)
+    start = time.perf_counter()
+    packed = [compress_text(d, codec=codec) for d in docs]
+    encode = time.perf_counter() - start
+    start = time.perf_counter()
+    for p in packed:
+        decompress_text(p)
+    decode = time.perf_counter() - start
+    stored = sum(len(p) if isinstance(p, bytes) else len(p.encode("utf-8")) for p in packed)
+    return {
+        "codec": codec,
+        "raw": raw,
+        "stored": stored,
+        "ratio": raw / stored,
+        "encode_us": encode / len(docs) * 1e6,
+        "decode_us": decode / len(docs) * 1e6,
+    }
+
+
+def bench_table(docs: list, compressed: bool, rounds: int) -> dict:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE resumes (id INTEGER PRIMARY KEY, user_id INTEGER, filename TEXT, extracted_text TEXT)")
+    con.executemany(
+        "INSERT INTO resumes (user_id, filename, extracted_text) VALUES (1, ?, ?)",
+        [(f"resume_{i}.pdf", compress_text(d) if compressed else d) for i, d in enumerate(docs)]
+    )
+    con.commit()
+    con.execute("VACUUM")
+    size = os.path.getsize(path)
+
+    def timed(sql, decode):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for row in con.execute(sql):
+                if decode:
+                    decompress_text(row[-1])
+        return (time.perf_counter() - start) / rounds * 1000
+
+    result = {
+        "size": size,
+        "list_ms": timed("SELECT id, filename FROM resumes", False),
+        "full_ms": timed("SELECT id, filename, extracted_text FROM resumes", compressed),
+    }
+    con.close()
+    os.remove(path)
+    return result
+
+
+def main(args):
+    docs = db_corpus(args.db) if args.db else synthetic_corpus(args.count)
+    if not docs:
+        sys.exit("No documents found")
+    sizes = sorted(len(d) for d in docs)
+    print(f"{len(docs)} documents, median {sizes[len(sizes) // 2]:,} chars, "
+          f"zstd {'available' if compression._ZSTD_AVAILABLE else 'not installed'}, "
+          f"zlib {zlib.ZLIB_RUNTIME_VERSION}\n")
+
+    def report(label, r):
+        print(f"{label:<10} {r['raw']:>12,} {r['stored']:>12,} {r['ratio']:>6.2f} "
+              f"{r['encode_us']:>10.1f} {r['decode_us']:>10.1f}")
+
+    print(f"{'codec':<10} {'raw bytes':>12} {'stored':>12} {'ratio':>6} {'encode us':>10} {'decode us':>10}")
+    report("zlib", bench_codec(docs, "zlib"))
+    if compression._ZSTD_AVAILABLE:
+        report("zstd", bench_codec(docs, "zstd"))
+        # Train on a separate sample so the dictionary has not seen the corpus
+        training = db_corpus(args.db) if args.db else synthetic_corpus(args.count, seed=8)
+        use_dictionary(training)
+        report("zstd+dict", bench_codec(docs, "zstd"))
+
+    print(f"\n{'table':<10} {'file bytes':>12} {'list ms':>9} {'full read ms':>13}")
+    for label, compressed in (("plain", False), ("compressed", True)):
+        r = bench_table(docs, compressed, args.rounds)
+        print(f"{label:<10} {r['size']:>12,} {r['list_ms']:>9.2f} {r['full_ms']:>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", help="read documents from this SQLite file instead of generating them")
+    parser.add_argument("--count", type=int, default=2000, help="synthetic documents to generate")
+    parser.add_argument("--rounds", type=int, default=5, help="repetitions of each table query")
+    main(parser.parse_args())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Concurrency benchmark for the DB-bound read endpoints.
+
+Fires a fixed number of authenticated GETs at a running backend with a given
+number of requests in flight and reports throughput and latency percentiles.
+Run it against the same database before and after a change:
+
+    uvicorn app.main:app --port 8000 --workers 1
+    python benchmarks/bench_concurrency.py --email test@example.com --password password123
+
+``--hold N`` keeps N interview starts in flight in the background for the
+whole run, which is what ties up worker threads in production. Pair it with
+benchmarks/slow_llm_stub.py so each of those calls waits on a slow provider.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/resume/history",
+    "/analysis/history",
+    "/interview/sessions",
+]
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/auth/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def _run_level(client: httpx.AsyncClient, paths: list, concurrency: int, total: int) -> dict:
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            path = paths[i % len(paths)]
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def _hold_llm_calls(client: httpx.AsyncClient, stop: asyncio.Event):
+    while not stop.is_set():
+        try:
+            await client.post("/interview/session/start", json={"job_description": "Backend engineer, Python"})
+        except httpx.HTTPError:
+            pass
+
+
+async def main(args):
+    connections = max(args.concurrency) + args.hold
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        token = await _login(client, args.email, args.password)
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        # Warm the principal cache and connection pool
+        await _run_level(client, args.paths, 4, 40)
+
+        stop = asyncio.Event()
+        holders = [asyncio.create_task(_hold_llm_calls(client, stop)) for _ in range(args.hold)]
+        if holders:
+            await asyncio.sleep(1)
+
+        print(f"{'in-flight':>9} {'requests':>8} {'errors':>6} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        for level in args.concurrency:
+            r = await _run_level(client, args.paths, level, args.requests)
+            print(
+                f"{r['concurrency']:>9} {r['requests']:>8} {r['errors']:>6} "
+                f"{r['rps']:>9.1f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f}"
+            )
+
+        stop.set()
+        for task in holders:
+            task.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--path", dest="paths", action="append", help="endpoint to hit (repeatable)")
+    parser.add_argument("--concurrency", default="10,40,100,200",
+                        help="comma-separated in-flight request levels")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per level")
+    parser.add_argument("--hold", type=int, default=0,
+                        help="background LLM-bound requests kept in flight during the run")
+    args = parser.parse_args()
+    args.paths = args.paths or DEFAULT_PATHS
+    args.concurrency = [int(c) for c in args.concurrency.split(",")]
+    asyncio.run(main(args))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""OpenAI-compatible chat completion stub that answers after a fixed delay.
+
+Point the backend at it to reproduce a slow provider without spending quota:
+
+    python benchmarks/slow_llm_stub.py --port 9100 --delay 5
+    GROQ_API_KEY=stub GROQ_BASE_URL=http://127.0.0.1:9100 uvicorn app.main:app
+"""
+
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(delay: float):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("content-length", 0))
+            self.rfile.read(length)
+            time.sleep(delay)
+            body = json.dumps({
+                "id": "stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "stub",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": "Tell me about a project you are proud of."},
+                }],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }).encode()
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--delay", type=float, default=5.0, help="seconds before each reply")
+    args = parser.parse_args()
+    ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.delay)).serve_forever()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""Script to compress existing large text values in place.
+
+The CompressedText columns read legacy plain-text rows as they are, so this
+is optional: it rewrites old rows in the compressed format, VACUUMs and prints
+the database size before and after.
+"""
+
+import sys
+import os
+from sqlalchemy import text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+from app.utils.compression import MIN_COMPRESS_BYTES, compress_text
+
+BATCH_SIZE = 500
+
+# (table, column) pairs stored as CompressedText
+COMPRESSED_COLUMNS = [
+    ("resumes", "extracted_text"),
+    ("job_descriptions", "content"),
+    ("documents", "content"),
+    ("interview_messages", "content"),
+]
+
+def database_size(connection):
+    page_size = connection.execute(text("PRAGMA page_size")).scalar()
+    page_count = connection.execute(text("PRAGMA page_count")).scalar()
+    return page_size * page_count
+
+def compress_column(connection, table, column):
+    """Compress plain-text values of one column; returns how many rows changed."""
+    changed = 0
+    last_id = 0
+    while True:
+        rows = connection.execute(text(
+            f"SELECT id, {column} FROM {table} "
+            f"WHERE id > :last_id AND typeof({column}) = 'text' "
+            f"AND length(CAST({column} AS BLOB)) >= :min_bytes "
+            f"ORDER BY id LIMIT :limit"
+        ), {"last_id": last_id, "min_bytes": MIN_COMPRESS_BYTES, "limit": BATCH_SIZE}).all()
+        if not rows:
+            return changed
+
+        for row_id, value in rows:
+            packed = compress_text(value)
+            if isinstance(packed, bytes):
+                connection.execute(
+                    text(f"UPDATE {table} SET {column} = :value WHERE id = :id"),
+                    {"value": packed, "id": row_id}
+                )
+                changed += 1
+        connection.commit()
+        last_id = rows[-1].id
+
+def compress_text_columns():
+    try:
+        with engine.connect() as connection:
+            size_before = database_size(connection)
+            tables = {row[0] for row in connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table'")
+            )}
+            for table, column in COMPRESSED_COLUMNS:
+                if table not in tables:
+                    print(f"  - {table} does not exist, skipped")
+                    continue
+                changed = compress_column(connection, table, column)
+                print(f"✓ {table}.{column}: {changed} rows compressed")
+
+        # VACUUM cannot run inside a transaction
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM"))
+            size_after = database_size(connection)
+
+        saved = size_before - size_after
+        print(f"\nDatabase size before: {size_before:,} bytes")
+        print(f"Database size after:  {size_after:,} bytes")
+        if size_before:
+            print(f"✓ Reclaimed {saved:,} bytes ({saved / size_before:.1%})")
+        return True
+    except Exception as e:
+        print(f"✗ Error compressing text columns: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Compressing Text Columns")
+    print("=" * 60)
+
+    success = compress_text_columns()
+
+    if success:
+        print("\n✓ Compression complete!")
+    else:
+        print("\n✗ Compression failed!")
+
+    print("=" * 60)
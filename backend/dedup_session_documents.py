@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Script to move interview session texts into the deduplicated documents table.
+
+Each interview_sessions row used to carry its own copy of the job description
+and resume. This hashes those texts into content-addressed documents rows,
+points the sessions at them, drops the inline columns and VACUUMs, printing
+the database size before and after.
+"""
+
+import sys
+import os
+from sqlalchemy import inspect, text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import Base, engine
+from app.models.document import get_or_create_document
+
+BATCH_SIZE = 500
+INLINE_COLUMNS = ("job_description", "resume_text")
+
+def database_size(connection):
+    """Bytes in use by the database, excluding free pages."""
+    page_size = connection.execute(text("PRAGMA page_size")).scalar()
+    page_count = connection.execute(text("PRAGMA page_count")).scalar()
+    freelist = connection.execute(text("PRAGMA freelist_count")).scalar()
+    return page_size * (page_count - freelist), page_size * page_count
+
+def dedup_session_documents():
+    """Backfill jd/resume document ids, drop the inline text columns and VACUUM."""
+
+    inspector = inspect(engine)
+
+    # Check if table exists
+    if 'interview_sessions' not in inspector.get_table_names():
+        print("✗ Table 'interview_sessions' does not exist")
+        return False
+
+    # Get existing columns
+    columns = [col['name'] for col in inspector.get_columns('interview_sessions')]
+    print(f"Existing columns: {columns}")
+
+    if not any(c in columns for c in INLINE_COLUMNS):
+        print("✓ Sessions already reference documents, nothing to migrate")
+        return True
+
+    # Creates the documents table if it is missing
+    Base.metadata.create_all(bind=engine)
+
+    try:
+        with engine.connect() as connection:
+            used_before, file_before = database_size(connection)
+
+            for column in ("jd_document_id", "resume_document_id"):
+                if column not in columns:
+                    print(f"\nAdding '{column}' column to interview_sessions...")
+                    connection.execute(text(
+                        f"ALTER TABLE interview_sessions ADD COLUMN {column} "
+                        f"INTEGER REFERENCES documents(id)"
+                    ))
+            connection.commit()
+
+            done = 0
+            distinct = set()
+            while True:
+                rows = connection.execute(text(
+                    "SELECT id, job_description, resume_text FROM interview_sessions "
+                    "WHERE jd_document_id IS NULL ORDER BY id LIMIT :limit"
+                ), {"limit": BATCH_SIZE}).all()
+                if not rows:
+                    break
+
+                for session_id, job_description, resume_text in rows:
+                    jd_id = get_or_create_document(connection, job_description or "")
+                    resume_id = get_or_create_document(connection, resume_text or None)
+                    distinct.update(d for d in (jd_id, resume_id) if d is not None)
+                    connection.execute(text(
+                        "UPDATE interview_sessions "
+                        "SET jd_document_id = :jd, resume_document_id = :resume WHERE id = :id"
+                    ), {"jd": jd_id, "resume": resume_id, "id": session_id})
+                connection.commit()
+
+                done += len(rows)
+                print(f"  ... {done} sessions linked")
+
+            print(f"✓ {done} sessions now share {len(distinct)} distinct documents")
+
+            for column in INLINE_COLUMNS:
+                connection.execute(text(f"ALTER TABLE interview_sessions DROP COLUMN {column}"))
+            for column in ("jd_document_id", "resume_document_id"):
+                connection.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_interview_sessions_{column} "
+                    f"ON interview_sessions ({column})"
+                ))
+            connection.commit()
+            print("✓ Dropped inline text columns")
+
+        # VACUUM cannot run inside a transaction
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM"))
+            used_after, file_after = database_size(connection)
+
+        saved = file_before - file_after
+        print(f"\nDatabase size before: {file_before:,} bytes ({used_before:,} in use)")
+        print(f"Database size after:  {file_after:,} bytes ({used_after:,} in use)")
+        if file_before:
+            print(f"✓ Reclaimed {saved:,} bytes ({saved / file_before:.1%})")
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating interview_sessions: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Deduplicating Interview Session Documents")
+    print("=" * 60)
+
+    success = dedup_session_documents()
+
+    if success:
+        # Verify
+        inspector = inspect(engine)
+        columns = [col['name'] for col in inspector.get_columns('interview_sessions')]
+        print(f"\nUpdated columns: {columns}")
+        if 'jd_document_id' in columns and not any(c in columns for c in INLINE_COLUMNS):
+            print("\n✓ Migration successful! Sessions now reference shared documents.")
+        else:
+            print("\n✗ Migration failed! Columns not in the expected state.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""Script to switch an existing database to incremental auto-vacuum.
+
+auto_vacuum can only change on an empty file or through a full VACUUM, so this
+rebuilds the database once. Run it with the API stopped; afterwards the
+maintenance scheduler's incremental_vacuum job can return freed pages.
+"""
+
+import sys
+import os
+from sqlalchemy import text
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+
+def enable_incremental_vacuum():
+    try:
+        # VACUUM cannot run inside a transaction
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            mode = connection.execute(text("PRAGMA auto_vacuum")).scalar()
+            if mode == 2:
+                print("✓ auto_vacuum is already INCREMENTAL")
+                return True
+            connection.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+            print("Rebuilding database with VACUUM...")
+            connection.execute(text("VACUUM"))
+            mode = connection.execute(text("PRAGMA auto_vacuum")).scalar()
+        return mode == 2
+    except Exception as e:
+        print(f"✗ Error enabling incremental vacuum: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Enabling Incremental Auto-Vacuum")
+    print("=" * 60)
+
+    if enable_incremental_vacuum():
+        print("\n✓ Migration successful! Freed pages can now be reclaimed incrementally.")
+    else:
+        print("\n✗ Migration failed!")
+
+    print("=" * 60)
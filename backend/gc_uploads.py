@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""Script to reconcile uploads/ against the resumes table.
+
+Orphaned files are moved to uploads/.quarantine and deleted after
+SKILLIO_UPLOAD_QUARANTINE_DAYS. The maintenance scheduler runs the same pass
+daily inside its window; this runs it once.
+
+    python gc_uploads.py              # quarantine and delete
+    python gc_uploads.py --dry-run    # report only
+"""
+
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import SessionLocal
+from app.utils.upload_gc import UPLOAD_DIR, collect_upload_garbage
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Collecting Orphaned Uploads")
+    print("=" * 60)
+
+    dry_run = "--dry-run" in sys.argv
+    print(f"Upload directory: {UPLOAD_DIR}{' (dry run)' if dry_run else ''}")
+
+    db = SessionLocal()
+    try:
+        report = collect_upload_garbage(db, dry_run=dry_run)
+    except Exception as e:
+        print(f"\n✗ Upload GC failed: {e}")
+    else:
+        print(f"\n✓ Scanned {report['scanned']} files")
+        print(f"✓ Quarantined {report['quarantined']} orphans, restored {report['restored']}")
+        print(f"✓ Deleted {report['deleted']} files, reclaimed {report['reclaimed_bytes']:,} bytes")
+        if report["missing_files"]:
+            print(f"! {report['missing_files']} resume rows point at missing files")
+    finally:
+        db.close()
+
+    print("=" * 60)
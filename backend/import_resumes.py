@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""Script to import a folder or zip archive of resumes for one user.
+
+    python import_resumes.py user@example.com cohort.zip
+    python import_resumes.py user@example.com ./resumes/
+
+Same pipeline as POST /resume/bulk-import: files are parsed in a process
+pool (SKILLIO_IMPORT_WORKERS), duplicates of the user's existing resumes are
+skipped and rows are inserted in batches.
+"""
+
+import sys
+import os
+import time
+from collections import Counter
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+def run_import(email, source):
+    # Imported here rather than at the top: the pool's spawned workers
+    # re-import this module, and they do not need the database
+    from app.database import SessionLocal
+    from app.models.user import User
+    from app.utils.resume_import import import_resumes, shutdown_pool
+
+    db = SessionLocal()
+    counts = Counter()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        if user is None:
+            print(f"✗ No user with email {email}")
+            return None
+        started = time.perf_counter()
+        for result in import_resumes(db, user.id, source):
+            counts[result["status"]] += 1
+            if result["status"] == "imported":
+                print(f"✓ {result['file']} (id {result['id']}, {result['text_length']} chars)")
+            elif result["status"] == "duplicate":
+                print(f"- {result['file']}: duplicate")
+            else:
+                print(f"✗ {result['file']}: {result['error']}")
+        elapsed = time.perf_counter() - started
+        print(f"\nProcessed {sum(counts.values())} files in {elapsed:.1f}s")
+        return counts
+    except Exception as e:
+        print(f"✗ Import failed: {e}")
+        return None
+    finally:
+        db.close()
+        shutdown_pool()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Importing Resumes")
+    print("=" * 60)
+
+    if len(sys.argv) != 3 or not os.path.exists(sys.argv[2]):
+        print("Usage: python import_resumes.py <user-email> <zip-or-directory>")
+        sys.exit(1)
+
+    counts = run_import(sys.argv[1], sys.argv[2])
+
+    if counts is None:
+        print("\n✗ Import failed!")
+    else:
+        print(f"\n✓ Imported {counts['imported']}, "
+              f"{counts['duplicate']} duplicates, "
+              f"{counts['skipped'] + counts['failed']} skipped or failed")
+
+    print("=" * 60)
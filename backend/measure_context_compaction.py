@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""Script to measure prompt-token savings of the budgeted follow-up context.
+
+Replays recorded sessions turn by turn and, for every answered question,
+counts the tokens of the follow-up prompt built the old way (full JD and
+resume, no summary) and the budgeted way (rolling summary, everything fitted
+to SKILLIO_CONTEXT_TOKEN_BUDGET). System prompts are included in both.
+
+    python measure_context_compaction.py               # latest 200 sessions
+    python measure_context_compaction.py 1000 --turns  # also print every turn
+"""
+
+import sys
+import os
+import statistics
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.models.chat_history import InterviewMessage, InterviewSession
+from app.utils.archiver import read_archived_transcript
+from app.utils.ai.conversation_context import CONTEXT_TOKEN_BUDGET, _TIKTOKEN_AVAILABLE, count_tokens, update_summary
+from app.utils.ai.hr_interview_engine import HR_SYSTEM_PROMPT, _hr_followup_prompt
+from app.utils.ai.interview_engine import SYSTEM_PROMPT, _followup_prompt
+
+UNLIMITED = 10 ** 9
+
+
+def session_messages(db, session: InterviewSession) -> list:
+    """``(role, content)`` in order, read from the archive without rehydrating."""
+    if session.archived_at is not None:
+        record = read_archived_transcript(session.archive_segment, session.archive_offset)
+        return [(m["role"], m["content"]) for m in sorted(record["messages"], key=lambda m: m["seq"])]
+    return db.execute(
+        select(InterviewMessage.role, InterviewMessage.content)
+        .where(InterviewMessage.session_id == session.id)
+        .order_by(InterviewMessage.seq)
+    ).all()
+
+
+def replay(db, session: InterviewSession) -> list:
+    """``(baseline_tokens, budgeted_tokens)`` for each answered question."""
+    hr = (session.mode or "").lower() == "hr"
+    build, system = (_hr_followup_prompt, HR_SYSTEM_PROMPT) if hr else (_followup_prompt, SYSTEM_PROMPT)
+    # Programming follow-ups are sent without the resume
+    resume_text = session.resume_text if hr else ""
+    jd_text = session.job_description
+    system_tokens = count_tokens(system)
+
+    turns = []
+    summary = ""
+    question = None
+    for role, content in session_messages(db, session):
+        if role == "ai":
+            question = content
+            continue
+        if question is None:
+            continue
+        baseline = build(question, content, resume_text, jd_text, session.difficulty, "", UNLIMITED)
+        budgeted = build(question, content, resume_text, jd_text, session.difficulty, summary)
+        turns.append((system_tokens + count_tokens(baseline), system_tokens + count_tokens(budgeted)))
+        summary = update_summary(summary, question, content)
+        question = None
+    return turns
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Measuring Follow-up Prompt Compaction")
+    print("=" * 60)
+
+    args = sys.argv[1:]
+    show_turns = "--turns" in args
+    args = [arg for arg in args if arg != "--turns"]
+    limit = int(args[0]) if args else 200
+    print(f"Budget: {CONTEXT_TOKEN_BUDGET} tokens, counted with {'tiktoken' if _TIKTOKEN_AVAILABLE else 'the local estimate'}")
+
+    db = SessionLocal()
+    try:
+        sessions = db.scalars(
+            select(InterviewSession).order_by(InterviewSession.id.desc()).limit(limit)
+        ).all()
+        baseline_total = budgeted_total = 0
+        reductions = []
+        for session in sessions:
+            try:
+                turns = replay(db, session)
+            except Exception as e:
+                print(f"! Skipped session {session.id}: {e}")
+                continue
+            for turn, (baseline, budgeted) in enumerate(turns, start=1):
+                baseline_total += baseline
+                budgeted_total += budgeted
+                reductions.append(1 - budgeted / baseline)
+                if show_turns:
+                    print(f"  session {session.id:6d} turn {turn:3d}: {baseline:6d} -> {budgeted:6d} tokens "
+                          f"({1 - budgeted / baseline:+.1%} saved)")
+    except Exception as e:
+        print(f"\n✗ Measurement failed: {e}")
+        reductions = None
+    finally:
+        db.close()
+
+    if reductions:
+        print(f"\n✓ {len(reductions)} turns in {len(sessions)} sessions")
+        print(f"✓ Prompt tokens: {baseline_total:,} -> {budgeted_total:,} "
+              f"({1 - budgeted_total / baseline_total:.1%} fewer)")
+        print(f"✓ Per-turn reduction: median {statistics.median(reductions):.1%}, "
+              f"max {max(reductions):.1%}, min {min(reductions):.1%}")
+    elif reductions is not None:
+        print("\n! No answered questions to replay")
+
+    print("=" * 60)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""Script to measure how often a deployment-wide near-duplicate cache would hit.
+
+Replays stored traffic in order and counts, for each request, whether an
+earlier one had the same inputs (exact hit) or near-identical ones at each
+similarity threshold (near hit), as one cache shared by all users and
+never evicted would see it:
+
+- interview starts: mode, level, JD and resume of every session
+- JDs: every saved job description
+
+    python measure_near_dup.py                        # thresholds 0.7 0.8 0.9 0.95
+    python measure_near_dup.py 0.85 0.9 --limit 5000  # the latest 5000 of each
+"""
+
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.database import SessionLocal
+from app.models.chat_history import InterviewSession
+from app.models.document import Document, content_hash
+from app.models.job_description import JobDescription
+from app.utils.near_dup import NearDuplicateCache, signature
+
+DEFAULT_THRESHOLDS = [0.7, 0.8, 0.9, 0.95]
+
+
+def session_requests(db, limit=None):
+    jd_doc = aliased(Document)
+    resume_doc = aliased(Document)
+    query = (
+        select(InterviewSession.mode, InterviewSession.difficulty, jd_doc.content, resume_doc.content)
+        .join(jd_doc, jd_doc.id == InterviewSession.jd_document_id)
+        .outerjoin(resume_doc, resume_doc.id == InterviewSession.resume_document_id)
+        .order_by(InterviewSession.created_at.desc(), InterviewSession.id.desc())
+        .limit(limit)
+    )
+    rows = db.execute(query).all()
+    for mode, difficulty, jd, resume in reversed(rows):
+        yield f"{(mode or '').lower()}:{difficulty}", {"jd": jd, "resume": resume or ""}
+
+
+def jd_requests(db, limit=None):
+    query = (
+        select(JobDescription.content)
+        .order_by(JobDescription.uploaded_at.desc(), JobDescription.id.desc())
+        .limit(limit)
+    )
+    for content in reversed(db.scalars(query).all()):
+        yield "jd", {"jd": content}
+
+
+def measure(requests, thresholds):
+    """Exact and per-threshold near hit counts over ``requests`` in order."""
+    seen = set()
+    caches = {t: NearDuplicateCache(threshold=t, maxsize=10**9, ttl=float("inf")) for t in thresholds}
+    near_hits = dict.fromkeys(thresholds, 0)
+    total = exact = 0
+
+    for namespace, fields in requests:
+        total += 1
+        exact_key = (namespace, *(content_hash(fields[name]) for name in sorted(fields)))
+        if exact_key in seen:
+            exact += 1
+        seen.add(exact_key)
+
+        sig = signature(fields)
+        for threshold, cache in caches.items():
+            if cache.find(namespace, fields, sig) is not None:
+                near_hits[threshold] += 1
+            else:
+                cache.add(namespace, fields, True, sig)
+
+    return total, exact, near_hits
+
+
+def report(label, total, exact, near_hits):
+    print(f"\n{label}: {total} requests")
+    if not total:
+        return
+    print(f"  exact match     {exact:6d}  {exact / total:6.1%}")
+    for threshold, hits in near_hits.items():
+        print(f"  near >= {threshold:<6}  {hits:6d}  {hits / total:6.1%}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Measuring Near-Duplicate Cache Hit Rate")
+    print("=" * 60)
+
+    args = sys.argv[1:]
+    limit = None
+    if "--limit" in args:
+        i = args.index("--limit")
+        limit = int(args[i + 1])
+        del args[i:i + 2]
+    thresholds = [float(arg) for arg in args] or DEFAULT_THRESHOLDS
+
+    db = SessionLocal()
+    try:
+        report("Interview starts", *measure(session_requests(db, limit), thresholds))
+        report("Job descriptions", *measure(jd_requests(db, limit), thresholds))
+    except Exception as e:
+        print(f"\n✗ Measurement failed: {e}")
+    finally:
+        db.close()
+
+    print("=" * 60)
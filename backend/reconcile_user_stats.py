@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Script to rebuild or repair the per-user dashboard counters.
+
+Run once after deploying the user_stats table to seed it from existing data.
+The maintenance scheduler repairs drift nightly (the reconcile_user_stats
+job); run this by hand to repair at once, e.g. after editing the DB.
+"""
+
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import Base, engine, SessionLocal
+from app.utils.stats_reconciler import reconcile_user_stats
+
+def run_reconciliation(user_ids=None):
+    """Recount every user's counters and fix the rows that drifted."""
+
+    # Creates the user_stats table if it is missing
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        repaired = reconcile_user_stats(db, user_ids)
+        db.commit()
+        return repaired
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error reconciling user stats: {e}")
+        return None
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Reconciling User Stats")
+    print("=" * 60)
+
+    user_ids = [int(arg) for arg in sys.argv[1:]] or None
+    repaired = run_reconciliation(user_ids)
+
+    if repaired is None:
+        print("\n✗ Reconciliation failed!")
+    else:
+        print(f"\n✓ Reconciliation complete: {repaired} user(s) repaired.")
+
+    print("=" * 60)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Script to train a zstd dictionary from stored resumes and job descriptions.
+
+Resumes and JDs share a lot of boilerplate ("Responsibilities", "Requirements",
+section headings, common skills), which a dictionary lets zstd exploit even on
+single short documents. Usage:
+
+    python train_compression_dict.py skillio.zdict
+    SKILLIO_ZSTD_DICT=skillio.zdict uvicorn app.main:app
+
+Keep every dictionary that has been deployed: rows written with it cannot be
+read without it.
+"""
+
+import sys
+import os
+from sqlalchemy import select
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import SessionLocal
+from app.models.document import Document
+from app.models.job_description import JobDescription
+from app.models.resume import Resume
+from app.utils.compression import _ZSTD_AVAILABLE
+
+DICT_SIZE = 64 * 1024
+MAX_SAMPLES = 5000
+
+def collect_samples():
+    db = SessionLocal()
+    try:
+        samples = []
+        for column in (Resume.extracted_text, JobDescription.content, Document.content):
+            for value in db.scalars(select(column).limit(MAX_SAMPLES)):
+                samples.append(value.encode("utf-8"))
+        return samples
+    finally:
+        db.close()
+
+def train_dictionary(path):
+    if not _ZSTD_AVAILABLE:
+        print("✗ zstandard is not installed (pip install zstandard)")
+        return False
+
+    import zstandard
+
+    samples = collect_samples()
+    print(f"Collected {len(samples)} samples")
+    if len(samples) < 10:
+        print("✗ Not enough documents to train a useful dictionary")
+        return False
+
+    try:
+        dictionary = zstandard.train_dictionary(DICT_SIZE, samples)
+    except zstandard.ZstdError as e:
+        print(f"✗ Error training dictionary: {e}")
+        return False
+
+    with open(path, "wb") as f:
+        f.write(dictionary.as_bytes())
+    print(f"✓ Wrote {len(dictionary.as_bytes()):,} byte dictionary to {path}")
+    return True
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Training zstd Compression Dictionary")
+    print("=" * 60)
+
+    output = sys.argv[1] if len(sys.argv) > 1 else "skillio.zdict"
+    if train_dictionary(output):
+        print(f"\n✓ Set SKILLIO_ZSTD_DICT={output} to use it for new writes.")
+    else:
+        print("\n✗ Training failed!")
+
+    print("=" * 60)
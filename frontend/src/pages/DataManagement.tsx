@@ -7,7 +7,7 @@ import { Upload, FileText, Briefcase, Trash2, Eye, X } from "lucide-react";
 interface Resume {
   id: number;
   filename: string;
-  content: string;
+  content?: string;
   uploaded_at: string;
 }
 
@@ -15,7 +15,7 @@ interface JobDescription {
   id: number;
   title: string;
   filename: string;
-  content: string;
+  content?: string;
   uploaded_at: string;
 }
 
@@ -25,6 +25,11 @@ export function DataManagement() {
   const [jobDescriptions, setJobDescriptions] = useState<JobDescription[]>([]);
   const [loadingResumes, setLoadingResumes] = useState(false);
   const [loadingJDs, setLoadingJDs] = useState(false);
+  const [resumeCursor, setResumeCursor] = useState<string | null>(null);
+  const [jdCursor, setJdCursor] = useState<string | null>(null);
+  const [selectedResumeIds, setSelectedResumeIds] = useState<number[]>([]);
+  const [selectedJdIds, setSelectedJdIds] = useState<number[]>([]);
+  const [deletingSelected, setDeletingSelected] = useState(false);
   const [selectedItem, setSelectedItem] = useState<Resume | JobDescription | null>(null);
   const [showDetail, setShowDetail] = useState(false);
   const [uploadingResume, setUploadingResume] = useState(false);
@@ -44,11 +49,13 @@ export function DataManagement() {
     loadJobDescriptions();
   }, []);
 
-  const loadResumes = async () => {
+  // Without a cursor the list is reloaded from the first page
+  const loadResumes = async (cursor?: string) => {
     setLoadingResumes(true);
     try {
-      const response = await uploadsApi.getResumeHistory();
-      setResumes(response.data.resumes);
+      const response = await uploadsApi.getResumeHistory(cursor);
+      setResumes((prev) => (cursor ? [...prev, ...response.data.resumes] : response.data.resumes));
+      setResumeCursor(response.data.next_cursor ?? null);
       setError("");
     } catch (err) {
       console.error("Error loading resumes:", err);
@@ -58,11 +65,14 @@ export function DataManagement() {
     }
   };
 
-  const loadJobDescriptions = async () => {
+  const loadJobDescriptions = async (cursor?: string) => {
     setLoadingJDs(true);
     try {
-      const response = await uploadsApi.getJobDescriptionHistory();
-      setJobDescriptions(response.data.job_descriptions);
+      const response = await uploadsApi.getJobDescriptionHistory(cursor);
+      setJobDescriptions((prev) =>
+        cursor ? [...prev, ...response.data.job_descriptions] : response.data.job_descriptions
+      );
+      setJdCursor(response.data.next_cursor ?? null);
       setError("");
     } catch (err) {
       console.error("Error loading job descriptions:", err);
@@ -181,6 +191,43 @@ export function DataManagement() {
     }
   };
 
+  const toggleSelected = (ids: number[], id: number) =>
+    ids.includes(id) ? ids.filter((selected) => selected !== id) : [...ids, id];
+
+  // One request for every checked item; the loaded pages are kept
+  const handleDeleteSelected = async () => {
+    const isResume = activeTab === "resume";
+    const ids = isResume ? selectedResumeIds : selectedJdIds;
+    const label = isResume ? "resume" : "job description";
+    if (ids.length === 0) return;
+    if (!confirm(`Are you sure you want to delete ${ids.length} ${label}${ids.length > 1 ? "s" : ""}?`)) return;
+
+    setDeletingSelected(true);
+    try {
+      if (isResume) {
+        const response = await uploadsApi.deleteResumes(ids);
+        const deleted: number[] = response.data.ids;
+        setResumes((prev) => prev.filter((resume) => !deleted.includes(resume.id)));
+        setSelectedResumeIds([]);
+      } else {
+        const response = await uploadsApi.deleteJobDescriptions(ids);
+        const deleted: number[] = response.data.ids;
+        setJobDescriptions((prev) => prev.filter((jd) => !deleted.includes(jd.id)));
+        setSelectedJdIds([]);
+      }
+      setSuccess(`Deleted ${ids.length} ${label}${ids.length > 1 ? "s" : ""}`);
+      setError("");
+      setTimeout(() => setSuccess(""), 3000);
+    } catch (err: any) {
+      console.error(`Error deleting ${label}s:`, err);
+      const errorMsg = err?.response?.data?.detail || err?.message || `Failed to delete ${label}s`;
+      setError(errorMsg);
+      setTimeout(() => setError(""), 3000);
+    } finally {
+      setDeletingSelected(false);
+    }
+  };
+
   const handleCopyToClipboard = (text: string) => {
     navigator.clipboard.writeText(text);
     setSuccess("Copied to clipboard!");
@@ -192,8 +239,29 @@ export function DataManagement() {
     return date.toLocaleDateString() + " " + date.toLocaleTimeString([], { hour: "2-digit", minute: "2-digit" });
   };
 
-  const truncateText = (text: string, maxLength: number) => {
-    return text.length > maxLength ? text.substring(0, maxLength) + "..." : text;
+  // List endpoints omit document text, so fetch it when an item is opened
+  const openResume = async (resume: Resume) => {
+    try {
+      const response = await uploadsApi.getResume(resume.id);
+      setSelectedItem(response.data);
+      setShowDetail(true);
+    } catch (err) {
+      console.error("Error loading resume:", err);
+      setError("Failed to load resume");
+      setTimeout(() => setError(""), 3000);
+    }
+  };
+
+  const openJobDescription = async (jd: JobDescription) => {
+    try {
+      const response = await uploadsApi.getJobDescription(jd.id);
+      setSelectedItem(response.data);
+      setShowDetail(true);
+    } catch (err) {
+      console.error("Error loading job description:", err);
+      setError("Failed to load job description");
+      setTimeout(() => setError(""), 3000);
+    }
   };
 
   return (
@@ -373,13 +441,27 @@ export function DataManagement() {
               className="lg:col-span-2"
             >
               <div className="bg-gradient-to-br from-slate-700 to-slate-800 rounded-2xl p-6 border border-slate-600">
-                <h2 className="text-xl font-bold text-white mb-4">
-                  {activeTab === "resume" ? `Recent Resumes (${resumes.length})` : `Saved Job Descriptions (${jobDescriptions.length})`}
-                </h2>
+                <div className="flex justify-between items-center mb-4">
+                  <h2 className="text-xl font-bold text-white">
+                    {activeTab === "resume" ? `Recent Resumes (${resumes.length})` : `Saved Job Descriptions (${jobDescriptions.length})`}
+                  </h2>
+                  {(activeTab === "resume" ? selectedResumeIds : selectedJdIds).length > 0 && (
+                    <button
+                      onClick={handleDeleteSelected}
+                      disabled={deletingSelected}
+                      className="px-3 py-1 text-sm bg-red-600 hover:bg-red-500 text-white rounded transition flex items-center gap-1 disabled:opacity-50"
+                    >
+                      <Trash2 size={14} />
+                      {deletingSelected
+                        ? "Deleting..."
+                        : `Delete selected (${(activeTab === "resume" ? selectedResumeIds : selectedJdIds).length})`}
+                    </button>
+                  )}
+                </div>
 
                 {activeTab === "resume" ? (
                   <div className="space-y-3">
-                    {loadingResumes ? (
+                    {loadingResumes && resumes.length === 0 ? (
                       <p className="text-slate-400 text-center py-8">Loading resumes...</p>
                     ) : resumes.length === 0 ? (
                       <p className="text-slate-400 text-center py-8">No resumes uploaded yet</p>
@@ -392,27 +474,28 @@ export function DataManagement() {
                         >
                           <div
                             className="flex justify-between items-start cursor-pointer"
-                            onClick={() => {
-                              setSelectedItem(resume);
-                              setShowDetail(true);
-                            }}
+                            onClick={() => openResume(resume)}
                           >
+                            <input
+                              type="checkbox"
+                              checked={selectedResumeIds.includes(resume.id)}
+                              onClick={(e) => e.stopPropagation()}
+                              onChange={() => setSelectedResumeIds((ids) => toggleSelected(ids, resume.id))}
+                              className="mt-1 mr-3"
+                              aria-label={`Select ${resume.filename}`}
+                            />
                             <div className="flex-1">
                               <div className="flex items-center gap-2 mb-1">
                                 <FileText size={18} className="text-blue-400" />
                                 <p className="font-semibold text-white truncate">{resume.filename}</p>
                               </div>
                               <p className="text-sm text-slate-400">{formatDate(resume.uploaded_at)}</p>
-                              <p className="text-sm text-slate-500 mt-1 line-clamp-2">{truncateText(resume.content, 150)}</p>
                             </div>
                             <Eye size={18} className="text-slate-400 flex-shrink-0" />
                           </div>
                           <div className="flex gap-2 mt-3 opacity-0 group-hover:opacity-100 transition">
                             <button
-                              onClick={() => {
-                                setSelectedItem(resume);
-                                setShowDetail(true);
-                              }}
+                              onClick={() => openResume(resume)}
                               className="flex-1 px-3 py-1 text-sm bg-blue-600 hover:bg-blue-500 text-white rounded transition"
                             >
                               View
@@ -431,10 +514,19 @@ export function DataManagement() {
                         </motion.div>
                       ))
                     )}
+                    {resumeCursor && (
+                      <button
+                        onClick={() => loadResumes(resumeCursor)}
+                        disabled={loadingResumes}
+                        className="w-full px-4 py-2 bg-slate-600 hover:bg-slate-500 text-white rounded-lg transition disabled:opacity-50"
+                      >
+                        {loadingResumes ? "Loading..." : "Load more"}
+                      </button>
+                    )}
                   </div>
                 ) : (
                   <div className="space-y-3">
-                    {loadingJDs ? (
+                    {loadingJDs && jobDescriptions.length === 0 ? (
                       <p className="text-slate-400 text-center py-8">Loading job descriptions...</p>
                     ) : jobDescriptions.length === 0 ? (
                       <p className="text-slate-400 text-center py-8">No job descriptions saved yet</p>
@@ -447,27 +539,28 @@ export function DataManagement() {
                         >
                           <div
                             className="flex justify-between items-start cursor-pointer"
-                            onClick={() => {
-                              setSelectedItem(jd);
-                              setShowDetail(true);
-                            }}
+                            onClick={() => openJobDescription(jd)}
                           >
+                            <input
+                              type="checkbox"
+                              checked={selectedJdIds.includes(jd.id)}
+                              onClick={(e) => e.stopPropagation()}
+                              onChange={() => setSelectedJdIds((ids) => toggleSelected(ids, jd.id))}
+                              className="mt-1 mr-3"
+                              aria-label={`Select ${jd.title}`}
+                            />
                             <div className="flex-1">
                               <div className="flex items-center gap-2 mb-1">
                                 <Briefcase size={18} className="text-amber-400" />
                                 <p className="font-semibold text-white truncate">{jd.title}</p>
                               </div>
                               <p className="text-sm text-slate-400">{formatDate(jd.uploaded_at)}</p>
-                              <p className="text-sm text-slate-500 mt-1 line-clamp-2">{truncateText(jd.content, 150)}</p>
                             </div>
                             <Eye size={18} className="text-slate-400 flex-shrink-0" />
                           </div>
                           <div className="flex gap-2 mt-3 opacity-0 group-hover:opacity-100 transition">
                             <button
-                              onClick={() => {
-                                setSelectedItem(jd);
-                                setShowDetail(true);
-                              }}
+                              onClick={() => openJobDescription(jd)}
                               className="flex-1 px-3 py-1 text-sm bg-blue-600 hover:bg-blue-500 text-white rounded transition"
                             >
                               View
@@ -486,6 +579,15 @@ export function DataManagement() {
                         </motion.div>
                       ))
                     )}
+                    {jdCursor && (
+                      <button
+                        onClick={() => loadJobDescriptions(jdCursor)}
+                        disabled={loadingJDs}
+                        className="w-full px-4 py-2 bg-slate-600 hover:bg-slate-500 text-white rounded-lg transition disabled:opacity-50"
+                      >
+                        {loadingJDs ? "Loading..." : "Load more"}
+                      </button>
+                    )}
                   </div>
                 )}
               </div>
@@ -530,7 +632,7 @@ export function DataManagement() {
 
             <div className="flex gap-2">
               <button
-                onClick={() => handleCopyToClipboard(selectedItem.content)}
+                onClick={() => handleCopyToClipboard(selectedItem.content ?? "")}
                 className="flex-1 px-4 py-2 bg-blue-600 hover:bg-blue-500 text-white rounded-lg transition"
               >
                 Copy to Clipboard
@@ -13,6 +13,7 @@ export default function ProgrammingInterview() {
   const [error, setError] = useState("");
   const [sessions, setSessions] = useState<Session[]>([]);
   const [loadingSessions, setLoadingSessions] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [selectedDifficulty, setSelectedDifficulty] = useState<Difficulty>("beginner");
   const [deletingId, setDeletingId] = useState<number | null>(null);
   const [confirmDeleteId, setConfirmDeleteId] = useState<number | null>(null);
@@ -21,13 +22,13 @@ export default function ProgrammingInterview() {
     loadSessions();
   }, []);
 
-  const loadSessions = async () => {
+  // Without a cursor the list is reloaded from the first page
+  const loadSessions = async (cursor?: string) => {
     try {
       setLoadingSessions(true);
-      const allSessions = await InterviewChatService.getSessions();
-      // Filter only programming sessions
-      const programmingSessions = allSessions.filter(s => s.mode === 'programming');
-      setSessions(programmingSessions);
+      const page = await InterviewChatService.getSessions('programming', cursor);
+      setSessions((prev) => (cursor ? [...prev, ...page.sessions] : page.sessions));
+      setNextCursor(page.nextCursor);
     } catch (err) {
       console.error('Failed to load sessions:', err);
     } finally {
@@ -305,6 +306,16 @@ export default function ProgrammingInterview() {
                 </motion.div>
               ))}
             </div>
+            {nextCursor && (
+              <button
+                onClick={() => loadSessions(nextCursor)}
+                disabled={loadingSessions}
+                className="mt-4 w-full px-4 py-2 rounded-lg text-sm font-medium border disabled:opacity-50"
+                style={{ borderColor: 'var(--border)', color: 'var(--text)' }}
+              >
+                {loadingSessions ? 'Loading...' : 'Load more'}
+              </button>
+            )}
           </motion.div>
         )}
 
@@ -64,6 +64,8 @@ export default function SkillAnalysis() {
   // Saved documents
   const [resumes, setResumes] = useState<Resume[]>([]);
   const [jobDescriptions, setJobDescriptions] = useState<JobDescription[]>([]);
+  const [resumeCursor, setResumeCursor] = useState<string | null>(null);
+  const [jdCursor, setJdCursor] = useState<string | null>(null);
   
   // Manual uploads
   const [jobDescription, setJobDescription] = useState('');
@@ -81,6 +83,7 @@ export default function SkillAnalysis() {
   const [error, setError] = useState('');
   const [resumeUploaded, setResumeUploaded] = useState(false);
   const [previousAnalyses, setPreviousAnalyses] = useState<PreviousAnalysis[]>([]);
+  const [analysesCursor, setAnalysesCursor] = useState<string | null>(null);
   const [selectedAnalysis, setSelectedAnalysis] = useState<PreviousAnalysis | null>(null);
   const [deletingId, setDeletingId] = useState<number | null>(null);
   const [confirmDeleteId, setConfirmDeleteId] = useState<number | null>(null);
@@ -98,9 +101,15 @@ export default function SkillAnalysis() {
     loadPreviousAnalyses();
   }, []);
 
-  const loadResumes = async () => {
+  // Lists come a page at a time; without a cursor they are reloaded from the first page
+  const loadResumes = async (cursor?: string) => {
     try {
-      const response = await api.get('/analysis/resumes');
+      const response = await api.get('/analysis/resumes', { params: { cursor } });
+      setResumeCursor(response.data.next_cursor ?? null);
+      if (cursor) {
+        setResumes((prev) => [...prev, ...response.data.resumes]);
+        return;
+      }
       setResumes(response.data.resumes);
       if (response.data.resumes.length > 0) {
         setSelectedResumeId(response.data.resumes[0].id);
@@ -110,9 +119,14 @@ export default function SkillAnalysis() {
     }
   };
 
-  const loadJobDescriptions = async () => {
+  const loadJobDescriptions = async (cursor?: string) => {
     try {
-      const response = await api.get('/analysis/job-descriptions');
+      const response = await api.get('/analysis/job-descriptions', { params: { cursor } });
+      setJdCursor(response.data.next_cursor ?? null);
+      if (cursor) {
+        setJobDescriptions((prev) => [...prev, ...response.data.job_descriptions]);
+        return;
+      }
       setJobDescriptions(response.data.job_descriptions);
       if (response.data.job_descriptions.length > 0) {
         setSelectedJdId(response.data.job_descriptions[0].id);
@@ -122,10 +136,11 @@ export default function SkillAnalysis() {
     }
   };
 
-  const loadPreviousAnalyses = async () => {
+  const loadPreviousAnalyses = async (cursor?: string) => {
     try {
-      const response = await api.get('/analysis/history');
-      setPreviousAnalyses(response.data);
+      const response = await api.get('/analysis/history', { params: { cursor } });
+      setPreviousAnalyses((prev) => (cursor ? [...prev, ...response.data] : response.data));
+      setAnalysesCursor(response.headers['x-next-cursor'] ?? null);
     } catch (err) {
       console.error('Failed to load previous analyses:', err);
     }
@@ -393,6 +408,15 @@ export default function SkillAnalysis() {
                 />
               </div>
             )}
+            {jdCursor && (
+              <button
+                onClick={() => loadJobDescriptions(jdCursor)}
+                className="mt-2 text-sm underline"
+                style={{ color: 'var(--primary)' }}
+              >
+                Load older job descriptions
+              </button>
+            )}
           </motion.div>
 
           {/* Resume Upload */}
@@ -496,6 +520,15 @@ export default function SkillAnalysis() {
                 />
               </div>
             )}
+            {resumeCursor && (
+              <button
+                onClick={() => loadResumes(resumeCursor)}
+                className="mt-2 text-sm underline"
+                style={{ color: 'var(--primary)' }}
+              >
+                Load older resumes
+              </button>
+            )}
           </motion.div>
         </div>
 
@@ -1003,6 +1036,15 @@ export default function SkillAnalysis() {
                 </motion.div>
               ))}
             </div>
+            {analysesCursor && (
+              <button
+                onClick={() => loadPreviousAnalyses(analysesCursor)}
+                className="mt-4 w-full px-4 py-2 rounded-lg text-sm font-medium border"
+                style={{ borderColor: 'var(--border)', color: 'var(--text)' }}
+              >
+                Load more
+              </button>
+            )}
           </motion.div>
         )}
 
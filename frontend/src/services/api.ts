@@ -55,12 +55,16 @@ export const uploadsApi = {
     });
   },
   
-  getResumeHistory: () => api.get("/resume/history"),
+  // Pass the previous page's next_cursor to fetch the page after it
+  getResumeHistory: (cursor?: string) =>
+    api.get("/resume/history", { params: { cursor } }),
   
   getResume: (resumeId: number) => api.get(`/resume/${resumeId}`),
   
   deleteResume: (resumeId: number) => api.delete(`/resume/${resumeId}`),
   
+  deleteResumes: (ids: number[]) => api.post("/resume/bulk-delete", { ids }),
+  
   // Job Description endpoints
   uploadJobDescription: (file: File, title: string) => {
     const formData = new FormData();
@@ -74,11 +78,14 @@ export const uploadsApi = {
   saveJobDescriptionText: (title: string, content: string) => 
     api.post("/resume/job-description/text", { title, content }),
   
-  getJobDescriptionHistory: () => api.get("/resume/job-description/history"),
+  getJobDescriptionHistory: (cursor?: string) =>
+    api.get("/resume/job-description/history", { params: { cursor } }),
   
   getJobDescription: (jdId: number) => api.get(`/resume/job-description/${jdId}`),
   
-  deleteJobDescription: (jdId: number) => api.delete(`/resume/job-description/${jdId}`)
+  deleteJobDescription: (jdId: number) => api.delete(`/resume/job-description/${jdId}`),
+  
+  deleteJobDescriptions: (ids: number[]) => api.post("/resume/job-description/bulk-delete", { ids })
 };
 
 // ATS Score Analysis
@@ -1,7 +1,53 @@
+import axios from 'axios';
 import { api } from './api';
 
+// Attempts for the POSTs that create messages. Every attempt of one submit
+// carries the same Idempotency-Key, so the server stores it at most once.
+const MAX_ATTEMPTS = 3;
+const RETRY_DELAY_MS = 1000;
+// A 409 means the first attempt is still generating on the server; keep
+// asking (as its Retry-After says) for about as long as an LLM call can take
+const IN_PROGRESS_WAIT_MS = 40000;
+
+const isRetryable = (error: unknown): boolean => {
+  if (!axios.isAxiosError(error)) return false;
+  // No response at all: the request may or may not have reached the server
+  if (!error.response) return true;
+  return [502, 503, 504].includes(error.response.status);
+};
+
+const inProgressDelay = (error: unknown): number | null => {
+  if (!axios.isAxiosError(error) || error.response?.status !== 409) return null;
+  const retryAfter = Number(error.response.headers['retry-after']);
+  return (Number.isFinite(retryAfter) && retryAfter > 0 ? retryAfter : 2) * 1000;
+};
+
+const postIdempotent = async (url: string, body: unknown) => {
+  const idempotencyKey = crypto.randomUUID();
+  const waitUntil = Date.now() + IN_PROGRESS_WAIT_MS;
+  for (let attempt = 1; ; ) {
+    try {
+      return await api.post(url, body, {
+        headers: { 'Idempotency-Key': idempotencyKey },
+      });
+    } catch (error) {
+      const delay = inProgressDelay(error);
+      if (delay !== null) {
+        // Waiting on the first attempt does not use up a retry
+        if (Date.now() + delay > waitUntil) throw error;
+        await new Promise((resolve) => setTimeout(resolve, delay));
+        continue;
+      }
+      if (attempt >= MAX_ATTEMPTS || !isRetryable(error)) throw error;
+      await new Promise((resolve) => setTimeout(resolve, RETRY_DELAY_MS * attempt));
+      attempt++;
+    }
+  }
+};
+
 export interface Message {
   id: number;
+  seq: number;
   role: 'user' | 'ai';
   content: string;
   created_at: string;
@@ -15,6 +61,12 @@ export interface Session {
   created_at: string;
   updated_at: string;
   message_count: number;
+  archived: boolean;
+}
+
+export interface SessionPage {
+  sessions: Session[];
+  nextCursor: string | null;
 }
 
 export interface SessionDetail {
@@ -22,8 +74,6 @@ export interface SessionDetail {
   mode: string;
   difficulty: string;
   title: string;
-  job_description: string;
-  resume_text: string;
   created_at: string;
   updated_at: string;
   messages: Message[];
@@ -54,7 +104,7 @@ export class InterviewChatService {
     difficulty: string = 'beginner'
   ) {
     try {
-      const response = await api.post('/interview/session/start', {
+      const response = await postIdempotent('/interview/session/start', {
         job_description: jobDescription,
         mode: mode,
         resume_text: resumeText,
@@ -69,12 +119,16 @@ export class InterviewChatService {
   }
 
   /**
-   * Get all sessions for current user
+   * Get a page of sessions for current user, optionally of one mode.
+   * Pass the returned nextCursor to get the page after it.
    */
-  static async getSessions(): Promise<Session[]> {
+  static async getSessions(mode?: string, cursor?: string): Promise<SessionPage> {
     try {
-      const response = await api.get('/interview/sessions');
-      return response.data;
+      const response = await api.get('/interview/sessions', { params: { mode, cursor } });
+      return {
+        sessions: response.data,
+        nextCursor: response.headers['x-next-cursor'] ?? null,
+      };
     } catch (error) {
       console.error('Failed to fetch sessions:', error);
       throw error;
@@ -102,7 +156,7 @@ export class InterviewChatService {
     message: string
   ): Promise<Message> {
     try {
-      const response = await api.post('/interview/message', {
+      const response = await postIdempotent('/interview/message', {
         session_id: sessionId,
         message: message,
       });